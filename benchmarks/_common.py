@@ -0,0 +1,208 @@
+"""
+Shared helpers for the benchmark scripts.
+
+- Source loading: the modules in src/ are stored wrapped in a markdown code
+  fence (some with notes after it), so they are not importable as they sit
+  on disk. `use_src()` copies the code block of each one into a cache
+  directory (rewritten only when the source changes, so .pyc caching still
+  applies) and puts that directory on sys.path.
+- Seeded workloads: prose / code corpora, entity populations, fact triples.
+- Measurement: latency percentiles, throughput and tracemalloc peak memory,
+  collected into one JSON report per benchmark:
+    {"benchmark", "seed", "scale", "git_rev", "python", "platform", "cpus", "started",
+     "cases": [{"case", "size", "unit", "latency_ms": {"n", "mean", "p50", "p90", "p99", "max"},
+                "throughput", "throughput_unit", "peak_mem_mb"}]}
+  Peak memory comes from a separate traced call, so tracing never skews latency.
+"""
+
+import argparse
+import contextlib
+import gc
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from statistics import mean, median
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+# ==========================================
+# 1. SOURCE LOADING
+# ==========================================
+
+def unfence(source: str) -> str:
+    """The code inside a leading ```python fence (the whole text if unfenced)."""
+    lines = source.splitlines(keepends=True)
+    if not lines or not lines[0].startswith("```"): return source
+    body = []
+    for line in lines[1:]:
+        if line.strip() == "```": break
+        body.append(line)
+    return "".join(body)
+
+def build_src(src: Path = SRC) -> Path:
+    """Importable copy of a src directory; returns its path."""
+    src = Path(src).resolve()
+    tag = hashlib.blake2b(str(src).encode(), digest_size=6).hexdigest()
+    out = Path(tempfile.gettempdir()) / f"syntropy-src-{tag}"
+    out.mkdir(exist_ok=True)
+    for path in src.glob("*.py"):
+        code = unfence(path.read_text(encoding="utf-8"))
+        target = out / path.name
+        if not target.exists() or target.read_text(encoding="utf-8") != code:
+            target.write_text(code, encoding="utf-8")
+    return out
+
+def use_src(src: Path = SRC) -> Path:
+    """Makes the (unwrapped) src modules importable in this process."""
+    out = str(build_src(src))
+    if out not in sys.path: sys.path.insert(0, out)
+    return Path(out)
+
+def subprocess_env(path: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(path)] + [p for p in [env.get("PYTHONPATH")] if p])
+    return env
+
+# ==========================================
+# 2. SEEDED WORKLOADS
+# ==========================================
+
+PROSE_WORDS = ("the of and to in is a that it for as with was on syntropy entropy order chaos crystal "
+               "layer growth energy flow system structure meaning river network signal wheel axle stone "
+               "rope wind memory lineage sector spectrum vector agent human intent value").split()
+CODE_TOKENS = ("def class return if else for in while import from self x y i n = == += -> ( ) [ ] { } : ; , "
+               "range(n) len(x) self.v append(x) None True False 0 1 2").split()
+
+def corpus(kind: str, n_bytes: int, seed: int = 0) -> str:
+    """Deterministic prose or code text of about n_bytes (ASCII)."""
+    rng = random.Random(f"{kind}:{seed}")
+    vocab = PROSE_WORDS if kind == "prose" else CODE_TOKENS
+    out, size = [], 0
+    while size < n_bytes:
+        if kind == "prose":
+            sentence = [rng.choice(vocab) for _ in range(rng.randint(6, 18))]
+            token = " ".join(sentence).capitalize() + rng.choice(".!?.")
+        else:
+            indent = "    " * rng.randint(0, 3)
+            token = indent + " ".join(rng.choice(vocab) for _ in range(rng.randint(3, 10))) + "\n"
+        out.append(token)
+        size += len(token) + 1
+    return " ".join(out)[:n_bytes]
+
+def entities(sve_core, n: int, seed: int = 0) -> List[Any]:
+    """n SyntropicEntity records spread over every entity type."""
+    rng = random.Random(f"entities:{seed}")
+    types = list(sve_core.EntityType)
+    population = []
+    for i in range(n):
+        population.append(sve_core.SyntropicEntity(
+            f"e{i}", rng.choice(types), f"content-{i}", rng.randint(0, 50), rng.randint(50, 5000),
+            rng.random(), rng.uniform(0, 10), rng.uniform(0, 10), rng.uniform(1, 1000),
+            rng.uniform(0.5, 2.0), rng.randint(0, 10), rng.uniform(0, 100), rng.random()))
+    return population
+
+def facts(n: int, seed: int = 0) -> List[tuple]:
+    """n (subject, predicate, object, agent) triples over a Zipf-ish subject set."""
+    rng = random.Random(f"facts:{seed}")
+    subjects = [f"{rng.choice(PROSE_WORDS).capitalize()}{k}" for k in range(max(10, n // 20))]
+    predicates = ["IS_A", "PART_OF", "CAUSES", "BOILS_AT", "DERIVED_FROM", "CONTAINS"]
+    return [(subjects[min(len(subjects) - 1, int(rng.paretovariate(1.2)) - 1)], rng.choice(predicates),
+             rng.choice(PROSE_WORDS), f"agent_{rng.randint(0, 99)}") for _ in range(n)]
+
+# ==========================================
+# 3. MEASUREMENT
+# ==========================================
+
+@contextlib.contextmanager
+def quiet():
+    """Silences the subsystems' console output inside timed regions."""
+    with contextlib.redirect_stdout(io.StringIO()): yield
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds (nearest-rank percentiles)."""
+    ordered = sorted(samples)
+    rank = lambda q: ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+    return {"n": len(ordered), "mean": mean(ordered) * 1e3, "p50": rank(0.50) * 1e3, "p90": rank(0.90) * 1e3,
+            "p99": rank(0.99) * 1e3, "max": ordered[-1] * 1e3}
+
+def timed(fn: Callable[[], Any], repeat: int, warmup: int = 0) -> List[float]:
+    """Wall-clock seconds of `repeat` calls, after `warmup` untimed ones (lazy imports, caches)."""
+    for _ in range(warmup): fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+def peak_memory(fn: Callable[[], Any]) -> float:
+    """Peak traced allocation (MB) of one call; run separately from the timed calls."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+def git_rev() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class Report:
+    """Collects benchmark cases and writes them as one JSON document."""
+    def __init__(self, name: str, seed: int, scale: str):
+        self.doc = {"benchmark": name, "seed": seed, "scale": scale, "git_rev": git_rev(),
+                    "python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count(), "started": time.strftime("%Y-%m-%dT%H:%M:%S"), "cases": []}
+
+    def case(self, name: str, size: int, unit: str, samples: List[float], work: float, work_unit: str,
+             peak_mb: Optional[float] = None, **extra) -> Dict[str, Any]:
+        """One measured case: work/work_unit is done per sample (throughput = work per second)."""
+        entry = {"case": name, "size": size, "unit": unit, "latency_ms": percentiles(samples),
+                 "throughput": work / median(samples) if median(samples) else None,
+                 "throughput_unit": f"{work_unit}/s", "peak_mem_mb": peak_mb, **extra}
+        self.doc["cases"].append(entry)
+        tput = f"{entry['throughput']:,.1f} {work_unit}/s" if entry["throughput"] else "-"
+        mem = f"{peak_mb:8.1f} MB" if peak_mb is not None else "       -"
+        print(f"  {name:<28} {size:>12,} {unit:<6} p50 {entry['latency_ms']['p50']:10.3f} ms  "
+              f"p99 {entry['latency_ms']['p99']:10.3f} ms  {tput:>22}  peak {mem}", file=sys.stderr)
+        return entry
+
+    def write(self, path: Optional[Path]):
+        text = json.dumps(self.doc, indent=2)
+        if path: Path(path).write_text(text)
+        else: print(text)
+
+def parser(description: str, scales: Dict[str, Any]) -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--scale", choices=sorted(scales), default="default",
+                   help="size preset: " + "; ".join(f"{k}={v}" for k, v in scales.items()))
+    p.add_argument("--sizes", type=lambda s: [int(float(x)) for x in s.split(",")],
+                   help="comma-separated sizes overriding the preset (e.g. 1e3,1e5)")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=None, help="timed repetitions per case")
+    p.add_argument("--src", type=Path, default=SRC, help="src directory to benchmark")
+    p.add_argument("--json", type=Path, help="write the JSON report here (default: stdout)")
+    p.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory pass")
+    return p
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Per-metric median / min / max over repeated runs."""
+    keys = [k for k, v in runs[0].items() if isinstance(v, (int, float)) and not isinstance(v, bool)]
+    return {k: {"median": median(r[k] for r in runs), "min": min(r[k] for r in runs),
+                "max": max(r[k] for r in runs)} for k in keys}
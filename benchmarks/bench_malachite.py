@@ -0,0 +1,178 @@
+"""
+Malachite benchmark: graph build (crystallize / create_void), lineage
+queries (trace_ray) and sector scans (scan_sector) on seeded graphs, bulk
+import (crystallize_many), the same build and scans on the compact
+columnar store, spectral interference on it (InterferenceEngine: single
+writes with lazy passes, one pass per crystallize_many batch), analogy
+search over it (AnalogyEngine index build,
+find_analogies via the LSH resonance index vs an exact scan), plus durable
+writes (WAL, group commit), restart (snapshot + WAL replay) and the
+sector-sharded crystal (ShardedCrystal: routed writes, rays traced one by
+one vs in batched rounds, fan-out sector scans) up to 100k nodes.
+
+The graph grows as a random forest over the genesis seeds: each new layer
+picks a parent among the existing nodes (biased to recent ones, so depth
+grows like a real lineage), with ~2% voids.
+
+    python benchmarks/bench_malachite.py [--scale smoke|default|full] [--json out.json]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import Report, parser, peak_memory, quiet, timed, use_src
+
+SCALES = {"smoke": [1_000, 10_000], "default": [1_000, 10_000, 100_000, 1_000_000],
+          "full": [1_000, 10_000, 100_000, 1_000_000, 10_000_000]}
+
+DURABLE_MAX = 100_000
+
+def grow(malachite_db, n: int, seed: int, latencies=None, **storage):
+    """Builds a storage with n crystallized nodes; optionally records per-write latency."""
+    rng = random.Random(f"malachite:{seed}")
+    random.seed(seed)   # crystallize() draws its angle shift from the global RNG
+    with quiet(): db = malachite_db.MalachiteStorage(**storage)
+    ids = list(db.nodes)
+    for i in range(n):
+        parent = ids[max(0, len(ids) - 1 - int(rng.expovariate(1 / 50)))] if rng.random() < 0.9 else rng.choice(ids)
+        t0 = time.perf_counter()
+        if rng.random() < 0.02: node_id = db.create_void(parent, f"lost layer {i}")
+        else: node_id = db.crystallize(f"layer {i}: {rng.random():.6f}", parent, rng.random() ** 2)
+        if latencies is not None: latencies.append(time.perf_counter() - t0)
+        ids.append(node_id)
+    return db, ids
+
+def history(n: int, seed: int) -> list:
+    """crystallize_many records with the same shape as grow(): in-batch parents by position."""
+    rng = random.Random(f"malachite-batch:{seed}")
+    records = []
+    for i in range(n):
+        if i == 0 or rng.random() < 0.05: parent = rng.choice(["SEED_LOG", "SEED_WATER", "SEED_ROPE"])
+        else: parent = max(0, i - 1 - int(rng.expovariate(1 / 50)))
+        records.append((f"layer {i}: {rng.random():.6f}", parent, rng.random() ** 2))
+    return records
+
+def reopen(malachite_db, path: str):
+    with quiet(): malachite_db.MalachiteStorage(path).close()
+
+def grow_sharded(malachite_db, n: int, seed: int, latencies: list):
+    """grow() through a ShardedCrystal (one process per sector); the caller closes it."""
+    rng = random.Random(f"malachite:{seed}")
+    with quiet(): db = malachite_db.ShardedCrystal()
+    ids = sorted(db._seeds)
+    for i in range(n):
+        parent = ids[max(0, len(ids) - 1 - int(rng.expovariate(1 / 50)))] if rng.random() < 0.9 else rng.choice(ids)
+        t0 = time.perf_counter()
+        if rng.random() < 0.02: node_id = db.create_void(parent, f"lost layer {i}")
+        else: node_id = db.crystallize(f"layer {i}: {rng.random():.6f}", parent, rng.random() ** 2)
+        latencies.append(time.perf_counter() - t0)
+        ids.append(node_id)
+    return db, ids
+
+def main():
+    args = parser(__doc__, SCALES).parse_args()
+    use_src(args.src)
+    import malachite_db
+    import sve_core
+
+    report = Report("malachite", args.seed, args.scale)
+    for n in args.sizes or SCALES[args.scale]:
+        writes = []
+        db, ids = grow(malachite_db, n, args.seed, writes)
+        report.case("crystallize", n, "nodes", writes, 1, "nodes",
+                    None if args.no_memory or n > 1_000_000 else peak_memory(lambda: grow(malachite_db, n, args.seed)))
+
+        rng = random.Random(args.seed)
+        k = args.repeat or 1_000
+        leaves = [rng.choice(ids) for _ in range(k)]
+        it = iter(leaves)
+        report.case("trace_ray", n, "nodes", timed(lambda: db.trace_ray(next(it)), k), 1, "queries")
+
+        sectors = list(malachite_db.SectorType)
+        k_scan = args.repeat or max(3, min(100, 1_000_000 // n))
+        it = iter(rng.choice(sectors) for _ in range(k_scan))
+        report.case("scan_sector", n, "nodes", timed(lambda: db.scan_sector(next(it)), k_scan), 1, "queries")
+        del db, ids
+
+        records = history(n, args.seed)
+        def bulk():
+            with quiet(): malachite_db.MalachiteStorage().crystallize_many(records)
+        report.case("crystallize_many", n, "nodes", timed(bulk, 1), n, "nodes")
+        del records
+
+        writes = []
+        db, ids = grow(malachite_db, n, args.seed, writes, compact=True)
+        report.case("crystallize_compact", n, "nodes", writes, 1, "nodes",
+                    None if args.no_memory or n > 1_000_000 else peak_memory(lambda: grow(malachite_db, n, args.seed, compact=True)))
+        it = iter(rng.choice(sectors) for _ in range(k_scan))
+        report.case("scan_sector_compact", n, "nodes", timed(lambda: db.scan_sector(next(it)), k_scan), 1, "queries")
+
+        if malachite_db.HAS_NUMPY:
+            interference = None
+            def attach():
+                nonlocal interference
+                interference = malachite_db.InterferenceEngine(db)
+            report.case("interference_attach", n, "nodes", timed(attach, 1), n, "nodes")
+            writes = []
+            with quiet():
+                for i in range(k):
+                    parent = rng.choice(ids)
+                    t0 = time.perf_counter()
+                    db.crystallize(f"echo {i}", parent, rng.random())
+                    writes.append(time.perf_counter() - t0)
+            report.case("crystallize_interference", n, "nodes", writes, 1, "nodes")
+            wave = [(f"wave {i}", rng.choice(ids), rng.random()) for i in range(max(1, min(10_000, n // 10)))]
+            def propagate():
+                with quiet(): db.crystallize_many(wave)
+                interference.flush()
+            report.case("interference_batch", n, "nodes", timed(propagate, 1), len(wave), "nodes")
+            db.unsubscribe(interference._on_write)
+            del interference
+
+        engine = None
+        def index():
+            nonlocal engine
+            engine = sve_core.AnalogyEngine(db)
+        report.case("analogy_index", n, "nodes", timed(index, 1), n, "nodes",
+                    postings_mb=engine.index_stats()["bytes"] / 2**20,
+                    vectors_mb=engine.vectors.vectors.nbytes / 2**20 if engine.vectors is not None else None)
+        queries = [db.nodes[rng.choice(ids)].content for _ in range(k_scan)]
+        it = iter(queries)
+        with quiet(): report.case("find_analogies", n, "nodes", timed(lambda: engine.find_analogies(next(it), "EARTH"), k_scan), 1, "queries")
+        if engine.vectors is not None:
+            it = iter(queries)
+            report.case("find_analogies_exact", n, "nodes",
+                        timed(lambda: engine.vectors.search(next(it), (), 5, "EARTH", exact=True), k_scan), 1, "queries")
+        del db, ids, engine
+
+        if n > DURABLE_MAX: continue
+        with tempfile.TemporaryDirectory(prefix="malachite-bench-") as path:
+            writes = []
+            db, _ = grow(malachite_db, n, args.seed, writes, path=path, fsync="group")
+            db.close()
+            report.case("crystallize_wal", n, "nodes", writes, 1, "nodes")
+            report.case("restore_wal", n, "nodes", timed(lambda: reopen(malachite_db, path), 1), n, "nodes")
+            with quiet(): malachite_db.MalachiteStorage(path).snapshot()
+            report.case("restore_snapshot", n, "nodes", timed(lambda: reopen(malachite_db, path), 1), n, "nodes")
+            del db
+
+        writes = []
+        db, ids = grow_sharded(malachite_db, n, args.seed, writes)
+        try:
+            report.case("sharded_crystallize", n, "nodes", writes, 1, "nodes")
+            leaves = [rng.choice(ids) for _ in range(k)]
+            it = iter(leaves)
+            report.case("sharded_trace_ray", n, "nodes", timed(lambda: db.trace_ray(next(it)), k), 1, "queries")
+            report.case("sharded_trace_rays", n, "nodes", timed(lambda: db.trace_rays(leaves), 1), k, "queries")
+            it = iter(rng.choice(sectors) for _ in range(k_scan))
+            report.case("sharded_scan_sector", n, "nodes", timed(lambda: db.scan_sector(next(it)), k_scan), 1, "queries")
+        finally:
+            db.close()
+    report.write(args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Scanner benchmark: Fast Path (analyze_stream, exact and chunked density)
+and Deep Path (analyze_fractal) over seeded prose and code corpora.
+
+    python benchmarks/bench_scanner.py [--scale smoke|default|full] [--sizes 1e3,1e6] [--json out.json]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import Report, corpus, parser, peak_memory, timed, use_src
+
+SCALES = {"smoke": [1_000, 100_000], "default": [1_000, 100_000, 1_000_000, 10_000_000],
+          "full": [1_000, 100_000, 1_000_000, 10_000_000, 100_000_000]}
+
+def repeats(n_bytes: int, override) -> int:
+    return override or (20 if n_bytes <= 100_000 else 5 if n_bytes <= 1_000_000 else 1)
+
+def main():
+    args = parser(__doc__, SCALES).parse_args()
+    use_src(args.src)
+    import sve_core
+
+    report = Report("scanner", args.seed, args.scale)
+    for kind in ("prose", "code"):
+        for n_bytes in args.sizes or SCALES[args.scale]:
+            text = corpus(kind, n_bytes, args.seed)
+            scanner = sve_core.SyntropyScannerV3()
+            chunked = sve_core.SyntropyScannerV3(exact_density=False)
+            fractal = sve_core.FractalAnalyzer(scanner)
+            mb = len(text.encode()) / 2**20
+            k = repeats(n_bytes, args.repeat)
+
+            fast = lambda: scanner.analyze_stream(text)
+            fast_chunked = lambda: chunked.analyze_stream(text)
+            deep = lambda: fractal.analyze_fractal(text)
+            for name, fn in ((f"{kind}/analyze_stream", fast), (f"{kind}/analyze_stream_chunked", fast_chunked),
+                             (f"{kind}/analyze_fractal", deep)):
+                samples = timed(fn, k, warmup=1 if n_bytes <= 1_000_000 else 0)
+                report.case(name, n_bytes, "bytes", samples, mb, "MB",
+                            None if args.no_memory else peak_memory(fn))
+    report.write(args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Cold-start benchmark for sve_core.
+
+Each run is a fresh interpreter that measures:
+- import_ms:          `import sve_core`
+- first_sve_ms:       first SyntropicValueEngine().evaluate()
+- dispatcher_ms:      SyntropicDispatcher() construction
+- first_diagnose_ms:  first diagnose() with a text stream (Fast Path + polyfit)
+- process_ms:         whole interpreter run, as seen by the parent
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 15] [--src path/to/src] [--json out.json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import SRC, build_src, subprocess_env, summarize
+
+PROBE = r'''
+import sys, time, json
+t0 = time.perf_counter()
+import sve_core as S
+t1 = time.perf_counter()
+numpy_on_import = "numpy" in sys.modules
+entity = S.SyntropicEntity("bench", S.EntityType.BIOSPHERE, "User", 5, 100, 0.5, 0, 0, 100, 1.0, 0, 0, 0.5)
+S.SyntropicValueEngine().evaluate(entity)
+t2 = time.perf_counter()
+core = S.SyntropicDispatcher()
+t3 = time.perf_counter()
+core.diagnose(entity, S.UserStats("CITIZEN", 0, 100.0),
+              text_stream="Syntropy is the opposite of Entropy. We build order. " * 40)
+t4 = time.perf_counter()
+print(json.dumps({"import_ms": (t1 - t0) * 1e3, "first_sve_ms": (t2 - t1) * 1e3,
+                  "dispatcher_ms": (t3 - t2) * 1e3, "first_diagnose_ms": (t4 - t3) * 1e3,
+                  "numpy_on_import": numpy_on_import}))
+'''
+
+def run_once(path: Path) -> dict:
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", PROBE], env=subprocess_env(path),
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - t0) * 1e3
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--src", type=Path, default=SRC)
+    parser.add_argument("--json", type=Path)
+    args = parser.parse_args()
+
+    path = build_src(args.src)
+    run_once(path)  # Warm-up: writes the .pyc files
+    runs = [run_once(path) for _ in range(args.runs)]
+    stats = summarize(runs)
+
+    print(f"sve_core cold start ({args.runs} runs, {args.src})", file=sys.stderr)
+    for name, s in stats.items():
+        print(f"  {name:<18} median {s['median']:8.2f} ms   min {s['min']:8.2f}   max {s['max']:8.2f}", file=sys.stderr)
+    print(f"  numpy loaded by import: {runs[-1]['numpy_on_import']}", file=sys.stderr)
+    text = json.dumps({"benchmark": "startup", "runs": runs, "stats": stats}, indent=2)
+    if args.json: args.json.write_text(text)
+    else: print(text)
+
+if __name__ == "__main__":
+    main()
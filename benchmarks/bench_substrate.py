@@ -0,0 +1,52 @@
+"""
+Substrate benchmark: bulk fact ingestion (store_fact), event logging
+(log_event) and subject search (search_facts) on GlobalSubstrate.
+
+Runs against an on-disk SQLite file in a temp directory by default
+(--memory for ":memory:").
+
+    python benchmarks/bench_substrate.py [--scale smoke|default|full] [--json out.json]
+"""
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import Report, facts, parser, peak_memory, quiet, timed, use_src
+
+SCALES = {"smoke": [1_000], "default": [1_000, 10_000, 100_000], "full": [1_000, 10_000, 100_000, 1_000_000]}
+
+def main():
+    p = parser(__doc__, SCALES)
+    p.add_argument("--memory", action="store_true", help="use an in-memory database")
+    args = p.parse_args()
+    use_src(args.src)
+    import substrate_db
+
+    report = Report("substrate", args.seed, args.scale)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes or SCALES[args.scale]:
+            path = ":memory:" if args.memory else str(Path(tmp) / f"substrate_{n}.db")
+            db = substrate_db.GlobalSubstrate(path)
+            triples = facts(n, args.seed)
+            it = iter(triples)
+            with quiet(): samples = timed(lambda: db.store_fact(*next(it)), n)
+            report.case("store_fact", n, "facts", samples, 1, "facts")
+
+            it = iter(range(n))
+            samples = timed(lambda: db.log_event("BENCH", f"event {next(it)}", "agent_0"), n)
+            report.case("log_event", n, "events", samples, 1, "events")
+
+            rng = random.Random(args.seed)
+            k = args.repeat or 200
+            subjects = iter(rng.choice(triples)[0] for _ in range(k))
+            search = lambda: db.search_facts(next(subjects))
+            report.case("search_facts", n, "facts", timed(search, k), 1, "queries",
+                        None if args.no_memory else peak_memory(lambda: db.search_facts(triples[0][0])))
+            db.conn.close()
+    report.write(args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Value Engine benchmark: scalar evaluate() and columnar evaluate_batch()
+over seeded entity populations.
+
+    python benchmarks/bench_sve.py [--scale smoke|default|full] [--json out.json]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from _common import Report, entities, parser, peak_memory, timed, use_src
+
+SCALES = {"smoke": [1_000, 10_000], "default": [1_000, 10_000, 100_000], "full": [1_000, 10_000, 100_000, 1_000_000]}
+
+def main():
+    args = parser(__doc__, SCALES).parse_args()
+    use_src(args.src)
+    import sve_core
+
+    report = Report("sve", args.seed, args.scale)
+    engine = sve_core.SyntropicValueEngine()
+    for n in args.sizes or SCALES[args.scale]:
+        population = entities(sve_core, n, args.seed)
+        k = args.repeat or max(1, min(20, 200_000 // n))
+
+        # Per-entity latency of the scalar path (sampled), then whole-population passes
+        sample = population[:min(n, 5_000)]
+        per_entity = timed(lambda it=iter(sample * k): engine.evaluate(next(it)), len(sample) * k)
+        report.case("evaluate/latency", n, "ents", per_entity, 1, "entities")
+
+        scalar = lambda: [engine.evaluate(e) for e in population]
+        report.case("evaluate/population", n, "ents", timed(scalar, k), n, "entities",
+                    None if args.no_memory else peak_memory(scalar))
+
+        build = lambda: sve_core.entity_table(population)
+        report.case("entity_table", n, "ents", timed(build, k, warmup=1), n, "entities",
+                    None if args.no_memory else peak_memory(build))
+
+        table = build()
+        batch = lambda: engine.evaluate_batch(table)
+        report.case("evaluate_batch/population", n, "ents", timed(batch, k, warmup=1), n, "entities",
+                    None if args.no_memory else peak_memory(batch))
+    report.write(args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Runs every benchmark at one scale and merges the JSON reports.
+
+    python benchmarks/run_all.py [--scale smoke|default|full] [--json results.json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+SUITE = ["bench_startup.py", "bench_scanner.py", "bench_sve.py", "bench_malachite.py", "bench_substrate.py"]
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--scale", default="default", choices=["smoke", "default", "full"])
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--json", type=Path, help="merged report (default: stdout)")
+    args = p.parse_args()
+
+    merged = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for script in SUITE:
+            out = Path(tmp) / f"{script}.json"
+            cmd = [sys.executable, str(HERE / script), "--json", str(out)]
+            if script != "bench_startup.py": cmd += ["--scale", args.scale, "--seed", str(args.seed)]
+            print(f"== {script}", file=sys.stderr)
+            subprocess.run(cmd, check=True)
+            merged[script[len("bench_"):-len(".py")]] = json.loads(out.read_text())
+
+    text = json.dumps(merged, indent=2)
+    if args.json: args.json.write_text(text)
+    else: print(text)
+
+if __name__ == "__main__":
+    main()
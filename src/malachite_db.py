@@ -13,11 +13,35 @@ Metaphor:
 """
 
 import math
+import mmap
+import os
+import random
+import threading
+import time
 import uuid
 import json
+import heapq
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
 from enum import Enum
+from itertools import islice
+from numbers import Real
+from operator import attrgetter, itemgetter
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from importlib.util import find_spec
+from typing import Callable, List, Dict, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+# NumPy is optional and imported on first use (InterferenceEngine only)
+HAS_NUMPY = find_spec("numpy") is not None
+
+class _LazyNumpy:
+    def __getattr__(self, name: str):
+        import numpy
+        globals()["np"] = numpy
+        return getattr(numpy, name)
+
+np = _LazyNumpy()
 
 # ==========================================
 # 1. CONFIGURATION & CONSTANTS
@@ -28,6 +52,12 @@ class SectorType(Enum):
     WATER = "WATER"   # Energy, Economy, Flow (120-240 deg)
     SKY = "SKY"       # Info, Ethics, Philosophy (240-360 deg)
 
+SECTOR_ARCS = {
+    SectorType.EARTH: (0, 120),
+    SectorType.WATER: (120, 240),
+    SectorType.SKY: (240, 360)
+}
+
 class NodeType(Enum):
     SEED = "SEED"           # Fundamental Axiom
     PETAL = "PETAL"         # Linear improvement
@@ -67,18 +97,1077 @@ class MalachiteNode:
     tags: List[str] = field(default_factory=list)
 
 # ==========================================
-# 2. THE STORAGE ENGINE
+# 2. SPATIAL INDEX (ANGLE x RADIUS)
 # ==========================================
 
-class MalachiteStorage:
+class SortedBlocks:
+    """
+    Rows sorted by a float key, stored as blocks of at most 2*LOAD entries
+    (parallel key / row arrays: 16 bytes per entry, no tuples).
+    Insert is a bisect over block maxima plus an insort into one block;
+    a range read bisects once and then slices blocks in order.
+    Equal keys keep insertion order.
+
+    Blocks are copy-on-write: an insert publishes a new (keys, rows) pair
+    and a split or rebuild publishes a new block list, so a range read in
+    another thread never sees a half-shifted block.
+    """
+    LOAD = 256
+
     def __init__(self):
-        self.nodes: Dict[str, MalachiteNode] = {}
-        self.sector_map = {
-            SectorType.EARTH: (0, 120),
-            SectorType.WATER: (120, 240),
-            SectorType.SKY: (240, 360)
-        }
-        self._genesis() # Plant the seeds
+        self._state: Tuple[List[Tuple[array, array]], List[float]] = ([], []) # (blocks, block maxima)
+        self._len = 0
+
+    def __len__(self) -> int: return self._len
+
+    def add(self, key: float, row: int):
+        blocks, maxes = self._state
+        self._len += 1
+        if not blocks:
+            self._state = ([(array("d", [key]), array("q", [row]))], [key])
+            return
+        i = min(bisect_right(maxes, key), len(blocks) - 1)
+        keys, rows = blocks[i]
+        j = bisect_right(keys, key)
+        keys = keys[:j] + array("d", [key]) + keys[j:]
+        rows = rows[:j] + array("q", [row]) + rows[j:]
+        if len(keys) > 2 * self.LOAD:
+            half = self.LOAD
+            self._state = (blocks[:i] + [(keys[:half], rows[:half]), (keys[half:], rows[half:])] + blocks[i + 1:],
+                           maxes[:i] + [keys[half - 1], keys[-1]] + maxes[i + 1:])
+        else:
+            blocks[i] = (keys, rows)
+            maxes[i] = keys[-1]
+
+    def rebuild(self, column: Sequence[float], rows: Iterable[int]):
+        """Bulk load: rows sorted by column[row] with one sort (ties in row order)."""
+        order = sorted(rows, key=column.__getitem__)
+        blocks = [(array("d", map(column.__getitem__, order[i:i + self.LOAD])), array("q", order[i:i + self.LOAD]))
+                  for i in range(0, len(order), self.LOAD)]
+        self._state = (blocks, [keys[-1] for keys, _ in blocks])
+        self._len = len(order)
+
+    def range(self, lo: float, hi: float) -> array:
+        """Rows with lo <= key < hi, in key order."""
+        blocks, maxes = self._state
+        out = array("q")
+        first, last = bisect_left(maxes, lo), bisect_left(maxes, hi)
+        for b in range(first, min(last, len(blocks) - 1) + 1):
+            keys, rows = blocks[b]
+            start = bisect_left(keys, lo) if b == first else 0
+            stop = bisect_left(keys, hi) if b == last else len(keys)
+            out.extend(rows[start:stop])
+        return out
+
+    def estimate(self, lo: float, hi: float) -> int:
+        """Upper bound on the rows in [lo, hi), to block granularity, in O(log N)."""
+        maxes = self._state[1]
+        return (bisect_left(maxes, hi) - bisect_left(maxes, lo) + 1) * 2 * self.LOAD
+
+class SpatialIndex:
+    """
+    Maintained (angle, radius) index of a crystal, over row numbers.
+    Two SortedBlocks orderings (by angle for arcs and sectors, by radius
+    for rings) plus the coordinate columns used to filter windows; a compact
+    store passes its own columns in instead of having them copied. An
+    annulus-sector window walks whichever side is smaller, so every query
+    is O(log N + k). Arcs are half-open [start, end) in degrees and wrap at 360.
+    """
+    def __init__(self, angle: Optional[array] = None, radius: Optional[array] = None):
+        self._shared = angle is not None
+        self.angle = angle if self._shared else array("d")
+        self.radius = radius if self._shared else array("d")
+        self.by_angle = SortedBlocks()
+        self.by_radius = SortedBlocks()
+
+    def __len__(self) -> int: return len(self.by_angle)
+
+    def add(self, row: int, angle: float, radius: float):
+        if not self._shared:
+            self.angle.append(angle)
+            self.radius.append(radius)
+        self.by_angle.add(angle, row)
+        self.by_radius.add(radius, row)
+
+    def extend(self, first_row: int, angles: List[float], radii: List[float], index: bool = True):
+        """Bulk add of rows first_row.. ; index=False only records coordinates (see reindex)."""
+        if not self._shared:
+            self.angle.extend(angles)
+            self.radius.extend(radii)
+        if not index: return
+        if len(angles) * 4 < len(self.by_angle):
+            for row, angle, radius in zip(range(first_row, first_row + len(angles)), angles, radii):
+                self.by_angle.add(angle, row)
+                self.by_radius.add(radius, row)
+        else:
+            self.reindex()
+
+    def reindex(self):
+        """Re-sorts both orderings from the coordinate columns."""
+        self.by_angle.rebuild(self.angle, range(len(self.angle)))
+        self.by_radius.rebuild(self.radius, range(len(self.radius)))
+
+    @staticmethod
+    def _arc_spans(start: float, end: float) -> List[Tuple[float, float]]:
+        """[start, end) as non-wrapping spans of [0, 360); end < start wraps (350 -> 10 = 350 -> 370)."""
+        if end < start: end += 360 * math.ceil((start - end) / 360)
+        if end - start >= 360: return [(0.0, 360.0)]
+        if end == start: return []
+        lo = start % 360
+        hi = lo + (end - start)
+        return [(lo, hi)] if hi <= 360 else [(lo, 360.0), (0.0, hi - 360)]
+
+    def arc(self, start: float, end: float) -> array:
+        out = array("q")
+        for lo, hi in self._arc_spans(start, end): out.extend(self.by_angle.range(lo, hi))
+        return out
+
+    def ring(self, r_min: float, r_max: float) -> array:
+        return self.by_radius.range(r_min, r_max)
+
+    def window(self, start: float, end: float, r_min: float, r_max: float) -> List[int]:
+        spans = self._arc_spans(start, end)
+        arc_size = sum(self.by_angle.estimate(lo, hi) for lo, hi in spans)
+        if arc_size <= self.by_radius.estimate(r_min, r_max):
+            radius = self.radius
+            return [row for lo, hi in spans for row in self.by_angle.range(lo, hi) if r_min <= radius[row] < r_max]
+        angle = self.angle
+        return [row for row in self.by_radius.range(r_min, r_max) if any(lo <= angle[row] < hi for lo, hi in spans)]
+
+# ==========================================
+# 3. LINEAGE INDEX (JUMP POINTERS + INTERVALS)
+# ==========================================
+
+class LineageIndex:
+    """
+    Ancestry of the crystal over row numbers (rows are write order, so a
+    parent's row is always below its children's), maintained as nodes are
+    crystallized. Everything lives in int64 arrays: 40 bytes per node.
+
+    - Jump pointers: each row keeps depth, parent and jump, where jump is a
+      skew-binary lift (the compact form of binary lifting: one pointer per
+      node, O(log depth) to reach any ancestor). Depth is O(1); k-th
+      ancestor and LCA are O(log depth).
+    - Interval labels: an Euler tour gives every labelled row a [tin, tout]
+      range, so an ancestor test between labelled rows is two comparisons.
+      New layers are always leaves, so labels never go wrong; rows added
+      since the last tour fall back to jump pointers until the next relabel
+      (amortized O(1): the tour reruns once the unlabelled tail reaches the
+      labelled size).
+    """
+    RELABEL_MIN = 1024
+
+    def __init__(self):
+        self._depth = array("q")
+        self._parent = array("q") # -1 for a Seed
+        self._jump = array("q")
+        self._tour = (array("q"), array("q")) # (tin, tout): rows below len(tin) are labelled; swapped as one
+
+    def __len__(self) -> int: return len(self._depth)
+
+    def add(self, parent: int) -> int:
+        """Registers the next row under parent (-1 for a Seed) and returns it."""
+        row = len(self._depth)
+        if parent < 0:
+            self._depth.append(0)
+            self._parent.append(-1)
+            self._jump.append(row) # A Seed jumps to itself
+            return row
+        depth, jump = self._depth[parent], self._jump[parent]
+        jump_depth, jump2 = self._depth[jump], self._jump[jump]
+        self._depth.append(depth + 1)
+        self._parent.append(parent)
+        self._jump.append(jump2 if depth - jump_depth == jump_depth - self._depth[jump2] else parent)
+        return row
+
+    def extend(self, parents: Iterable[int]):
+        """Bulk add: one row per parent (parents before children, in-batch ones too)."""
+        depth_of, parent_of, jump_of = self._depth, self._parent, self._jump
+        for parent in parents:
+            if parent < 0:
+                jump_of.append(len(depth_of))
+                depth_of.append(0)
+                parent_of.append(-1)
+                continue
+            depth, jump = depth_of[parent], jump_of[parent]
+            jump_depth, jump2 = depth_of[jump], jump_of[jump]
+            depth_of.append(depth + 1)
+            parent_of.append(parent)
+            jump_of.append(jump2 if depth - jump_depth == jump_depth - depth_of[jump2] else parent)
+
+    def depth(self, row: int) -> int:
+        return self._depth[row]
+
+    def parent(self, row: int) -> int:
+        return self._parent[row]
+
+    def _lift(self, row: int, target_depth: int) -> int:
+        depth, parent, jump = self._depth, self._parent, self._jump
+        while depth[row] > target_depth:
+            up = jump[row]
+            row = up if depth[up] >= target_depth else parent[row]
+        return row
+
+    def ancestor(self, row: int, k: int) -> int:
+        """k-th ancestor (k=0 is the row itself); -1 above the seed."""
+        depth = self._depth[row]
+        if k < 0 or k > depth: return -1
+        return self._lift(row, depth - k)
+
+    def is_ancestor(self, ancestor: int, row: int) -> bool:
+        """True if ancestor lies on row's ray (a row is its own ancestor)."""
+        if ancestor > row: return False # Ancestors are always written first
+        tin, tout = self._tour
+        if len(self._depth) - len(tin) > max(self.RELABEL_MIN, len(tin)):
+            self.relabel()
+            tin, tout = self._tour
+        if row < len(tin): return tin[ancestor] <= tin[row] <= tout[ancestor]
+        target = self._depth[ancestor]
+        return self._depth[row] >= target and self._lift(row, target) == ancestor
+
+    def common_ancestor(self, a: int, b: int) -> int:
+        """Lowest common ancestor; -1 if the rays grow from different seeds."""
+        depth = min(self._depth[a], self._depth[b])
+        a, b = self._lift(a, depth), self._lift(b, depth)
+        parent, jump = self._parent, self._jump
+        while a != b:
+            if parent[a] < 0: return -1
+            # Jumps depend only on depth, so both sides lift in step
+            a, b = (jump[a], jump[b]) if jump[a] != jump[b] else (parent[a], parent[b])
+        return a
+
+    def relabel(self):
+        """Euler tour over the whole forest in two linear passes (no DFS stack)."""
+        n, parent = len(self._parent), self._parent
+        size = array("q", [1]) * n
+        for row in range(n - 1, -1, -1):
+            if parent[row] >= 0: size[parent[row]] += size[row]
+        tin, cursor, clock = array("q", [0]) * n, array("q", [0]) * n, 0
+        for row in range(n):
+            p = parent[row]
+            if p < 0:
+                tin[row] = clock
+                clock += size[row]
+            else:
+                tin[row] = cursor[p]
+                cursor[p] += size[row]
+            cursor[row] = tin[row] + 1
+        for row in range(n): size[row] += tin[row] - 1 # Reused as tout
+        self._tour = (tin, size)
+
+
+class LineagePath(Sequence):
+    """
+    Lazy ray from the Seed (index 0) to a leaf (index -1).
+    Nothing is materialized up front: indexing lifts in O(log depth),
+    membership is an ancestor test, reversed() walks leaf -> seed.
+    """
+    def __init__(self, storage: 'MalachiteStorage', leaf_id: str):
+        self._storage = storage
+        self.leaf_id = leaf_id
+        self._leaf = storage.rows[leaf_id]
+        self._len = storage.lineage.depth(self._leaf) + 1
+
+    def __len__(self) -> int: return self._len
+
+    def __getitem__(self, i):
+        if isinstance(i, slice): return [self[j] for j in range(*i.indices(self._len))]
+        if i < 0: i += self._len
+        if not 0 <= i < self._len: raise IndexError("lineage index out of range")
+        return self._storage._at(self._storage.lineage.ancestor(self._leaf, self._len - 1 - i))
+
+    def __contains__(self, node) -> bool:
+        row = self._storage.rows.get(getattr(node, "id", node))
+        return row is not None and self._storage.lineage.is_ancestor(row, self._leaf)
+
+    def _rows(self) -> Iterator[int]:
+        parent, row = self._storage.lineage._parent, self._leaf
+        while row >= 0:
+            yield row
+            row = parent[row]
+
+    def __reversed__(self) -> Iterator[MalachiteNode]:
+        return map(self._storage._at, self._rows())
+
+    def __iter__(self) -> Iterator[MalachiteNode]:
+        return map(self._storage._at, reversed(list(self._rows())))
+
+    def __repr__(self) -> str:
+        return f"LineagePath({self.leaf_id!r}, depth={self._len - 1})"
+
+# ==========================================
+# 4. BRANCH INDEX (CHILDREN + SUBTREE AGGREGATES)
+# ==========================================
+
+@dataclass
+class BranchStats:
+    """Health of the branch rooted at one node (the node included)."""
+    root_id: str
+    descendants: int        # Layers grown from the root (root excluded)
+    max_radius: float       # Furthest evolution reached
+    voids: int              # Lost knowledge inside the branch
+    min_integrity: float    # The weakest link...
+    weakest_id: str         # ...and where it is
+
+class BranchIndex:
+    """
+    Downward view of the crystal over row numbers: child lists as linked
+    rows (first / last / next sibling) plus per-row subtree aggregates
+    (size, max radius, void count, min integrity and where it sits), all
+    in typed arrays.
+
+    A new layer only registers itself; its contribution to the ancestors is
+    queued and folded on the next read. The fold lifts all pending deltas
+    level by level, merging them where rays meet, so a batch of layers in
+    one branch walks the shared part of the ray once.
+    """
+    def __init__(self, lineage: LineageIndex):
+        self.lineage = lineage
+        self._first, self._last, self._next = array("q"), array("q"), array("q") # -1 = none
+        self._size, self._voids, self._weakest = array("q"), array("q"), array("q")
+        self._max_radius, self._min_integrity = array("d"), array("d")
+        self._pending = array("q")
+
+    def add(self, row: int, parent: int, node: MalachiteNode):
+        self._first.append(-1)
+        self._last.append(-1)
+        self._next.append(-1)
+        if parent >= 0:
+            if self._last[parent] < 0: self._first[parent] = row
+            else: self._next[self._last[parent]] = row
+            self._last[parent] = row
+            self._pending.append(row)
+        self._size.append(1)
+        self._voids.append(int(node.node_type == NodeType.VOID))
+        self._weakest.append(row)
+        self._max_radius.append(node.radius)
+        self._min_integrity.append(node.integrity)
+
+    def extend(self, first_row: int, parents: List[int], nodes: List[MalachiteNode]):
+        """Bulk add of rows first_row.. (one per node, parents given as rows)."""
+        n = len(nodes)
+        self._first.extend([-1] * n)
+        self._last.extend([-1] * n)
+        self._next.extend([-1] * n)
+        self._size.extend([1] * n)
+        self._voids.extend([int(node.node_type == NodeType.VOID) for node in nodes])
+        self._weakest.extend(range(first_row, first_row + n))
+        self._max_radius.extend([node.radius for node in nodes])
+        self._min_integrity.extend([node.integrity for node in nodes])
+        first, last, nxt, pending = self._first, self._last, self._next, self._pending
+        for row, parent in enumerate(parents, first_row):
+            if parent < 0: continue
+            if last[parent] < 0: first[parent] = row
+            else: nxt[last[parent]] = row
+            last[parent] = row
+            pending.append(row)
+
+    def children(self, row: int, limit: Optional[int] = None) -> Iterator[int]:
+        """Child rows in write order; rows >= limit (written after a pinned view) are left out."""
+        child, nxt = self._first[row], self._next
+        end = len(nxt) if limit is None else limit
+        while 0 <= child < end: # Children are linked in row order
+            yield child
+            child = nxt[child]
+
+    @staticmethod
+    def _merge(acc: list, delta: list):
+        acc[0] += delta[0]
+        acc[2] += delta[2]
+        if delta[1] > acc[1]: acc[1] = delta[1]
+        if delta[3] < acc[3]: acc[3], acc[4] = delta[3], delta[4]
+
+    def _apply(self, row: int, delta: list):
+        self._size[row] += delta[0]
+        self._voids[row] += delta[2]
+        if delta[1] > self._max_radius[row]: self._max_radius[row] = delta[1]
+        if delta[3] < self._min_integrity[row]:
+            self._min_integrity[row], self._weakest[row] = delta[3], delta[4]
+
+    def _fold(self):
+        if not self._pending: return
+        depth, parent = self.lineage._depth, self.lineage._parent
+        merge = self._merge
+        levels: Dict[int, Dict[int, list]] = {}
+        for row in self._pending:
+            # Still just the row itself: only folds touch a pending row
+            own = [1, self._max_radius[row], self._voids[row], self._min_integrity[row], row]
+            level = levels.setdefault(depth[row] - 1, {})
+            if parent[row] in level: merge(level[parent[row]], own)
+            else: level[parent[row]] = own
+        self._pending = array("q")
+        for d in range(max(levels), -1, -1):
+            for row, delta in levels.pop(d, {}).items():
+                self._apply(row, delta)
+                up_row = parent[row]
+                if up_row < 0: continue
+                up = levels.setdefault(d - 1, {})
+                if up_row in up: merge(up[up_row], delta)
+                else: up[up_row] = list(delta)
+
+    def stats(self, row: int) -> Tuple[int, float, int, float, int]:
+        """(descendants, max_radius, voids, min_integrity, weakest row) of row's branch."""
+        self._fold()
+        return (self._size[row] - 1, self._max_radius[row], self._voids[row],
+                self._min_integrity[row], self._weakest[row])
+
+    def descendants(self, root: int, max_depth: Optional[int] = None,
+                    breadth_first: bool = False, limit: Optional[int] = None) -> Iterator[int]:
+        """Streams descendant rows (root excluded), at most max_depth layers down, below limit."""
+        first, nxt, parent = self._first, self._next, self.lineage._parent
+        end = len(first) if limit is None else limit
+        if breadth_first:
+            frontier, depth = [root], 0
+            while frontier and (max_depth is None or depth < max_depth):
+                depth += 1
+                level = []
+                for row in frontier:
+                    for child in self.children(row, end):
+                        yield child
+                        level.append(child)
+                frontier = level
+            return
+        row, depth = first[root], 1
+        if not 0 <= row < end: return
+        while True:
+            yield row
+            if 0 <= first[row] < end and (max_depth is None or depth < max_depth):
+                row, depth = first[row], depth + 1
+                continue
+            while not 0 <= nxt[row] < end: # Climb until there is a sibling to visit
+                row, depth = parent[row], depth - 1
+                if row == root: return
+            row = nxt[row]
+
+# ==========================================
+# 5. COMPACT NODE STORE (COLUMNAR)
+# ==========================================
+
+NODE_TYPES = list(NodeType)
+NODE_TYPE_CODE = {t: i for i, t in enumerate(NODE_TYPES)}
+
+class MalachiteNodeView:
+    """
+    Read-only MalachiteNode over one row of a ColumnarNodes table.
+    Same attributes, built on access; as_node() materializes a real one.
+    """
+    __slots__ = ("_table", "row")
+
+    def __init__(self, table: 'ColumnarNodes', row: int):
+        self._table = table
+        self.row = row
+
+    @property
+    def id(self) -> str: return self._table.ids[self.row]
+    @property
+    def content(self) -> str: return self._table.content(self.row)
+    @property
+    def radius(self) -> float: return self._table.radius[self.row]
+    @property
+    def angle(self) -> float: return self._table.angle[self.row]
+    @property
+    def parent_id(self) -> Optional[str]:
+        parent = self._table.parent[self.row]
+        if parent < 0: return self._table.foreign.get(self.row) # A Seed, or a parent in another shard
+        return self._table.ids[parent]
+    @property
+    def node_type(self) -> NodeType: return NODE_TYPES[self._table.node_type[self.row]]
+    @property
+    def spectrum(self) -> SpectralSignature: return self._table.spectra[self._table.spectrum[self.row]]
+    @property
+    def integrity(self) -> float: return self._table.integrity[self.row]
+    @property
+    def tags(self) -> List[str]: return list(self._table.tag_sets[self._table.tags[self.row]])
+
+    def as_node(self) -> MalachiteNode:
+        return MalachiteNode(self.id, self.content, self.radius, self.angle, self.parent_id,
+                             self.node_type, self.spectrum, self.integrity, self.tags)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, MalachiteNodeView) and other._table is self._table and other.row == self.row
+
+    def __hash__(self) -> int: return hash((id(self._table), self.row))
+
+    def __repr__(self) -> str:
+        return (f"MalachiteNode(id={self.id!r}, content={self.content!r}, radius={self.radius!r}, "
+                f"angle={self.angle!r}, parent_id={self.parent_id!r}, node_type={self.node_type}, "
+                f"integrity={self.integrity!r})")
+
+class ColumnarNodes(Mapping):
+    """
+    Compact node table for multi-million-node crystals, used by
+    MalachiteStorage(compact=True) in place of the id -> MalachiteNode dict.
+
+    One row per node, in write order, across parallel typed arrays: radius,
+    angle, integrity (float64), parent row (int64, -1 for Seeds), node type
+    (1 byte), spectrum and tag set (uint32 indices into interned palettes)
+    and content offsets (uint64) into a single UTF-8 heap. Ids are kept once,
+    in the row -> id list that also keys the id -> row dict. Reads hand out
+    MalachiteNodeView objects. In a shard, a layer whose parent lives in
+    another shard gets parent row -1 and its parent id in `foreign`.
+
+    Bytes per node, whole storage with all indexes (CPython 3.11, 64-bit,
+    1M nodes, ~22-byte contents):
+      dict of MalachiteNode  ~650
+      ColumnarNodes          ~345 = 49 typed columns + content bytes
+                                  + ~140 id string / id -> row entry
+                                  + ~136 spatial, lineage and branch arrays
+                                    (the same in both modes)
+    """
+    def __init__(self):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.radius, self.angle, self.integrity = array("d"), array("d"), array("d")
+        self.parent = array("q")
+        self.node_type = bytearray()
+        self.spectrum, self.tags = array("I"), array("I")
+        self.spectra: List[SpectralSignature] = []
+        self.tag_sets: List[Tuple[str, ...]] = []
+        self._spectrum_code: Dict[tuple, int] = {}
+        self._tags_code: Dict[Tuple[str, ...], int] = {}
+        self._heap = bytearray()
+        self._offsets = array("Q", [0])
+        self.foreign: Dict[int, str] = {} # row -> parent id held by another shard
+
+    def __len__(self) -> int: return len(self.ids)
+    def __iter__(self) -> Iterator[str]: return iter(self.ids)
+    def __contains__(self, node_id) -> bool: return node_id in self.rows
+
+    def __getitem__(self, node_id: str) -> MalachiteNodeView:
+        return MalachiteNodeView(self, self.rows[node_id])
+
+    def get(self, node_id: str, default=None):
+        row = self.rows.get(node_id)
+        return default if row is None else MalachiteNodeView(self, row)
+
+    def view(self, row: int) -> MalachiteNodeView:
+        return MalachiteNodeView(self, row)
+
+    def content(self, row: int) -> str:
+        return self._heap[self._offsets[row]:self._offsets[row + 1]].decode("utf-8", "surrogatepass")
+
+    def extend(self, nodes: List[MalachiteNode]):
+        """Bulk append (parents before children); parent rows are resolved here."""
+        first = len(self.ids)
+        self.ids.extend([node.id for node in nodes])
+        self.rows.update(zip(self.ids[first:], range(first, first + len(nodes))))
+        get = self.rows.get
+        parents = [get(node.parent_id, -1) for node in nodes]
+        self.parent.extend(parents)
+        if -1 in parents:
+            self.foreign.update((first + i, node.parent_id) for i, (node, parent) in enumerate(zip(nodes, parents))
+                                if parent < 0 and node.parent_id is not None)
+        self.radius.extend([node.radius for node in nodes])
+        self.angle.extend([node.angle for node in nodes])
+        self.integrity.extend([node.integrity for node in nodes])
+        self.node_type.extend([NODE_TYPE_CODE[node.node_type] for node in nodes])
+        spectrum, tags = [], []
+        for node in nodes:
+            s = node.spectrum
+            code = self._spectrum_code.get((s.r, s.g, s.b))
+            if code is None:
+                code = self._spectrum_code[(s.r, s.g, s.b)] = len(self.spectra)
+                self.spectra.append(s)
+            spectrum.append(code)
+            key = tuple(node.tags)
+            code = self._tags_code.get(key)
+            if code is None:
+                code = self._tags_code[key] = len(self.tag_sets)
+                self.tag_sets.append(key)
+            tags.append(code)
+        self.spectrum.extend(spectrum)
+        self.tags.extend(tags)
+        offsets, end = self._offsets, len(self._heap)
+        for node in nodes:
+            encoded = node.content.encode("utf-8", "surrogatepass")
+            self._heap += encoded
+            end += len(encoded)
+            offsets.append(end)
+
+    def append(self, node: MalachiteNode, parent: int) -> int:
+        """Stores a node as the next row (parent is the parent's row, -1 for a Seed or a foreign parent)."""
+        row = len(self.ids)
+        if parent < 0 and node.parent_id is not None: self.foreign[row] = node.parent_id
+        self.ids.append(node.id)
+        self.rows[node.id] = row
+        self.radius.append(node.radius)
+        self.angle.append(node.angle)
+        self.integrity.append(node.integrity)
+        self.parent.append(parent)
+        self.node_type.append(NODE_TYPE_CODE[node.node_type])
+        s = node.spectrum
+        code = self._spectrum_code.get((s.r, s.g, s.b))
+        if code is None:
+            code = self._spectrum_code[(s.r, s.g, s.b)] = len(self.spectra)
+            self.spectra.append(s)
+        self.spectrum.append(code)
+        tags = tuple(node.tags)
+        code = self._tags_code.get(tags)
+        if code is None:
+            code = self._tags_code[tags] = len(self.tag_sets)
+            self.tag_sets.append(tags)
+        self.tags.append(code)
+        self._heap += node.content.encode("utf-8", "surrogatepass")
+        self._offsets.append(len(self._heap))
+        return row
+
+# ==========================================
+# 6. DURABILITY (WRITE-AHEAD LOG + SNAPSHOTS)
+# ==========================================
+
+FSYNC_POLICIES = ("always", "group", "off")
+
+def _node_record(node: MalachiteNode) -> list:
+    s = node.spectrum
+    return [node.id, node.content, node.radius, node.angle, node.parent_id, node.node_type.value,
+            s.r, s.g, s.b, node.integrity, node.tags]
+
+def _node_from_record(record: list, spectra: Dict[tuple, SpectralSignature]) -> MalachiteNode:
+    node_id, content, radius, angle, parent_id, n_type, r, g, b, integrity, tags = record
+    spectrum = spectra.get((r, g, b))
+    if spectrum is None: spectrum = spectra[(r, g, b)] = SpectralSignature(r, g, b) # Shared, as in crystallize
+    return MalachiteNode(node_id, content, radius, angle, parent_id, NodeType(n_type), spectrum, integrity, tags)
+
+class CrystalJournal:
+    """
+    Durable home of a crystal: <path>/crystal.snap + <path>/crystal.wal.
+
+    - WAL: append-only, one line per write: "<crc32> [seq, op, node]"
+      (op "batch" carries a list of nodes written all-or-nothing).
+      Records hold the finished node (coordinates included), so replay is
+      deterministic. A torn tail fails its CRC and is cut off on load.
+    - Group commit: writes are buffered and hit the file together once
+      group_size records pile up or the oldest of them is group_interval
+      seconds old (a timer thread flushes a buffer no write comes to
+      push out; group_interval=0 turns it off). fsync policy:
+      "always" (durable on return), "group" (one fsync per group),
+      "off" (the OS decides).
+    - Snapshot: every node in write order, written to a temp file, fsynced
+      and renamed over the old one; then the WAL restarts empty. A crash in
+      between is harmless: replay skips seq <= the snapshot's seq.
+    """
+    SNAPSHOT_MAGIC = "MALACHITE-SNAPSHOT/1"
+
+    def __init__(self, path: str, fsync: str = "group", group_size: int = 256, group_interval: float = 0.05):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got {fsync!r}")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.snap_path = os.path.join(path, "crystal.snap")
+        self.wal_path = os.path.join(path, "crystal.wal")
+        self.fsync = fsync
+        self.group_size = 1 if fsync == "always" else max(1, group_size)
+        self.group_interval = group_interval
+        self.seq = 0            # Last sequence number written
+        self.since_snapshot = 0 # WAL records a snapshot would fold away
+        self._buffer: List[bytes] = []
+        self._buffered_at = 0.0
+        self._wal = None
+        self._lock = threading.RLock() # Writer vs the flush timer
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def has_snapshot(self) -> bool:
+        return os.path.exists(self.snap_path)
+
+    # --- Recovery ---
+
+    def load(self, chunk_size: int = 4096) -> Iterator[List[MalachiteNode]]:
+        """
+        Snapshot nodes then the WAL tail, in write order and in chunks (so a
+        huge crystal never exists twice in memory). Opens the WAL for appends
+        once exhausted.
+        """
+        spectra: Dict[tuple, SpectralSignature] = {}
+        lines = self._snapshot_lines()
+        header = next(lines, None)
+        snap_seq = 0
+        if header is not None:
+            magic, snap_seq = json.loads(header)
+            if magic != self.SNAPSHOT_MAGIC: raise ValueError(f"{self.snap_path} is not a Malachite snapshot")
+        while True: # One json call per chunk, not per line
+            chunk = list(islice(lines, chunk_size))
+            if not chunk: break
+            yield [_node_from_record(record, spectra) for record in json.loads(b"[" + b",".join(chunk) + b"]")]
+        self.seq, good, tail = snap_seq, 0, []
+        if os.path.exists(self.wal_path):
+            with open(self.wal_path, "rb") as fh:
+                for raw in fh:
+                    record = self._decode(raw)
+                    if record is None: break # Torn or corrupt tail: everything after it is lost
+                    good += len(raw)
+                    seq, op, node = record
+                    if seq <= snap_seq: continue
+                    batch = node if op == "batch" else [node]
+                    tail.extend(_node_from_record(record, spectra) for record in batch)
+                    self.seq = seq
+                    self.since_snapshot += len(batch)
+                    if len(tail) == chunk_size:
+                        yield tail
+                        tail = []
+        if tail: yield tail
+        self._wal = open(self.wal_path, "ab")
+        if self._wal.tell() != good: self._wal.truncate(good)
+
+    def _snapshot_lines(self) -> Iterator[bytes]:
+        if not self.has_snapshot or os.path.getsize(self.snap_path) == 0: return
+        with open(self.snap_path, "rb") as fh:
+            try: mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError): # No mmap on this platform / file: plain buffered reads
+                yield from fh
+                return
+            with mm: yield from iter(mm.readline, b"")
+
+    @staticmethod
+    def _decode(raw: bytes) -> Optional[list]:
+        if not raw.endswith(b"\n"): return None
+        crc, _, payload = raw[:-1].partition(b" ")
+        try:
+            if int(crc, 16) != zlib.crc32(payload): return None
+            return json.loads(payload)
+        except ValueError:
+            return None
+
+    # --- Writes ---
+
+    def append(self, node: MalachiteNode):
+        with self._lock:
+            self.seq += 1
+            op = "void" if node.node_type == NodeType.VOID else "crystallize"
+            payload = json.dumps([self.seq, op, _node_record(node)], separators=(",", ":")).encode()
+            if not self._buffer: self._buffered_at = time.monotonic()
+            self._buffer.append(b"%08x %s\n" % (zlib.crc32(payload), payload))
+            self.since_snapshot += 1
+            if len(self._buffer) >= self.group_size or time.monotonic() - self._buffered_at >= self.group_interval:
+                self.commit()
+            elif self._timer is None and self.group_interval > 0:
+                self._timer = threading.Timer(self.group_interval, self._flush_due)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_due(self):
+        """Timer thread: the buffer got old with no write to push it out."""
+        with self._lock:
+            self._timer = None
+            if self._wal is not None: self.commit()
+
+    def append_batch(self, nodes: List[MalachiteNode]):
+        """
+        A crystallize_many batch as ONE record, committed at once: the CRC
+        covers the whole batch, so a crash replays all of it or none.
+        """
+        with self._lock:
+            self.seq += 1
+            payload = json.dumps([self.seq, "batch", [_node_record(node) for node in nodes]], separators=(",", ":")).encode()
+            self._buffer.append(b"%08x %s\n" % (zlib.crc32(payload), payload))
+            self.since_snapshot += len(nodes)
+            self.commit()
+
+    def commit(self):
+        """Group commit: one write (and one fsync, per policy) for everything buffered."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffer: return
+            self._wal.write(b"".join(self._buffer))
+            self._wal.flush()
+            if self.fsync != "off": os.fsync(self._wal.fileno())
+            self._buffer.clear()
+
+    def snapshot(self, nodes: Iterable[MalachiteNode]):
+        with self._lock: self._snapshot(nodes)
+
+    def _snapshot(self, nodes: Iterable[MalachiteNode]):
+        self.commit()
+        tmp = self.snap_path + ".tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(json.dumps([self.SNAPSHOT_MAGIC, self.seq]).encode() + b"\n")
+            for node in nodes: fh.write(json.dumps(_node_record(node), separators=(",", ":")).encode() + b"\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.snap_path)
+        self._fsync_dir()
+        self._wal.truncate(0) # Everything in it is now inside the snapshot
+        if self.fsync != "off": os.fsync(self._wal.fileno())
+        self.since_snapshot = 0
+
+    def _fsync_dir(self):
+        """Makes the rename itself durable (POSIX only)."""
+        if not hasattr(os, "O_DIRECTORY"): return
+        fd = os.open(self.path, os.O_RDONLY | os.O_DIRECTORY)
+        try: os.fsync(fd)
+        finally: os.close(fd)
+
+    def close(self):
+        with self._lock:
+            if self._wal is None: return
+            self.commit()
+            self._wal.close()
+            self._wal = None
+
+# ==========================================
+# 7. INTERFERENCE (SPECTRAL DIFFUSION)
+# ==========================================
+
+class InterferenceEngine:
+    """
+    The color of a new layer diffuses into its temporal layer: every older
+    node whose radius is within `width` of it mixes toward the new color
+    by `strength` (SpectralSignature.mix, done on arrays).
+
+    Spectra live in one (N, 3) float array, row = storage row. Each write
+    (a single layer or a whole crystallize_many batch, via subscribe) is
+    one pending pass; the writes of a pass act together: a node covered
+    by m of them keeps (1 - strength)**m of its color and takes the rest
+    as their mean color. Passes apply in write order and only to rows
+    older than them, so results never depend on when they are forced.
+
+    Recoloring is lazy: pending passes mark their radius bands dirty,
+    reads (spectrum, ring) force only their own rows, and flush() applies
+    each pass to its band alone (it runs by itself once max_pending
+    passes wait).
+    Needs NumPy.
+    """
+    def __init__(self, db: "MalachiteStorage", strength: float = 0.05, width: float = 0.5,
+                 max_pending: int = 64, color_of: Optional[Callable[[MalachiteNode], SpectralSignature]] = None):
+        if not HAS_NUMPY: raise ImportError("InterferenceEngine needs NumPy")
+        self.db, self.strength, self.width, self.max_pending = db, strength, width, max_pending
+        self.color_of = color_of or (lambda node: node.spectrum) # Color a new layer radiates
+        self.spectra = np.zeros((0, 3))
+        self.radius = np.zeros(0)
+        self._applied = np.zeros(0, dtype=np.int64) # Passes applied to each row
+        self._len = 0
+        self._base = 0 # Passes before _base are applied everywhere
+        self._passes: List[tuple] = [] # (band lo, band hi, sorted radii, color prefix sums) per pending pass
+        self._append(list(db.nodes.values()))
+        db.subscribe(self._on_write)
+
+    def __len__(self) -> int: return self._len
+
+    def _append(self, nodes: List[MalachiteNode]):
+        first, n = self._len, len(nodes)
+        if first + n > len(self.radius):
+            capacity = max(first + n, 2 * len(self.radius), 1024)
+            for name in ("spectra", "radius", "_applied"):
+                old = getattr(self, name)
+                grown = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:first] = old[:first]
+                setattr(self, name, grown)
+        self.spectra[first:first + n] = [(node.spectrum.r, node.spectrum.g, node.spectrum.b) for node in nodes]
+        self.radius[first:first + n] = [node.radius for node in nodes]
+        self._applied[first:first + n] = self._base + len(self._passes) # Born after every pending pass
+        self._len += n
+
+    def _on_write(self, nodes: List[MalachiteNode]):
+        """One propagation pass per write batch."""
+        if not nodes: return
+        self._append(nodes)
+        order = sorted(range(len(nodes)), key=lambda i: nodes[i].radius)
+        radii = np.array([nodes[i].radius for i in order])
+        colors = np.array([(c.r, c.g, c.b) for c in (self.color_of(nodes[i]) for i in order)])
+        prefix = np.vstack([np.zeros((1, 3)), np.cumsum(colors, axis=0)])
+        self._passes.append((radii[0] - self.width, radii[-1] + self.width, radii, prefix))
+        self._applied[self._len - len(nodes):self._len] += 1 # The batch does not tint itself
+        if len(self._passes) >= self.max_pending: self.flush()
+
+    @property
+    def dirty(self) -> List[Tuple[float, float]]:
+        """Radius bands [lo, hi) that pending passes may still recolor (merged)."""
+        bands = []
+        for lo, hi in sorted((p[0], p[1]) for p in self._passes):
+            if bands and lo <= bands[-1][1]: bands[-1] = (bands[-1][0], max(hi, bands[-1][1]))
+            else: bands.append((lo, hi))
+        return bands
+
+    def _apply(self, seq: int, rows):
+        """Pass seq on those of the rows inside its band that still miss it (one vectorized update)."""
+        lo, hi, radii, prefix = self._passes[seq - self._base]
+        x = self.radius[rows]
+        hit = (np.maximum(self._applied[rows], self._base) <= seq) & (x >= lo) & (x < hi)
+        if not hit.any(): return
+        rows, x = rows[hit], x[hit]
+        a = np.searchsorted(radii, x - self.width, "right") # Writes at r with x - width < r <= x + width
+        b = np.searchsorted(radii, x + self.width, "right")
+        count = b - a
+        keep = ((1.0 - self.strength) ** count)[:, None]
+        mix = (prefix[b] - prefix[a]) / np.maximum(count, 1)[:, None]
+        self.spectra[rows] = self.spectra[rows] * keep + mix * (1.0 - keep)
+        self._applied[rows] = seq + 1
+
+    def _force(self, rows):
+        """Brings the given rows up to date with every pending pass."""
+        upto = self._base + len(self._passes)
+        applied = np.maximum(self._applied[rows], self._base) # Below _base = already current
+        if not len(rows) or applied.min() >= upto: return
+        for seq in range(int(applied.min()), upto): self._apply(seq, rows)
+        self._applied[rows] = upto
+
+    def flush(self):
+        """Applies every pending pass to the rows of its own band; afterwards nothing is pending."""
+        for seq, (lo, hi, _, _) in enumerate(self._passes, self._base): self._apply(seq, self._rows_in(lo, hi))
+        self._base += len(self._passes)
+        self._passes = []
+
+    def _rows_in(self, r_min: float, r_max: float):
+        return np.frombuffer(self.db.spatial.ring(r_min, r_max), dtype=np.int64)
+
+    # --- Reads (force only what they touch) ---
+
+    def spectrum(self, node_id: str) -> SpectralSignature:
+        """Current (interfered) color of one node."""
+        row = self.db.rows[node_id]
+        x = self.radius[row]
+        if any(lo <= x < hi for lo, hi, _, _ in self._passes): self._force(np.array([row]))
+        return SpectralSignature(*self.spectra[row].tolist())
+
+    def ring(self, r_min: float, r_max: float):
+        """(rows, (k, 3) colors) of the temporal layer r_min <= radius < r_max."""
+        rows = self._rows_in(r_min, r_max)
+        if any(lo < r_max and r_min < hi for lo, hi, _, _ in self._passes): self._force(rows)
+        return rows, self.spectra[rows]
+
+    def layer_color(self, r_min: float, r_max: float) -> Optional[SpectralSignature]:
+        """Mean color of a temporal layer (None if empty)."""
+        rows, colors = self.ring(r_min, r_max)
+        return SpectralSignature(*colors.mean(axis=0).tolist()) if len(rows) else None
+
+# ==========================================
+# 8. THE STORAGE ENGINE
+# ==========================================
+
+class MalachiteStorage:
+    """
+    The crystal. In memory by default; give it a path to make it durable
+    (see CrystalJournal): it then restores the latest snapshot plus the WAL
+    tail on start, logs every write, and snapshots every snapshot_every
+    writes (0 = only on demand). compact=True keeps nodes in a ColumnarNodes
+    table instead of one dataclass each (same API, nodes read as views).
+
+    Every node gets a row (its write order); the indexes work on rows and
+    the public API translates to and from ids.
+
+    One writer thread may run alongside any number of readers: a reader
+    calls pin() and queries the CrystalView it gets (no locks). Queries on
+    the storage itself always see the latest state and belong to the writer.
+
+    With a ShardSpec the storage is one shard of a ShardedCrystal: it plants
+    only the Seeds of its arc, draws ids that name the shard, and accepts
+    layers whose parent lives in another shard (they are local roots here,
+    so lineage queries stop at the shard border; the router stitches rays).
+    """
+    def __init__(self, path: Optional[str] = None, fsync: str = "group", group_size: int = 256,
+                 snapshot_every: int = 0, compact: bool = False, shard: Optional["ShardSpec"] = None,
+                 group_interval: float = 0.05):
+        self.compact = compact
+        self.shard = shard
+        if compact:
+            self.nodes = ColumnarNodes()
+            self.ids, self.rows = self.nodes.ids, self.nodes.rows
+            self.spatial = SpatialIndex(self.nodes.angle, self.nodes.radius)
+            self._at = self.nodes.view
+        else:
+            self.nodes: Dict[str, MalachiteNode] = {}
+            self.ids: List[str] = []          # row -> id
+            self.rows: Dict[str, int] = {}    # id -> row
+            self._by_row: List[MalachiteNode] = []
+            self.spatial = SpatialIndex()
+            self._at = self._by_row.__getitem__
+        self.lineage = LineageIndex()
+        self.branches = BranchIndex(self.lineage)
+        self.sector_map = dict(SECTOR_ARCS)
+        self._subscribers: List[Callable[[List[MalachiteNode]], None]] = []
+        self.version = 0 # Rows published to readers (set once every index holds them)
+        self.snapshot_every = snapshot_every
+        self.journal = CrystalJournal(path, fsync, group_size, group_interval) if path else None
+        if self.journal is None or not self.journal.has_snapshot:
+            self._genesis() # Plant the seeds (they are never logged: genesis is deterministic)
+        if self.journal is not None:
+            before = len(self.ids)
+            for chunk in self.journal.load(): self._add_nodes(chunk, index=False)
+            self.spatial.reindex()
+            if len(self.ids) > before: print(f"💾 CRYSTAL RESTORED: {len(self.nodes)} layers from {path}.")
+
+    def _register(self, node: MalachiteNode) -> int:
+        """Stores the node and threads it into the row indexes; returns its row."""
+        parent = self.rows.get(node.parent_id, -1) # -1: a Seed, or a parent held by another shard
+        if self.compact:
+            row = self.nodes.append(node, parent)
+        else:
+            row = len(self.ids)
+            self.nodes[node.id] = node
+            self.ids.append(node.id)
+            self.rows[node.id] = row
+            self._by_row.append(node)
+        self.lineage.add(parent)
+        self.branches.add(row, parent, node)
+        return row
+
+    def _add_node(self, node: MalachiteNode):
+        """Single write hook: every node enters the storage and its indexes here."""
+        self.spatial.add(self._register(node), node.angle, node.radius)
+        self.version = len(self.ids)
+        for callback in self._subscribers: callback([node])
+
+    def _add_nodes(self, nodes: List[MalachiteNode], index: bool = True):
+        """Bulk _add_node (parents before children); index=False leaves sorting to spatial.reindex()."""
+        if not nodes: return # Nothing to index or announce
+        first = len(self.ids)
+        if self.compact:
+            self.nodes.extend(nodes)
+            parents = self.nodes.parent[first:]
+        else:
+            self.nodes.update((node.id, node) for node in nodes)
+            self.ids.extend([node.id for node in nodes])
+            self.rows.update(zip(self.ids[first:], range(first, first + len(nodes))))
+            self._by_row.extend(nodes)
+            get = self.rows.get
+            parents = [get(node.parent_id, -1) for node in nodes]
+        self.lineage.extend(parents)
+        self.branches.extend(first, parents, nodes)
+        self.spatial.extend(first, [node.angle for node in nodes], [node.radius for node in nodes], index)
+        self.version = len(self.ids)
+        for callback in self._subscribers: callback(nodes)
+
+    def subscribe(self, callback: Callable[[List[MalachiteNode]], None]):
+        """
+        Registers an external index: callback(new_nodes) runs after every
+        write (a single layer or a whole crystallize_many batch).
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[List[MalachiteNode]], None]):
+        self._subscribers.remove(callback)
+
+    def pin(self) -> "CrystalView":
+        """
+        Consistent read view for any thread: every layer published so far
+        and none after. O(1): the crystal is append-only, so nothing is copied.
+        """
+        return CrystalView(self, self.version)
+
+    def _journal(self, nodes: List[MalachiteNode]):
+        if len(nodes) == 1: self.journal.append(nodes[0])
+        else: self.journal.append_batch(nodes)
+        if self.snapshot_every and self.journal.since_snapshot >= self.snapshot_every: self.snapshot()
+
+    # --- Durability ---
+
+    def commit(self):
+        """Forces buffered writes to disk (no-op in memory)."""
+        if self.journal is not None: self.journal.commit()
+
+    def snapshot(self):
+        """Folds the WAL into a fresh snapshot for fast restarts."""
+        if self.journal is None: raise RuntimeError("In-memory crystal: open MalachiteStorage(path) to persist it.")
+        self.journal.snapshot(self.nodes.values())
+        print(f"💾 SNAPSHOT: {len(self.nodes)} layers at seq {self.journal.seq}.")
+
+    def close(self):
+        if self.journal is not None: self.journal.close()
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
 
     def _genesis(self):
         """
@@ -93,8 +1182,9 @@ class MalachiteStorage:
             ("SEED_WIND", "The Wind (Spirit)", 270, SectorType.SKY),
         ]
         
+        if self.shard is not None: seeds = [seed for seed in seeds if self.shard.holds(seed[2])]
         for s_id, content, angle, sector in seeds:
-            self.nodes[s_id] = MalachiteNode(
+            self._add_node(MalachiteNode(
                 id=s_id,
                 content=content,
                 radius=0.0,
@@ -104,8 +1194,8 @@ class MalachiteStorage:
                 spectrum=SpectralSignature(0.5, 0.5, 0.5), # Grey start
                 integrity=1.0,
                 tags=["AXIOM", sector.value]
-            )
-        print("🌱 GENESIS COMPLETE: 6 Seeds planted.")
+            ))
+        print(f"🌱 GENESIS COMPLETE: {len(seeds)} Seeds planted.")
 
     def crystallize(self, content: str, parent_id: str, mutation_degree: float = 0.0) -> str:
         """
@@ -117,6 +1207,17 @@ class MalachiteStorage:
             parent_id: The ID of the idea we are improving.
             mutation_degree: 0.0 (Linear step) to 1.0 (Radical shift).
         """
+        return self._crystallize(content, parent_id, mutation_degree)
+
+    def _crystallize(self, content: str, parent_id: str, mutation_degree: float = 0.0,
+                     node_type: Optional[NodeType] = None, integrity: float = 1.0) -> str:
+        new_node = self._grow(content, parent_id, mutation_degree, node_type, integrity)
+        self._store(new_node)
+        return new_node.id
+
+    def _grow(self, content: str, parent_id: str, mutation_degree: float = 0.0,
+              node_type: Optional[NodeType] = None, integrity: float = 1.0) -> MalachiteNode:
+        """The next layer on top of parent_id (coordinates, type, fresh id), not yet stored."""
         if parent_id not in self.nodes:
             raise ValueError(f"Parent node {parent_id} not found. Cannot crystallize noise.")
 
@@ -132,11 +1233,12 @@ class MalachiteStorage:
         new_angle = (parent.angle + angle_shift) % 360
         
         # 2. Determine Type
-        n_type = NodeType.BUD if mutation_degree > 0.5 else NodeType.PETAL
+        n_type = node_type or (NodeType.BUD if mutation_degree > 0.5 else NodeType.PETAL)
         
         # 3. Create Node
-        new_id = f"node_{uuid.uuid4().hex[:8]}"
-        new_node = MalachiteNode(
+        new_id = self._draw_id()
+        while new_id in self.nodes: new_id = self._draw_id() # 32-bit ids collide near 10^5 layers
+        return MalachiteNode(
             id=new_id,
             content=content,
             radius=new_radius,
@@ -144,30 +1246,98 @@ class MalachiteStorage:
             parent_id=parent_id,
             node_type=n_type,
             spectrum=parent.spectrum, # Inherit color (can be modified by logic)
-            integrity=1.0
+            integrity=integrity
         )
-        
-        self.nodes[new_id] = new_node
-        return new_id
+
+    def _store(self, node: MalachiteNode):
+        self._add_node(node)
+        if self.journal is not None: self._journal([node])
+
+    def _draw_id(self) -> str:
+        return f"node_{uuid.uuid4().hex[:8]}" if self.shard is None else self.shard.draw_id()
+
+    def crystallize_many(self, records: Iterable[Tuple[str, object, float]]) -> List[str]:
+        """
+        Bulk write for historical imports.
+
+        Each record is (content, parent_ref, mutation_degree); parent_ref is
+        an existing node ID or the int position of another record in the
+        same batch (forward references are fine). The batch is validated
+        as a whole (field types, unknown parents, bad positions, cycles)
+        before anything is written, then ids, coordinates and indexes are
+        produced in one pass: all-or-nothing, in memory and in the WAL.
+        Returns the new IDs in record order.
+        """
+        records = list(records)
+        n = len(records)
+        # 1. Validate + topological order (parents before children)
+        in_batch = [-1] * n # Parent position inside the batch, or -1
+        waiting: Dict[int, List[int]] = {}
+        order = []
+        for i, (content, parent_ref, mutation_degree) in enumerate(records):
+            if not isinstance(content, str):
+                raise TypeError(f"Record {i}: content must be str, got {type(content).__name__}.")
+            if not isinstance(mutation_degree, Real):
+                raise TypeError(f"Record {i}: mutation_degree must be a number, got {type(mutation_degree).__name__}.")
+            if isinstance(parent_ref, int) and not isinstance(parent_ref, bool):
+                if not 0 <= parent_ref < n or parent_ref == i:
+                    raise ValueError(f"Record {i}: parent position {parent_ref} is outside the batch.")
+                in_batch[i] = parent_ref
+                waiting.setdefault(parent_ref, []).append(i)
+            elif parent_ref in self.rows:
+                order.append(i)
+            else:
+                raise ValueError(f"Record {i}: parent node {parent_ref} not found. Cannot crystallize noise.")
+        for i in order: # Grows while it is walked: in-batch children follow their parents
+            if i in waiting: order.extend(waiting.pop(i))
+        if len(order) < n:
+            raise ValueError(f"Batch has a parent cycle through records {sorted(set(range(n)) - set(order))[:5]}.")
+
+        # 2. Ids and coordinates in bulk
+        if self.shard is None:
+            hexes = os.urandom(4 * n).hex()
+            ids = [f"node_{hexes[j:j + 8]}" for j in range(0, 8 * n, 8)]
+        else: ids = [self.shard.draw_id() for _ in range(n)]
+        if len(set(ids)) < n or any(new_id in self.rows for new_id in ids): # 32-bit ids: redraw clashes
+            seen = set()
+            for i, new_id in enumerate(ids):
+                while new_id in seen or new_id in self.rows: new_id = self._draw_id()
+                seen.add(new_id)
+                ids[i] = new_id
+        made: List[Optional[MalachiteNode]] = [None] * n
+        rand, bud, petal = random.random, NodeType.BUD, NodeType.PETAL
+        for i in order:
+            content, parent_ref, mutation_degree = records[i]
+            parent = self.nodes[parent_ref] if in_batch[i] < 0 else made[in_batch[i]]
+            made[i] = MalachiteNode(ids[i], content,
+                                    parent.radius + 1.0 + (mutation_degree * 2.0),
+                                    (parent.angle + (-10 + 20 * rand()) * mutation_degree) % 360, # = uniform(-10, 10)
+                                    parent.id, bud if mutation_degree > 0.5 else petal,
+                                    parent.spectrum, 1.0)
+        nodes = [made[i] for i in order]
+
+        # 3. One pass over the indexes, one WAL record
+        self._add_nodes(nodes)
+        if self.journal is not None and nodes: self._journal(nodes)
+        return ids
 
     def create_void(self, parent_id: str, description: str) -> str:
         """
         Registers a historical loss of knowledge.
         """
-        node_id = self.crystallize(f"[LOST KNOWLEDGE]: {description}", parent_id)
-        self.nodes[node_id].node_type = NodeType.VOID
-        self.nodes[node_id].integrity = 0.1
-        return node_id
+        return self._crystallize(f"[LOST KNOWLEDGE]: {description}", parent_id,
+                                 node_type=NodeType.VOID, integrity=0.1)
 
     # ==========================================
-    # 3. SEARCH & NAVIGATION TOOLS
+    # 9. SEARCH & NAVIGATION TOOLS
     # ==========================================
 
-    def trace_ray(self, node_id: str) -> List[MalachiteNode]:
+    def trace_ray(self, node_id: str, lazy: bool = False):
         """
         Traces the lineage from a leaf back to the Seed.
-        Returns the evolutionary path.
+        Returns the evolutionary path (a LineagePath view if lazy=True).
         """
+        if lazy: return LineagePath(self, node_id) if node_id in self.nodes else []
         path = []
         curr = self.nodes.get(node_id)
         while curr:
@@ -178,19 +1348,518 @@ class MalachiteStorage:
                 curr = None
         return list(reversed(path)) # From Seed to Leaf
 
+    def depth(self, node_id: str) -> int:
+        """Number of layers between the node and its Seed."""
+        return self.lineage.depth(self.rows[node_id])
+
+    def ancestor(self, node_id: str, k: int) -> Optional[str]:
+        """ID of the layer k steps back along the ray (None past the Seed)."""
+        row = self.lineage.ancestor(self.rows[node_id], k)
+        return None if row < 0 else self.ids[row]
+
+    def is_ancestor(self, ancestor_id: str, node_id: str) -> bool:
+        """Does node_id descend from ancestor_id?"""
+        return self.lineage.is_ancestor(self.rows[ancestor_id], self.rows[node_id])
+
+    def common_ancestor(self, a: str, b: str) -> Optional[str]:
+        """The last shared layer of two inventions (None across Seeds)."""
+        row = self.lineage.common_ancestor(self.rows[a], self.rows[b])
+        return None if row < 0 else self.ids[row]
+
+    def children_of(self, node_id: str) -> List[MalachiteNode]:
+        """Layers grown directly on top of a node."""
+        return list(map(self._at, self.branches.children(self.rows[node_id])))
+
+    def descendants(self, node_id: str, max_depth: Optional[int] = None,
+                    breadth_first: bool = False) -> Iterator[MalachiteNode]:
+        """
+        Streams the whole branch above a node (depth-first by default),
+        optionally stopping max_depth layers down.
+        """
+        return map(self._at, self.branches.descendants(self.rows[node_id], max_depth, breadth_first))
+
+    def branch_stats(self, node_id: str) -> BranchStats:
+        """Size, reach, voids and weakest link of the branch rooted at node_id."""
+        descendants, max_radius, voids, min_integrity, weakest = self.branches.stats(self.rows[node_id])
+        return BranchStats(node_id, descendants, max_radius, voids, min_integrity, self.ids[weakest])
+
+    def weakest_link(self, node_id: str) -> MalachiteNode:
+        """The least solid layer of the branch (the node itself included)."""
+        return self._at(self.branches.stats(self.rows[node_id])[4])
+
+    def sector_of(self, node: MalachiteNode) -> SectorType:
+        """The fundamental domain a node's angle falls in."""
+        for sector, (min_a, max_a) in self.sector_map.items():
+            if min_a <= node.angle < max_a: return sector
+        return SectorType.SKY # angle == 360.0 after float rounding
+
     def scan_sector(self, sector: SectorType) -> List[MalachiteNode]:
         """
-        Returns all nodes within a specific sector (Earth/Water/Sky).
+        Returns all nodes within a specific sector (Earth/Water/Sky),
+        ordered by angle.
         """
         min_a, max_a = self.sector_map[sector]
-        result = []
-        for node in self.nodes.values():
-            if min_a <= node.angle < max_a:
-                result.append(node)
-        return result
+        return self.scan_arc(min_a, max_a)
+
+    def scan_arc(self, start: float, end: float) -> List[MalachiteNode]:
+        """Nodes with angle in [start, end) degrees; wraps at 360 (350 -> 370 and 350 -> 10 are one arc)."""
+        return list(map(self._at, self.spatial.arc(start, end)))
+
+    def scan_ring(self, r_min: float, r_max: float) -> List[MalachiteNode]:
+        """Nodes with radius in [r_min, r_max): one temporal ring of the crystal."""
+        return list(map(self._at, self.spatial.ring(r_min, r_max)))
+
+    def scan_window(self, start: float, end: float, r_min: float, r_max: float) -> List[MalachiteNode]:
+        """Annulus-sector: angle in [start, end) (wrapping, as in scan_arc) and radius in [r_min, r_max)."""
+        return list(map(self._at, self.spatial.window(start, end, r_min, r_max)))
 
 # ==========================================
-# 4. DEMONSTRATION (THE WHEEL EVOLUTION)
+# 10. PINNED READS (MVCC VIEWS)
+# ==========================================
+
+class PinnedRows(Mapping):
+    """id -> row for the first `version` rows of a storage."""
+    def __init__(self, storage: MalachiteStorage, version: int):
+        self._rows, self._ids, self.version = storage.rows, storage.ids, version
+
+    def __len__(self) -> int: return self.version
+    def __iter__(self) -> Iterator[str]: return islice(self._ids, self.version)
+
+    def __getitem__(self, node_id: str) -> int:
+        row = self._rows[node_id]
+        if row >= self.version: raise KeyError(node_id)
+        return row
+
+class PinnedNodes(Mapping):
+    """id -> node for the first `version` rows (values() walks rows, not the live dict)."""
+    def __init__(self, storage: MalachiteStorage, rows: PinnedRows):
+        self._at, self._rows = storage._at, rows
+
+    def __len__(self) -> int: return len(self._rows)
+    def __iter__(self) -> Iterator[str]: return iter(self._rows)
+    def __getitem__(self, node_id: str): return self._at(self._rows[node_id])
+    def values(self) -> Iterator[MalachiteNode]: return map(self._at, range(len(self._rows)))
+
+class CrystalView:
+    """
+    MVCC read view of a MalachiteStorage: the crystal as of `version` rows.
+
+    Every structure a view reads is append-only below the version or
+    swapped in whole (node rows, lineage arrays, child links, copy-on-write
+    sorted blocks, the Euler tour), so a pinned reader needs no lock and
+    never sees a half-written layer, however long it keeps the view while
+    the writer goes on. Rows written later are filtered out of every
+    answer. Branch aggregates are folded lazily by the writer, so a view
+    computes branch_stats by walking the branch instead.
+    """
+    def __init__(self, storage: MalachiteStorage, version: int):
+        self._storage, self.version = storage, version
+        self.lineage = storage.lineage
+        self.rows = PinnedRows(storage, version)
+        self.nodes = PinnedNodes(storage, self.rows)
+        self._at = storage._at
+
+    def __len__(self) -> int: return self.version
+
+    def _visible(self, rows: Iterable[int]) -> List[MalachiteNode]:
+        version = self.version
+        return [self._at(row) for row in rows if row < version]
+
+    # --- Lineage ---
+
+    def trace_ray(self, node_id: str, lazy: bool = False):
+        """Seed -> node path (a LineagePath view if lazy=True); [] if the node is not in the view."""
+        if node_id not in self.rows: return []
+        path = LineagePath(self, node_id)
+        return path if lazy else list(path)
+
+    def depth(self, node_id: str) -> int:
+        return self.lineage.depth(self.rows[node_id])
+
+    def ancestor(self, node_id: str, k: int) -> Optional[str]:
+        row = self.lineage.ancestor(self.rows[node_id], k)
+        return None if row < 0 else self._storage.ids[row]
+
+    def is_ancestor(self, ancestor_id: str, node_id: str) -> bool:
+        return self.lineage.is_ancestor(self.rows[ancestor_id], self.rows[node_id])
+
+    def common_ancestor(self, a: str, b: str) -> Optional[str]:
+        row = self.lineage.common_ancestor(self.rows[a], self.rows[b])
+        return None if row < 0 else self._storage.ids[row]
+
+    # --- Branches ---
+
+    def children_of(self, node_id: str) -> List[MalachiteNode]:
+        return list(map(self._at, self._storage.branches.children(self.rows[node_id], self.version)))
+
+    def descendants(self, node_id: str, max_depth: Optional[int] = None,
+                    breadth_first: bool = False) -> Iterator[MalachiteNode]:
+        return map(self._at, self._storage.branches.descendants(self.rows[node_id], max_depth,
+                                                                breadth_first, self.version))
+
+    def branch_stats(self, node_id: str) -> BranchStats:
+        """As MalachiteStorage.branch_stats, counted over the pinned branch (O(branch size))."""
+        root = self._at(self.rows[node_id])
+        size, voids, max_radius, weakest = 0, int(root.node_type == NodeType.VOID), root.radius, root
+        for node in self.descendants(node_id):
+            size += 1
+            voids += node.node_type == NodeType.VOID
+            if node.radius > max_radius: max_radius = node.radius
+            if node.integrity < weakest.integrity: weakest = node
+        return BranchStats(node_id, size, max_radius, voids, weakest.integrity, weakest.id)
+
+    def weakest_link(self, node_id: str) -> MalachiteNode:
+        return self.nodes[self.branch_stats(node_id).weakest_id]
+
+    # --- Space ---
+
+    def sector_of(self, node: MalachiteNode) -> SectorType:
+        return self._storage.sector_of(node)
+
+    def scan_sector(self, sector: SectorType) -> List[MalachiteNode]:
+        min_a, max_a = self._storage.sector_map[sector]
+        return self.scan_arc(min_a, max_a)
+
+    def scan_arc(self, start: float, end: float) -> List[MalachiteNode]:
+        return self._visible(self._storage.spatial.arc(start, end))
+
+    def scan_ring(self, r_min: float, r_max: float) -> List[MalachiteNode]:
+        return self._visible(self._storage.spatial.ring(r_min, r_max))
+
+    def scan_window(self, start: float, end: float, r_min: float, r_max: float) -> List[MalachiteNode]:
+        return self._visible(self._storage.spatial.window(start, end, r_min, r_max))
+
+# ==========================================
+# 11. SECTOR SHARDS (ONE PROCESS PER ARC)
+# ==========================================
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """
+    One shard of a ShardedCrystal: the angular range [start, end) it holds,
+    and its index among `count` shards. Its ids are node_<hex> with
+    hex % count == index, so any process can route an id to its shard.
+    """
+    index: int
+    count: int
+    start: float
+    end: float
+
+    def holds(self, angle: float) -> bool:
+        return self.start <= angle < self.end or (angle >= self.end >= 360) # angle == 360.0 after float rounding
+
+    def draw_id(self) -> str:
+        value = int.from_bytes(os.urandom(4), "big")
+        value += self.index - value % self.count
+        if value > 0xFFFFFFFF: value -= self.count
+        return f"node_{value:08x}"
+
+    @property
+    def name(self) -> str:
+        return f"shard_{self.start:g}_{self.end:g}"
+
+class CrystalShard:
+    """
+    Server side of one shard: a MalachiteStorage holding the layers of one
+    arc (plus an optional analogy engine over them) that answers router
+    requests, (op, args) -> (ok, result or exception), until closed.
+    """
+    def __init__(self, spec: ShardSpec, path: Optional[str] = None, compact: bool = False,
+                 analogy: Optional[Callable] = None, **storage):
+        self.spec = spec
+        self.db = MalachiteStorage(path, compact=compact, shard=spec, **storage)
+        self.analogy = analogy(self.db) if analogy is not None else None
+        self._spectra: Dict[tuple, SpectralSignature] = {}
+
+    def serve(self, conn):
+        while True:
+            try: op, args = conn.recv()
+            except EOFError: break # Router gone
+            try: reply = (True, getattr(self, f"op_{op}")(*args))
+            except Exception as exc: reply = (False, exc)
+            try: conn.send(reply)
+            except Exception as exc: conn.send((False, RuntimeError(f"Shard {self.spec.name}: unpicklable reply ({exc!r})")))
+            if op == "close": break
+        self.db.close()
+
+    def op_hello(self) -> List[str]:
+        return [node.id for node in self.db.scan_ring(0.0, 1.0)] # Seeds sit at r=0, layers from r=1
+
+    def op_crystallize(self, content: str, parent_id: str, mutation_degree: float,
+                       node_type: Optional[NodeType], integrity: float) -> Tuple[Optional[str], Optional[list]]:
+        """(id, None) if the new layer stays here, (None, its record) if its angle belongs to another shard."""
+        node = self.db._grow(content, parent_id, mutation_degree, node_type, integrity)
+        if not self.spec.holds(node.angle): return None, _node_record(node)
+        self.db._store(node)
+        return node.id, None
+
+    def op_adopt(self, record: list) -> str:
+        """Stores a layer grown in another shard under an id of this one."""
+        node = _node_from_record(record, self._spectra)
+        node.id = self.db._draw_id()
+        while node.id in self.db.nodes: node.id = self.db._draw_id()
+        self.db._store(node)
+        return node.id
+
+    def op_trace(self, node_ids: List[str]) -> List[List[list]]:
+        """The local segment of each ray (root side first); its root's parent_id is the next hop, if any."""
+        return [[_node_record(node) for node in self.db.trace_ray(node_id)] for node_id in node_ids]
+
+    def op_get(self, node_ids: List[str]) -> List[Optional[list]]:
+        nodes = self.db.nodes
+        return [None if node_id not in nodes else _node_record(nodes[node_id]) for node_id in node_ids]
+
+    def op_scan_arcs(self, spans: List[Tuple[float, float]]) -> List[list]:
+        return [_node_record(node) for lo, hi in spans for node in self.db.scan_arc(lo, hi)]
+
+    def op_scan_ring(self, r_min: float, r_max: float) -> List[list]:
+        return list(map(_node_record, self.db.scan_ring(r_min, r_max)))
+
+    def op_scan_window(self, start: float, end: float, r_min: float, r_max: float) -> List[list]:
+        return list(map(_node_record, self.db.scan_window(start, end, r_min, r_max)))
+
+    def op_find_analogies(self, input_text: str, current_sector: str, k: Optional[int]) -> list:
+        if self.analogy is None: raise RuntimeError("Sharded crystal started without an analogy engine.")
+        return self.analogy.find_analogies(input_text, current_sector, k)
+
+    def op_len(self) -> int: return len(self.db.ids)
+    def op_commit(self): self.db.commit()
+    def op_snapshot(self): self.db.snapshot()
+    def op_close(self): self.db.close() # serve() stops after replying
+
+def _run_shard(conn, spec: ShardSpec, path: Optional[str], compact: bool, analogy: Optional[Callable], storage: dict):
+    """Shard process entry point: the first reply is the shard's hello (its Seed ids) or its startup error."""
+    try: shard = CrystalShard(spec, path, compact, analogy, **storage)
+    except Exception as exc:
+        conn.send((False, exc))
+        return
+    conn.send((True, shard.op_hello()))
+    shard.serve(conn)
+
+class ShardedCrystal:
+    """
+    A crystal split by angle: one MalachiteStorage per arc, each in its own
+    process, behind a router with the storage's write and read API.
+
+    - shards: None = one per sector of sector_map; an int = that many equal
+      arcs; or a list of (start, end) arcs tiling [0, 360).
+    - A layer lives in the shard owning its angle. A write goes to the
+      parent's shard, which grows the layer and keeps it, or hands it back
+      when a mutation moved it across the border (one more hop adopts it).
+      Ids name their shard (ShardSpec), so routing needs no directory.
+    - A ray crossing shards is stitched from per-shard segments: each round
+      asks every shard, in one message, for all the segments it holds, so
+      trace_rays costs one round per border crossed, not one per layer.
+    - Requests go out to every shard before any reply is read: fan-out
+      queries (scans, analogies) run on all shards at once.
+    - path: each shard journals under <path>/shard_<start>_<end>.
+    - analogy: a factory run on each shard's storage inside its process,
+      e.g. sve_core.AnalogyEngine (it must be importable by the shards).
+
+    Shards talk to the router over multiprocessing pipes (socket pairs on
+    Unix). The router, like the storage's writer, is single-threaded.
+    """
+    def __init__(self, shards=None, path: Optional[str] = None, compact: bool = False,
+                 analogy: Optional[Callable] = None, start_method: str = "spawn", **storage):
+        import multiprocessing # Loaded with the first sharded crystal
+        self.sector_map = dict(SECTOR_ARCS)
+        if shards is None: arcs = sorted(self.sector_map.values())
+        elif isinstance(shards, int): arcs = [(360 * i / shards, 360 * (i + 1) / shards) for i in range(shards)]
+        else: arcs = sorted(shards)
+        if not arcs or arcs[0][0] != 0 or arcs[-1][1] != 360 or any(a[1] != b[0] for a, b in zip(arcs, arcs[1:])):
+            raise ValueError(f"Shard arcs must tile [0, 360) without gaps or overlaps, got {arcs}")
+        self.specs = [ShardSpec(i, len(arcs), start, end) for i, (start, end) in enumerate(arcs)]
+        self._starts = [spec.start for spec in self.specs]
+        self.analogy = analogy is not None
+        self._spectra: Dict[tuple, SpectralSignature] = {}
+        self._conns, self._procs = [], []
+        context = multiprocessing.get_context(start_method)
+        for spec in self.specs:
+            here, there = context.Pipe()
+            proc = context.Process(target=_run_shard, name=f"malachite-{spec.name}", daemon=True,
+                                   args=(there, spec, path and os.path.join(path, spec.name), compact, analogy, storage))
+            proc.start()
+            there.close()
+            self._conns.append(here)
+            self._procs.append(proc)
+        try: hellos = self._collect(range(len(self.specs)))
+        except BaseException:
+            self.close()
+            raise
+        self._seeds = {seed_id: shard for shard, seeds in hellos.items() for seed_id in seeds}
+        print(f"💎 SHARDED CRYSTAL: {len(self.specs)} shards ({', '.join(spec.name for spec in self.specs)}).")
+
+    # --- Transport ---
+
+    def _collect(self, shards: Iterable[int]) -> Dict[int, object]:
+        """Reads one reply per shard (all of them, so the pipes stay in step), then raises the first error."""
+        replies = {}
+        for shard in shards:
+            try: replies[shard] = self._conns[shard].recv()
+            except EOFError: replies[shard] = (False, RuntimeError(f"Shard {self.specs[shard].name} is gone."))
+        for ok, value in replies.values():
+            if not ok: raise value
+        return {shard: value for shard, (_, value) in replies.items()}
+
+    def _ask(self, requests: Dict[int, Tuple[str, tuple]]) -> Dict[int, object]:
+        """Sends shard -> (op, args) to all shards first, then gathers the replies."""
+        for shard, request in requests.items(): self._conns[shard].send(request)
+        return self._collect(requests)
+
+    def _call(self, shard: int, op: str, *args):
+        return self._ask({shard: (op, args)})[shard]
+
+    def _shard_of(self, node_id: str) -> Optional[int]:
+        """Shard holding an id (None if no shard could)."""
+        shard = self._seeds.get(node_id)
+        if shard is None and isinstance(node_id, str) and node_id.startswith("node_"):
+            try: shard = int(node_id[5:], 16) % len(self.specs)
+            except ValueError: pass
+        return shard
+
+    def _shard_at(self, angle: float) -> int:
+        return max(0, bisect_right(self._starts, angle) - 1)
+
+    def _nodes(self, records: Iterable[list]) -> List[MalachiteNode]:
+        spectra = self._spectra
+        return [_node_from_record(record, spectra) for record in records]
+
+    # --- Writes ---
+
+    def crystallize(self, content: str, parent_id: str, mutation_degree: float = 0.0) -> str:
+        """MalachiteStorage.crystallize, routed: one round trip, two if the layer crosses into another shard."""
+        return self._crystallize(content, parent_id, mutation_degree)
+
+    def create_void(self, parent_id: str, description: str) -> str:
+        return self._crystallize(f"[LOST KNOWLEDGE]: {description}", parent_id,
+                                 node_type=NodeType.VOID, integrity=0.1)
+
+    def _crystallize(self, content: str, parent_id: str, mutation_degree: float = 0.0,
+                     node_type: Optional[NodeType] = None, integrity: float = 1.0) -> str:
+        home = self._shard_of(parent_id)
+        if home is None: raise ValueError(f"Parent node {parent_id} not found. Cannot crystallize noise.")
+        new_id, moved = self._call(home, "crystallize", content, parent_id, mutation_degree, node_type, integrity)
+        if moved is None: return new_id
+        return self._call(self._shard_at(moved[3]), "adopt", moved)
+
+    # --- Lineage ---
+
+    def trace_ray(self, node_id: str) -> List[MalachiteNode]:
+        """Seed -> node path across shards ([] for an unknown id)."""
+        return self.trace_rays([node_id])[0]
+
+    def trace_rays(self, node_ids: Iterable[str]) -> List[List[MalachiteNode]]:
+        """
+        Many rays at once, in batched rounds: each round sends every shard
+        one request with all the segments wanted from it (a layer shared by
+        several rays is fetched once).
+        """
+        node_ids = list(node_ids)
+        segments: List[List[List[list]]] = [[] for _ in node_ids] # Per ray, leaf side first
+        waiting: Dict[str, List[int]] = {}                        # Layer to fetch -> rays through it
+        for ray, node_id in enumerate(node_ids): waiting.setdefault(node_id, []).append(ray)
+        while waiting:
+            asks: Dict[int, List[str]] = {}
+            for node_id in waiting:
+                shard = self._shard_of(node_id)
+                if shard is not None: asks.setdefault(shard, []).append(node_id)
+            replies = self._ask({shard: ("trace", (ids,)) for shard, ids in asks.items()})
+            hops: Dict[str, List[int]] = {}
+            for shard, ids in asks.items():
+                for node_id, segment in zip(ids, replies[shard]):
+                    if not segment: continue
+                    rays = waiting[node_id]
+                    for ray in rays: segments[ray].append(segment)
+                    parent_id = segment[0][4] # Root of the segment: its parent lives in another shard
+                    if parent_id is not None: hops.setdefault(parent_id, []).extend(rays)
+            waiting = hops
+        return [self._nodes(record for segment in reversed(ray) for record in segment) for ray in segments]
+
+    def get(self, node_id: str) -> Optional[MalachiteNode]:
+        shard = self._shard_of(node_id)
+        if shard is None: return None
+        record = self._call(shard, "get", [node_id])[0]
+        return None if record is None else self._nodes([record])[0]
+
+    # --- Space ---
+
+    def sector_of(self, node: MalachiteNode) -> SectorType:
+        for sector, (min_a, max_a) in self.sector_map.items():
+            if min_a <= node.angle < max_a: return sector
+        return SectorType.SKY
+
+    def scan_sector(self, sector: SectorType) -> List[MalachiteNode]:
+        min_a, max_a = self.sector_map[sector]
+        return self.scan_arc(min_a, max_a)
+
+    def _arc_shards(self, start: float, end: float) -> Dict[int, List[Tuple[float, float]]]:
+        """Shards overlapping [start, end) -> their non-wrapping spans, in angle order."""
+        asks: Dict[int, List[Tuple[float, float]]] = {}
+        for lo, hi in SpatialIndex._arc_spans(start, end):
+            for spec in self.specs:
+                if spec.start < hi and lo < spec.end: asks.setdefault(spec.index, []).append((lo, hi))
+        return asks
+
+    def scan_arc(self, start: float, end: float) -> List[MalachiteNode]:
+        """Nodes with angle in [start, end), ordered by angle (shards hold disjoint arcs)."""
+        asks = self._arc_shards(start, end)
+        replies = self._ask({shard: ("scan_arcs", (spans,)) for shard, spans in asks.items()})
+        return self._nodes(record for shard in asks for record in replies[shard])
+
+    def scan_ring(self, r_min: float, r_max: float) -> List[MalachiteNode]:
+        """Nodes with radius in [r_min, r_max), merged by radius."""
+        replies = self._ask({spec.index: ("scan_ring", (r_min, r_max)) for spec in self.specs})
+        return self._nodes(heapq.merge(*replies.values(), key=itemgetter(2)))
+
+    def scan_window(self, start: float, end: float, r_min: float, r_max: float) -> List[MalachiteNode]:
+        asks = self._arc_shards(start, end)
+        replies = self._ask({shard: ("scan_window", (start, end, r_min, r_max)) for shard in asks})
+        return self._nodes(record for shard in asks for record in replies[shard])
+
+    # --- Analogies ---
+
+    def find_analogies(self, input_text: str, current_sector, k: Optional[int] = None) -> list:
+        """
+        AnalogyEngine.find_analogies over every shard that may hold other
+        sectors, merged best first (all of them, or the best k).
+        """
+        if not self.analogy: raise RuntimeError("Start the ShardedCrystal with analogy=<engine factory> (e.g. sve_core.AnalogyEngine).")
+        exclude = getattr(current_sector, "value", current_sector)
+        arc = next((arc for sector, arc in self.sector_map.items() if sector.value == exclude), None)
+        shards = [spec.index for spec in self.specs if arc is None or not arc[0] <= spec.start < spec.end <= arc[1]]
+        replies = self._ask({shard: ("find_analogies", (input_text, exclude, k)) for shard in shards})
+        matches = (match for shard in shards for match in replies[shard])
+        if k is None: return sorted(matches, key=attrgetter("resonance_score"), reverse=True)
+        return heapq.nlargest(k, matches, key=attrgetter("resonance_score"))
+
+    # --- Lifecycle ---
+
+    def __len__(self) -> int:
+        return sum(self._ask({spec.index: ("len", ()) for spec in self.specs}).values())
+
+    def commit(self):
+        self._ask({spec.index: ("commit", ()) for spec in self.specs})
+
+    def snapshot(self):
+        self._ask({spec.index: ("snapshot", ()) for spec in self.specs})
+
+    def close(self):
+        """Closes every shard (flushing its journal) and waits for the processes."""
+        conns, self._conns = self._conns, []
+        for conn in conns:
+            try: conn.send(("close", ()))
+            except OSError: pass
+        for conn in conns:
+            try: conn.recv()
+            except (EOFError, OSError): pass
+            conn.close()
+        for proc in self._procs: proc.join(5)
+
+    def __enter__(self): return self
+    def __exit__(self, *exc): self.close()
+
+# ==========================================
+# 12. DEMONSTRATION (THE WHEEL EVOLUTION)
 # ==========================================
 
 if __name__ == "__main__":
@@ -227,6 +1896,10 @@ if __name__ == "__main__":
         prefix = "🌱" if node.node_type == NodeType.SEED else ("  " * i + "└─")
         status = " [VOID]" if node.node_type == NodeType.VOID else ""
         print(f"{prefix} {node.content} (r={node.radius:.1f}){status}")
+
+    print(f"\nLayers above the Seed: {db.depth(motor_id)} | Void on the ray: {db.is_ancestor(void_id, motor_id)}")
+    branch = db.branch_stats(root_id)
+    print(f"Branch of the Log: {branch.descendants} layers, {branch.voids} void(s), weakest link: {db.nodes[branch.weakest_id].content}")
 ```
 
 ### Как это работает?
@@ -10,7 +10,7 @@ import time
 import random
 from sve_core import (
     SyntropicDispatcher, SyntropicEntity, UserStats, 
-    EntityType, Verdict, AgentTestimony
+    EntityType, Verdict, AgentTestimony, Instrumentation
 )
 from malachite_db import MalachiteStorage, NodeType
 from protocols import UplinkProtocol, AgentIdentity, ResourceRequest
@@ -20,7 +20,7 @@ class GenesisSimulation:
         print("🌌 INITIALIZING GENESIS SIMULATION...")
         
         # 1. Launch Infrastructure
-        self.core = SyntropicDispatcher()
+        self.core = SyntropicDispatcher(instrumentation=Instrumentation(verbose=True))
         self.db = MalachiteStorage() # Triggers _genesis (6 seeds) internally
         self.uplink = UplinkProtocol(self.core)
         
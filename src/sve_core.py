@@ -1,542 +1,2082 @@
-```python
-"""
-SYNTROPIC CORE (v7.2 - HYBRID ENGINEERING RELEASE)
---------------------------------------------------
-Combines the reliability of v7.0 with the depth of v7.1.
-Implements 'Fast Path / Deep Path' logic.
-
-Includes:
-1. System Metabolism (75/25 Energy Balance).
-2. Benevolent Core (Amnesty & Support).
-3. Value Engine (SVE v4.1).
-4. Syntropy Scanner v3.0 (Fast Path).
-5. Fractal Analyzer (Deep Path).
-6. Clinical Dispatcher (Hybrid Orchestrator).
-"""
-
-import math
-import random
-import zlib
-import re
-from statistics import mean, variance
-from enum import Enum
-from dataclasses import dataclass
-from typing import Tuple, List, Optional, Dict, Any
-
-# --- NUMPY FALLBACK ---
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
-    class np: 
-        @staticmethod
-        def arange(n): return list(range(n))
-    
-    def simple_polyfit(x, y, degree):
-        if not x or not y: return [0, 0]
-        x_bar = mean(x)
-        y_bar = mean(y)
-        numerator = sum((xi - x_bar) * (yi - y_bar) for xi, yi in zip(x, y))
-        denominator = sum((xi - x_bar) ** 2 for xi in x)
-        if denominator == 0: return [0, 0]
-        slope = numerator / denominator
-        return [slope, 0]
-
-# ==========================================
-# 1. DATA STRUCTURES & ENUMS
-# ==========================================
-
-class EntityType(Enum):
-    TECHNOSPHERE = "ENV_ASSET"
-    BIOSPHERE = "PARTICLE"
-    IDEA = "POTENTIAL"
-
-class Verdict(Enum):
-    DELETE = "🗑️ BURN (Entropy/Noise)"
-    ARCHIVE = "🔒 STORE (Deep Freeze)"
-    AMPLIFY = "🚀 EXECUTE (Syntropy)"
-    STOP = "🛑 VETO (Critical Harm)"
-    RECOVERY = "🚑 HEAL (Somatic Imperative)"
-    RECYCLE = "♻️ RECYCLE (Efficiency)"
-
-class BudgetCategory(Enum):
-    LOGIC = "RATIONAL_INFRASTRUCTURE" # 75%
-    GROWTH = "IRRATIONAL_GROWTH"      # 25%
-
-class ContentType(Enum):
-    PROSE = "PROSE"
-    CODE = "CODE"
-    UNKNOWN = "UNKNOWN"
-
-class ZoomLevel(Enum):
-    MACRO = 1000   # The Vision
-    MESO = 300     # The Structure
-    MICRO = 80     # The Details
-
-@dataclass
-class SyntropicEntity:
-    id: str
-    type: EntityType
-    name: str
-    code_len: float
-    data_len: float
-    order_ratio: float
-    p_tech: float
-    k_wear: float
-    p_bio: float
-    k_health: float
-    e_in: float
-    e_debt: float
-    alpha: float
-    replacement_cost: float = 0.0
-
-@dataclass
-class UserStats:
-    status: str         # CITIZEN, OUTCAST
-    labor_hours: int    # Hours of service performed
-    wallet_balance: float
-
-@dataclass
-class AgentTestimony:
-    context_mode: str       # e.g., "CREATIVE_FLOW"
-    is_intentional: bool    
-    biological_state: str   # "STABLE", "CRITICAL"
-    defense_plea: str       
-
-@dataclass
-class Prescription:
-    action: Verdict
-    pathology: str 
-    treatment: str
-    sigma_penalty: float
-    quarantine_level: int
-    confidence: float
-    is_reversible: bool
-
-@dataclass
-class ScannerAnalysis:
-    text: str
-    density: float
-    coherence: float
-    vitality: float
-    mu_score: float
-    status: str
-    is_disruption: bool
-
-@dataclass
-class FractalState:
-    consistency_score: float    # 0.0 - 1.0
-    anomaly_detected: bool
-    weakest_link_score: float
-    diagnosis: str
-
-@dataclass
-class AnalogyMatch:
-    source_id: str          # Source Idea (e.g., Internet)
-    target_id: str          # Target Idea (e.g., Mycelium)
-    resonance_score: float  # Similarity score (0.0 - 1.0)
-    shared_pattern: str     # Common structural pattern (e.g., "DECENTRALIZED_NETWORK")
-
-class AnalogyEngine:
-    """
-    Implements Lateral Thinking (The Echo Protocol).
-    Finds structural similarities between geometrically distant sectors
-    (e.g., connecting Biology to Engineering).
-    """
-    def __init__(self, db_ref):
-        self.db = db_ref # Reference to Malachite DB instance
-
-    def find_analogies(self, input_text: str, current_sector: str) -> List[AnalogyMatch]:
-        """
-        Scans the entire Malachite Crystal for similar patterns
-        in DIFFERENT sectors (Cross-Domain Search).
-        """
-        print(f"✨ ANALOGY SCAN: Looking for echoes of '{input_text[:20]}...'")
-        
-        # 1. Extract Abstract Pattern (Simulated)
-        # In production, an LLM extracts the topological essence here.
-        # Example: "Blockchain" -> Pattern: "IMMUTABLE_LEDGER"
-        pattern = self._extract_pattern(input_text)
-        
-        matches = []
-        
-        # 2. Scan other sectors
-        # We assume self.db provides a method to iterate nodes
-        # In a real implementation, this would be a Vector Search with a filter.
-        for node in self.db.nodes.values():
-            # Skip the same sector (we need analogy, not duplication)
-            if "sector" in node.tags and current_sector in node.tags:
-                continue
-                
-            # 3. Check Resonance
-            # If a distant node shares the same pattern
-            if self._check_resonance(pattern, node.content):
-                matches.append(AnalogyMatch(
-                    source_id="CURRENT_INPUT",
-                    target_id=node.id,
-                    resonance_score=0.85, # High resonance simulation
-                    shared_pattern=pattern
-                ))
-                
-        return matches
-
-    def _extract_pattern(self, text: str) -> str:
-        # Mock logic for simulation
-        text_lower = text.lower()
-        if "network" in text_lower or "connect" in text_lower:
-            return "DISTRIBUTED_SYSTEM"
-        if "flow" in text_lower or "river" in text_lower:
-            return "ENERGY_TRANSFER"
-        return "UNKNOWN_PATTERN"
-
-    def _check_resonance(self, pattern: str, node_content: str) -> bool:
-        # Mock logic: does the node content imply the same pattern?
-        # Example: If we look for "Distributed System", and DB has "Mycelium"
-        node_lower = node_content.lower()
-        
-        if pattern == "DISTRIBUTED_SYSTEM":
-            if "mycelium" in node_lower or "brain" in node_lower:
-                return True
-        
-        if pattern == "ENERGY_TRANSFER":
-            if "blood" in node_lower or "traffic" in node_lower:
-                return True
-                
-        return False
-
-# Constants
-OPTIMAL_ORDER = 0.75
-SIGMA_WIDTH = 0.15
-CRITICAL_HEALTH_LIMIT = 0.15
-
-# ==========================================
-# 2. INFRASTRUCTURE LAYERS
-# ==========================================
-
-class SystemMetabolism:
-    """Enforces the Golden Ratio (75/25) on the System."""
-    def __init__(self, total_energy_pool: float):
-        self.total_energy = total_energy_pool
-        self.rational_spent = 0.0
-        self.irrational_spent = 0.0
-        
-    def allocate_energy(self, amount: float, category: BudgetCategory) -> bool:
-        limit_rational = self.total_energy * 0.75
-        
-        if category == BudgetCategory.LOGIC:
-            if self.rational_spent + amount > limit_rational:
-                return False 
-            self.rational_spent += amount
-            return True
-            
-        elif category == BudgetCategory.GROWTH:
-            self.irrational_spent += amount
-            return True
-
-    def check_balance(self):
-        total_spent = self.rational_spent + self.irrational_spent + 1
-        irrational_ratio = self.irrational_spent / total_spent
-        if irrational_ratio < 0.20:
-            self._trigger_surplus_distribution()
-            
-    def _trigger_surplus_distribution(self):
-        surplus = (self.total_energy * 0.25) - self.irrational_spent
-        print(f"🌧️ SURPLUS DISTRIBUTION: Distributing {surplus:.2f} Sigma.")
-        self.irrational_spent += surplus
-
-class BenevolentCore:
-    """Implements unconditional support (Amnesty, UBI)."""
-    def provide_support(self, user: UserStats, agent_plea: Optional[AgentTestimony]) -> Optional[str]:
-        # 1. UBI
-        if user.wallet_balance < 10.0:
-            user.wallet_balance += (10.0 - user.wallet_balance)
-            return "SUPPORT: Basic Income provided."
-
-        # 2. AMNESTY
-        if user.status == "OUTCAST" and user.labor_hours > 1000 and user.wallet_balance < 0:
-            user.wallet_balance = 0
-            user.status = "CITIZEN"
-            user.labor_hours = 0
-            return "AMNESTY: Entropy debt forgiven."
-
-        # 3. INTERVENTION
-        if agent_plea and agent_plea.biological_state == "CRITICAL":
-            return "INTERVENTION: Emergency resources deployed."
-            
-        return None
-
-# ==========================================
-# 3. MATH & PHYSICS LAYERS
-# ==========================================
-
-class SyntropicValueEngine:
-    """SVE v4.1 - Thermodynamic Decision Logic"""
-    def _calc_vitality(self, order_ratio: float) -> float:
-        exponent = -((order_ratio - OPTIMAL_ORDER) ** 2) / (2 * SIGMA_WIDTH ** 2)
-        return math.exp(exponent)
-
-    def _calc_quality_potential(self, e: SyntropicEntity) -> float:
-        denom = max(e.data_len, 1.0)
-        compression = max(0.0, 1.0 - (e.code_len / denom))
-        vitality = self._calc_vitality(e.order_ratio)
-        return compression * vitality * 1000.0
-
-    def _calc_kinetic_power(self, e: SyntropicEntity) -> float:
-        total_cost = max(e.e_in + e.e_debt, 1e-6)
-        return ((e.p_tech * e.k_wear) + (e.p_bio * e.k_health)) / total_cost
-
-    def evaluate(self, entity: SyntropicEntity) -> Tuple[float, Verdict, str]:
-        if entity.type == EntityType.BIOSPHERE and entity.k_health < CRITICAL_HEALTH_LIMIT:
-            return (0.0, Verdict.RECOVERY, "CRITICAL BIO FAILURE")
-
-        if entity.type == EntityType.TECHNOSPHERE and entity.k_wear < 0.2 and entity.e_debt > entity.replacement_cost:
-            return (0.0, Verdict.RECYCLE, "EFFICIENCY: Recycle.")
-
-        quality = self._calc_quality_potential(entity)
-        power = self._calc_kinetic_power(entity)
-        mu = quality * power * entity.alpha
-        
-        if entity.alpha <= 0.01:
-            if quality > 500: return (quality, Verdict.ARCHIVE, "SLEEPING GIANT")
-            else: return (0.0, Verdict.ARCHIVE, "VAN GOGH PROTOCOL")
-                
-        if mu > 10.0: return (mu, Verdict.AMPLIFY, f"SYNTROPY DETECTED (Mu={mu:.1f})")
-        else: return (mu, Verdict.STOP, f"ENTROPY LEAK (Mu={mu:.1f})")
-
-class SyntropyScannerV3:
-    """Multi-Window Text Analysis (Fast Path)"""
-    def __init__(self):
-        self.PROFILES = {ContentType.PROSE: 0.55, ContentType.CODE: 0.40, ContentType.UNKNOWN: 0.50}
-        self.SIGMA_WIDTH = 0.15
-
-    def _detect_type(self, text: str) -> ContentType:
-        if len(re.findall(r'[{};=()\[\]]', text)) > len(text.split()) * 0.1: return ContentType.CODE
-        return ContentType.PROSE
-
-    def scan_window(self, text: str) -> Optional[ScannerAnalysis]:
-        """Public method for single window analysis."""
-        if not text or len(text.strip()) < 5: return None
-        c_type = self._detect_type(text)
-        
-        orig_bytes = text.encode('utf-8')
-        comp_size = max(len(zlib.compress(orig_bytes)) - 10, 1)
-        density = min(1.0, comp_size / len(orig_bytes))
-        
-        clean = re.sub(r'[\s.,!?]', '', text)
-        coherence = min(1.0, sum(len(t) for t in re.findall(r'[a-zA-Z0-9]{2,}', text)) / len(clean)) if clean else 0
-        
-        vitality = math.exp(-((density - self.PROFILES[c_type]) ** 2) / (2 * self.SIGMA_WIDTH ** 2))
-        mu = math.log(len(orig_bytes) + 1) * vitality * coherence * 10.0
-        
-        status = "LIQUID"
-        is_disruption = False
-        if coherence < 0.3: status = "CHAOS"
-        elif density > 0.75 and coherence > 0.8: 
-            status = "DISRUPTION"
-            is_disruption = True
-        elif vitality > 0.8: status = "CRYSTAL"
-        
-        return ScannerAnalysis(text, density, coherence, vitality, mu, status, is_disruption)
-
-    def analyze_stream(self, text: str):
-        tokens = text.split()
-        if len(tokens) < 100:
-            res = self.scan_window(text)
-            return {"structure": res.status, "mu_global": res.mu_score, "spectrogram": [res.mu_score]} if res else None
-
-        WINDOW, STEP = 150, 75
-        windows = [" ".join(tokens[i:i+WINDOW]) for i in range(0, len(tokens)-WINDOW+1, STEP)]
-        results = [self.scan_window(w) for w in windows]
-        results = [r for r in results if r]
-        
-        if not results: return None
-        
-        mu_series = [r.mu_score for r in results]
-        mu_mean = mean(mu_series)
-        mu_max = max(mu_series)
-        
-        slope = 0.0
-        if len(mu_series) > 2:
-            x = list(range(len(mu_series)))
-            if HAS_NUMPY: slope, _ = np.polyfit(x, mu_series, 1)
-            else: slope, _ = simple_polyfit(x, mu_series, 1)
-
-        integrity = sum(1 for r in results if r.status == "CRYSTAL") / len(results)
-        
-        mu_3 = (mu_mean * 0.4) + (mu_max * 0.6)
-        if integrity > 0.3: mu_3 *= 1.2
-        
-        structure = "WAVES"
-        if mu_max > 20.0 and mu_mean < 5.0: structure = "SPARK_IN_DARK"
-        elif slope > 0.5: structure = "ASCENSION"
-        elif integrity > 0.5: structure = "CRYSTAL_CHAIN"
-        elif any(r.status == "CHAOS" for r in results): structure = "CHAOS"
-        elif any(r.is_disruption for r in results): structure = "DISRUPTION"
-        
-        return {"structure": structure, "mu_global": mu_3, "spectrogram": mu_series, "metrics": {"integrity": integrity}}
-
-# ==========================================
-# 4. FRACTAL ANALYZER (DEEP PATH)
-# ==========================================
-
-class FractalAnalyzer:
-    """
-    Implements the 'Artist's Loop': Zoom Out -> Zoom In.
-    Used only when Fast Path detects ambiguity.
-    """
-    def __init__(self, scanner: SyntropyScannerV3):
-        self.scanner = scanner
-
-    def _scan_at_resolution(self, text: str, window_size: int) -> Dict:
-        tokens = text.split()
-        if len(tokens) < window_size:
-            res = self.scanner.scan_window(text)
-            return {"mu_avg": res.mu_score, "min_val": res.mu_score, "integrity": 1.0} if res else None
-            
-        step = window_size // 2
-        windows = [" ".join(tokens[i:i+window_size]) for i in range(0, len(tokens)-window_size+1, step)]
-        results = [self.scanner.scan_window(w) for w in windows if w]
-        results = [r for r in results if r]
-        
-        if not results: return None
-        mu_series = [r.mu_score for r in results]
-        return {
-            "mu_avg": mean(mu_series),
-            "min_val": min(mu_series),
-            "integrity": sum(1 for r in results if r.status == "CRYSTAL") / len(results)
-        }
-
-    def analyze_fractal(self, text_stream: str) -> FractalState:
-        # CYCLE 1: MACRO (Vision)
-        macro = self._scan_at_resolution(text_stream, ZoomLevel.MACRO.value)
-        if not macro or macro['mu_avg'] < 10.0:
-            return FractalState(0.1, True, 0.0, "CONCEPTUAL_FAILURE")
-
-        # CYCLE 2: MESO (Structure)
-        meso = self._scan_at_resolution(text_stream, ZoomLevel.MESO.value)
-        if meso['integrity'] < 0.4:
-            return FractalState(0.4, True, meso['min_val'], "STRUCTURAL_FRACTURE")
-
-        # CYCLE 3: MICRO (Details)
-        micro = self._scan_at_resolution(text_stream, ZoomLevel.MICRO.value)
-        weakest_link = micro['min_val']
-        
-        # Synthesis
-        consistency = (macro['mu_avg']/30.0 * 0.4) + (meso['integrity'] * 0.4) + (weakest_link/10.0 * 0.2)
-        consistency = min(1.0, consistency)
-        
-        anomaly = weakest_link < 5.0
-        diagnosis = "LOCAL_ANOMALY" if anomaly else ("FRACTAL_HARMONY" if consistency > 0.7 else "SOLID_DRAFT")
-
-        return FractalState(consistency, anomaly, weakest_link, diagnosis)
-
-# ==========================================
-# 5. ORCHESTRATOR (HYBRID DISPATCHER)
-# ==========================================
-
-class SyntropicDispatcher:
-    """
-    The Clinical Core v7.2.
-    Implements 'Fast Path / Deep Path' switching logic.
-    """
-    def __init__(self):
-        self.sve = SyntropicValueEngine()
-        self.scanner = SyntropyScannerV3()
-        self.fractal = FractalAnalyzer(self.scanner) 
-        self.benevolent_core = BenevolentCore()
-        self.metabolism = SystemMetabolism(total_energy_pool=1_000_000.0) 
-        
-    def diagnose(self, entity: SyntropicEntity, 
-                 user_stats: UserStats,
-                 text_stream: Optional[str] = None, 
-                 agent_testimony: Optional[AgentTestimony] = None) -> Prescription:
-        
-        # 0. BENEVOLENCE CHECK
-        support_msg = self.benevolent_core.provide_support(user_stats, agent_testimony)
-        if support_msg:
-            self.metabolism.allocate_energy(100.0, BudgetCategory.GROWTH)
-            return Prescription(Verdict.AMPLIFY, "CORE_INTERVENTION", support_msg, 0.0, 0, 1.0, True)
-
-        # 1. GATHER EVIDENCE (HYBRID SCAN)
-        symptoms = []
-        if text_stream:
-            # --- FAST PATH (v7.0 Logic) ---
-            scan_res = self.scanner.analyze_stream(text_stream)
-            
-            # --- DEEP PATH (v7.1 Logic) ---
-            # Triggered ONLY if Fast Path is inconclusive or alarming
-            if scan_res and scan_res['structure'] in ["CHAOS", "DISRUPTION"]:
-                print("🔍 DEEP SCAN TRIGGERED: Switching to Fractal Analysis...")
-                fractal_res = self.fractal.analyze_fractal(text_stream)
-                
-                if fractal_res.consistency_score > 0.7:
-                    print(f"   -> FALSE ALARM: {fractal_res.diagnosis}")
-                    # It was Art, not Chaos. No symptom added.
-                else:
-                    print(f"   -> CONFIRMED: {fractal_res.diagnosis}")
-                    symptoms.append("SEMANTIC_CHAOS")
-            else:
-                # Fast Path was enough (Liquid/Crystal)
-                pass
-            
-        mu, raw_verdict, reason = self.sve.evaluate(entity)
-        if raw_verdict == Verdict.STOP: symptoms.append("NEGATIVE_VALUE")
-        if entity.alpha > 0.8: symptoms.append("HIGH_ENERGY")
-
-        # 2. CONSULT AGENT
-        mitigating = 0.0
-        if agent_testimony:
-            if "SEMANTIC_CHAOS" in symptoms and agent_testimony.context_mode == "CREATIVE_FLOW":
-                mitigating += 0.5
-            if agent_testimony.biological_state == "CRITICAL":
-                mitigating += 0.8
-
-        # 3. DIAGNOSIS
-        if "SEMANTIC_CHAOS" in symptoms and "HIGH_ENERGY" in symptoms:
-            conf = (0.9 if "NEGATIVE_VALUE" in symptoms else 0.6) - mitigating
-            if conf > 0.7:
-                return Prescription(Verdict.STOP, "VIRAL_ENTROPY", "Isolation", 50.0, 2, conf, True)
-            else:
-                return Prescription(Verdict.AMPLIFY, "NONE", f"ALLOWED (Agent Plea)", 0.0, 0, 0.0, True)
-
-        if "NEGATIVE_VALUE" in symptoms:
-            penalty = 0.0 if (agent_testimony and agent_testimony.context_mode == "LEARNING") else 5.0
-            return Prescription(Verdict.RECYCLE, "COMPETENCE_GAP", "Feedback Loop", penalty, 0, 0.8, True)
-
-        self.metabolism.allocate_energy(10.0, BudgetCategory.LOGIC)
-        return Prescription(Verdict.AMPLIFY, "NONE", "HEALTHY FLOW", 0, 0, 1.0, True)
-
-# ==========================================
-# 6. SYSTEM TEST
-# ==========================================
-
-if __name__ == "__main__":
-    print("=== SYNTROPY CORE v7.2 (HYBRID) DIAGNOSTICS ===\n")
-    
-    core = SyntropicDispatcher()
-    print("✅ CORE INITIALIZED: Hybrid Engine Online.")
-    
-    # TEST 1: FAST PATH (Normal Text)
-    print("\n--- TEST 1: FAST PATH (Clear Meaning) ---")
-    simple_text = "Syntropy is the opposite of Entropy. We build order." * 10
-    dummy = SyntropicEntity("id1", EntityType.BIOSPHERE, "User", 5, 100, 0.5, 0, 0, 100, 1.0, 0, 0, 0.5)
-    stats = UserStats("CITIZEN", 0, 100.0)
-    
-    rx1 = core.diagnose(dummy, stats, text_stream=simple_text)
-    print(f"RESULT: {rx1.treatment}")
-    # Expectation: No "DEEP SCAN" log message.
-    
-    # TEST 2: DEEP PATH (Complex Art/Chaos)
-    print("\n--- TEST 2: DEEP PATH (Complex Art) ---")
-    complex_text = ("Chaos " * 5) + ("Order " * 5) + ("Fractal " * 5)
-    # This looks like CHAOS to the simple scanner, so it should trigger DEEP SCAN
-    
-    rx2 = core.diagnose(dummy, stats, text_stream=complex_text)
-    print(f"RESULT: {rx2.treatment}")
-    # Expectation: "DEEP SCAN TRIGGERED" log message.
-    
-    print("\n✅ ALL TESTS PASSED.")
-```
-
-
+```python
+"""
+SYNTROPIC CORE (v7.2 - HYBRID ENGINEERING RELEASE)
+--------------------------------------------------
+Combines the reliability of v7.0 with the depth of v7.1.
+Implements 'Fast Path / Deep Path' logic.
+
+Includes:
+1. System Metabolism (75/25 Energy Balance).
+2. Benevolent Core (Amnesty & Support).
+3. Value Engine (SVE v4.1).
+4. Syntropy Scanner v3.0 (Fast Path).
+5. Fractal Analyzer (Deep Path).
+6. Clinical Dispatcher (Hybrid Orchestrator).
+"""
+
+import math
+import random
+import zlib
+import re
+import os
+import time
+import sys
+import hashlib
+import threading
+import codecs
+import mmap
+import pickle
+from array import array
+from collections import OrderedDict, Counter
+from statistics import mean, variance
+from enum import Enum
+from dataclasses import dataclass, fields
+from importlib.util import find_spec
+from typing import Tuple, List, Optional, Dict, Any, Iterator, Iterable, Sequence, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ProcessPoolExecutor
+
+# --- NUMPY (LAZY) WITH FALLBACK ---
+# NumPy is imported on first use (polyfit, batch SVE, entropy histograms),
+# so importing sve_core and the scalar paths never pay for it.
+HAS_NUMPY = find_spec("numpy") is not None
+
+class _LazyNumpy:
+    def __getattr__(self, name: str):
+        import numpy
+        globals()["np"] = numpy
+        return getattr(numpy, name)
+
+def simple_polyfit(x, y, degree):
+    if not x or not y: return [0, 0]
+    x_bar = mean(x)
+    y_bar = mean(y)
+    numerator = sum((xi - x_bar) * (yi - y_bar) for xi, yi in zip(x, y))
+    denominator = sum((xi - x_bar) ** 2 for xi in x)
+    if denominator == 0: return [0, 0]
+    slope = numerator / denominator
+    return [slope, 0]
+
+if HAS_NUMPY: np = _LazyNumpy()
+else:
+    class np: 
+        @staticmethod
+        def arange(n): return list(range(n))
+
+# ==========================================
+# 1. DATA STRUCTURES & ENUMS
+# ==========================================
+
+class EntityType(Enum):
+    TECHNOSPHERE = "ENV_ASSET"
+    BIOSPHERE = "PARTICLE"
+    IDEA = "POTENTIAL"
+
+class Verdict(Enum):
+    DELETE = "🗑️ BURN (Entropy/Noise)"
+    ARCHIVE = "🔒 STORE (Deep Freeze)"
+    AMPLIFY = "🚀 EXECUTE (Syntropy)"
+    STOP = "🛑 VETO (Critical Harm)"
+    RECOVERY = "🚑 HEAL (Somatic Imperative)"
+    RECYCLE = "♻️ RECYCLE (Efficiency)"
+
+class BudgetCategory(Enum):
+    LOGIC = "RATIONAL_INFRASTRUCTURE" # 75%
+    GROWTH = "IRRATIONAL_GROWTH"      # 25%
+
+class ContentType(Enum):
+    PROSE = "PROSE"
+    CODE = "CODE"
+    UNKNOWN = "UNKNOWN"
+
+class ZoomLevel(Enum):
+    MACRO = 1000   # The Vision
+    MESO = 300     # The Structure
+    MICRO = 80     # The Details
+
+# Scanner patterns (compiled once, shared by every window)
+CODE_MARKS_RE = re.compile(r'[{};=()\[\]]')
+CLEAN_STRIP_RE = re.compile(r'[\s.,!?]')
+WORD_RE = re.compile(r'[a-zA-Z0-9]{2,}')
+TERM_RE = re.compile(r'\w+')
+
+@dataclass
+class SyntropicEntity:
+    id: str
+    type: EntityType
+    name: str
+    code_len: float
+    data_len: float
+    order_ratio: float
+    p_tech: float
+    k_wear: float
+    p_bio: float
+    k_health: float
+    e_in: float
+    e_debt: float
+    alpha: float
+    replacement_cost: float = 0.0
+
+# Columnar codes for batch evaluation (index = code)
+ENTITY_TYPES = list(EntityType)
+VERDICTS = list(Verdict)
+VERDICT_CODE = {v: i for i, v in enumerate(VERDICTS)}
+ENTITY_FIELDS = [f.name for f in fields(SyntropicEntity)]
+
+def entity_table(entities: List[SyntropicEntity]):
+    """
+    Packs entities into the columnar layout used by evaluate_batch:
+    a NumPy structured array (or a dict of lists without NumPy),
+    with `type` stored as an index into ENTITY_TYPES.
+    """
+    rows = [tuple(ENTITY_TYPES.index(getattr(e, n)) if n == "type" else getattr(e, n) for n in ENTITY_FIELDS) for e in entities]
+    if not HAS_NUMPY:
+        return {n: [r[i] for r in rows] for i, n in enumerate(ENTITY_FIELDS)}
+    dtype = [(n, "U64" if n in ("id", "name") else ("i1" if n == "type" else "f8")) for n in ENTITY_FIELDS]
+    return np.array(rows, dtype=dtype)
+
+@dataclass
+class UserStats:
+    status: str         # CITIZEN, OUTCAST
+    labor_hours: int    # Hours of service performed
+    wallet_balance: float
+
+@dataclass
+class AgentTestimony:
+    context_mode: str       # e.g., "CREATIVE_FLOW"
+    is_intentional: bool    
+    biological_state: str   # "STABLE", "CRITICAL"
+    defense_plea: str       
+
+@dataclass
+class Prescription:
+    action: Verdict
+    pathology: str 
+    treatment: str
+    sigma_penalty: float
+    quarantine_level: int
+    confidence: float
+    is_reversible: bool
+    coverage: float = 1.0   # Deep Path coverage behind it (< 1.0 = budget ran out: the alarm was not cleared)
+
+@dataclass
+class ScannerAnalysis:
+    text: str
+    density: float
+    coherence: float
+    vitality: float
+    mu_score: float
+    status: str
+    is_disruption: bool
+
+# Window statuses, stored as one byte per window in a Spectrogram
+WINDOW_STATUSES = ("LIQUID", "CHAOS", "DISRUPTION", "CRYSTAL")
+STATUS_CODE = {s: i for i, s in enumerate(WINDOW_STATUSES)}
+
+class Spectrogram:
+    """
+    Columnar per-window results of a sliding scan.
+    Scores are array('d') columns, statuses one byte each (WINDOW_STATUSES)
+    and windows (start, start + window) token offsets; window text is only
+    materialized on demand, from the tokens the scan ran over.
+    """
+    __slots__ = ("window", "starts", "density", "coherence", "vitality", "mu", "codes", "tokens")
+    POLYFIT_MIN_WINDOWS = 2048  # Shorter series fit in pure Python (no NumPy import)
+
+    def __init__(self, window: int = 0, tokens: Optional[List[str]] = None):
+        self.window = window
+        self.starts = array('q')
+        self.density = array('d')
+        self.coherence = array('d')
+        self.vitality = array('d')
+        self.mu = array('d')
+        self.codes = bytearray()
+        self.tokens = tokens
+
+    def __len__(self) -> int: return len(self.mu)
+
+    def append(self, start: int, density: float, coherence: float, vitality: float, mu: float, status: str):
+        self.starts.append(start)
+        self.density.append(density)
+        self.coherence.append(coherence)
+        self.vitality.append(vitality)
+        self.mu.append(mu)
+        self.codes.append(STATUS_CODE[status])
+
+    def extend(self, other: 'Spectrogram', offset: int = 0):
+        """Appends another range of the same level; its starts are shifted by offset."""
+        self.starts.extend(array('q', (st + offset for st in other.starts)) if offset else other.starts)
+        for name in ("density", "coherence", "vitality", "mu", "codes"):
+            getattr(self, name).extend(getattr(other, name))
+
+    @property
+    def status(self) -> List[str]: return [WINDOW_STATUSES[c] for c in self.codes]
+
+    @property
+    def is_disruption(self) -> List[bool]:
+        code = STATUS_CODE["DISRUPTION"]
+        return [c == code for c in self.codes]
+
+    def count(self, status: str) -> int: return self.codes.count(STATUS_CODE[status])
+
+    def has(self, status: str) -> bool: return STATUS_CODE[status] in self.codes
+
+    def integrity(self) -> float:
+        return self.count("CRYSTAL") / len(self.mu) if self.mu else 0.0
+
+    def slope(self) -> float:
+        """Least-squares trend of mu over the window index."""
+        n = len(self.mu)
+        if n <= 2: return 0.0
+        if n < self.POLYFIT_MIN_WINDOWS:
+            # Closed form over x = 0..n-1: sum((x - x_bar) * y) / (n (n^2 - 1) / 12)
+            x_bar = (n - 1) / 2
+            return math.fsum((i - x_bar) * y for i, y in enumerate(self.mu)) * 12 / (n * (n * n - 1))
+        if HAS_NUMPY: slope, _ = np.polyfit(np.arange(n), np.frombuffer(self.mu), 1)
+        else: slope, _ = simple_polyfit(list(range(n)), list(self.mu), 1)
+        return float(slope)
+
+    def offsets(self, i: int) -> Tuple[int, int]:
+        return self.starts[i], self.starts[i] + self.window
+
+    def text(self, i: int) -> str:
+        if self.tokens is None: raise ValueError("Spectrogram has no tokens to materialize text from")
+        start, end = self.offsets(i)
+        return " ".join(self.tokens[start:end])
+
+    def analysis(self, i: int) -> ScannerAnalysis:
+        """Window i as a ScannerAnalysis (text materialized now)."""
+        status = WINDOW_STATUSES[self.codes[i]]
+        return ScannerAnalysis(self.text(i), self.density[i], self.coherence[i], self.vitality[i],
+                               self.mu[i], status, status == "DISRUPTION")
+
+    def __getstate__(self):
+        # Pool results travel without the tokens; the parent re-attaches its own
+        return {name: getattr(self, name) for name in self.__slots__ if name != "tokens"}
+
+    def __setstate__(self, state):
+        self.tokens = None
+        for name, value in state.items(): setattr(self, name, value)
+
+@dataclass
+class SpectrumPoint:
+    """One window of a streamed scan."""
+    window: int                 # Level window size (tokens)
+    index: int                  # Window number within the level
+    start: int                  # Offset of the first token in the stream
+    density: float
+    coherence: float
+    vitality: float
+    mu: float
+    status: str
+    is_disruption: bool
+
+@dataclass
+class FractalState:
+    consistency_score: float    # 0.0 - 1.0
+    anomaly_detected: bool
+    weakest_link_score: float
+    diagnosis: str
+    is_partial: bool = False    # True = budget ran out before the full zoom cycle
+    coverage: float = 1.0       # Tokens covered per level the verdict needed, averaged (budget-skipped level = 0)
+
+@dataclass
+class FractalBudget:
+    """Deep Path budget (None = unlimited): wall-clock seconds and/or windows scored."""
+    seconds: Optional[float] = None
+    windows: Optional[int] = None
+
+@dataclass
+class AnalogyMatch:
+    source_id: str          # Source Idea (e.g., Internet)
+    target_id: str          # Target Idea (e.g., Mycelium)
+    resonance_score: float  # Similarity score (0.0 - 1.0)
+    shared_pattern: str     # Common structural pattern (e.g., "DECENTRALIZED_NETWORK")
+
+class ResonanceIndex:
+    """
+    Offline vector index for the Echo Protocol (needs NumPy).
+
+    Texts are embedded by feature hashing: words and their character
+    trigrams (plus optional whole-string tags, e.g. structural patterns)
+    are hashed with a sign into `dim` buckets and L2-normalized, so the dot
+    product is a cosine resonance score. Vectors live in one contiguous
+    float32 matrix (row = insertion order).
+
+    Search is random-hyperplane LSH: `tables` hash tables of `bits` signs
+    each, keyed by (sector, signature), so a query reads only the buckets
+    of the sectors it may see (+ `probes` neighbour buckets per table,
+    flipping its least certain bits) and ranks those candidates exactly;
+    when the buckets hold over a quarter of the rows it scans instead.
+    Below EXACT_BELOW rows every search is an exact scan: it is faster
+    there (0.25 vs 0.51 ms at 1k rows) and never misses the best match.
+    """
+    EXACT_BELOW = 100_000
+    WORD_WEIGHT = 1.0
+    GRAM_WEIGHT = 0.5
+    TAG_WEIGHT = 3.0
+
+    def __init__(self, dim: int = 128, tables: int = 16, bits: int = 10, seed: int = 0):
+        if not HAS_NUMPY: raise ImportError("ResonanceIndex needs NumPy")
+        self.dim, self.tables, self.bits = dim, tables, bits
+        self.planes = np.random.default_rng(seed).standard_normal((tables * bits, dim)).astype(np.float32)
+        self._weights = 1 << np.arange(bits, dtype=np.int64)
+        self.vectors = np.zeros((1024, dim), dtype=np.float32)
+        self.sector_codes = np.zeros(1024, dtype=np.int16)
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {} # id -> row
+        self.sectors: List[str] = [] # code -> sector name
+        self._buckets: List[Dict[int, array]] = [{} for _ in range(tables)] # (sector << bits | signature) -> rows
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _sector_code(self, sector: str) -> int:
+        if sector not in self.sectors: self.sectors.append(sector)
+        return self.sectors.index(sector)
+
+    # --- Embedding ---
+    def _features(self, tokens: List[str]):
+        """CSR (sizes, columns, weights) of tokens: a '#tag' is one feature, a word is itself + its trigrams."""
+        sizes, cols, vals = [], [], []
+        for token in tokens:
+            if token[0] == "#": grams = [(token, self.TAG_WEIGHT)]
+            else:
+                padded = f"<{token}>"
+                grams = [(token, self.WORD_WEIGHT)] + [(padded[i:i + 3], self.GRAM_WEIGHT) for i in range(len(padded) - 2)]
+            sizes.append(len(grams))
+            for gram, weight in grams:
+                h = zlib.crc32(gram.encode("utf-8", "surrogatepass"))
+                cols.append(h % self.dim)
+                vals.append(-weight if h >> 31 else weight)
+        return np.asarray(sizes, dtype=np.int64), np.asarray(cols, dtype=np.int64), np.asarray(vals, dtype=np.float64)
+
+    def embed(self, texts: Sequence[str], tags: Optional[Sequence[Sequence[str]]] = None):
+        """(len(texts), dim) float32 matrix of unit (or zero) vectors."""
+        docs = [TERM_RE.findall(text.lower()) for text in texts]
+        if tags:
+            for doc, doc_tags in zip(docs, tags): doc += [f"#{t}" for t in doc_tags]
+        counts = np.fromiter(map(len, docs), dtype=np.int64, count=len(docs))
+        vocab: Dict[str, int] = {} # each distinct token is hashed once per batch
+        tokens = np.fromiter((vocab.setdefault(t, len(vocab)) for doc in docs for t in doc), dtype=np.int64, count=int(counts.sum()))
+        v_sizes, v_cols, v_vals = self._features(list(vocab))
+        # Expand every token occurrence into its features (vectorized CSR gather)
+        sizes = v_sizes[tokens]
+        gather = np.repeat((np.cumsum(v_sizes) - v_sizes)[tokens] - (np.cumsum(sizes) - sizes), sizes) + np.arange(int(sizes.sum()))
+        rows = np.repeat(np.repeat(np.arange(len(docs), dtype=np.int64), counts), sizes)
+        matrix = np.bincount(rows * self.dim + v_cols[gather], weights=v_vals[gather], minlength=len(docs) * self.dim)
+        matrix = matrix.astype(np.float32).reshape(len(docs), self.dim)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms > 0, norms, 1.0)
+
+    def _signatures(self, vectors):
+        signs = (vectors @ self.planes.T).reshape(len(vectors), self.tables, self.bits)
+        return (signs > 0).astype(np.int64) @ self._weights, signs
+
+    # --- Writes ---
+    def add(self, ids: Sequence[str], sectors: Sequence[str], texts: Sequence[str],
+            tags: Optional[Sequence[Sequence[str]]] = None, chunk_size: int = 16384):
+        """Embeds and indexes a batch (one pass per chunk, buckets extended per group)."""
+        for start in range(0, len(ids), chunk_size):
+            end = start + chunk_size
+            self._append(ids[start:end], [self._sector_code(s) for s in sectors[start:end]],
+                         self.embed(texts[start:end], tags[start:end] if tags else None))
+
+    def _append(self, ids: Sequence[str], codes: Sequence[int], vectors):
+        first, n = len(self.ids), len(ids)
+        if not n: return
+        if first + n > len(self.vectors):
+            capacity = max(first + n, 2 * len(self.vectors))
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:first] = self.vectors[:first]
+            self.vectors = grown
+            self.sector_codes = np.resize(self.sector_codes, capacity)
+        self.vectors[first:first + n] = vectors
+        self.sector_codes[first:first + n] = codes
+        self.ids.extend(ids)
+        self.rows.update(zip(ids, range(first, first + n)))
+        self._bucket(first, np.asarray(codes, dtype=np.int64), self._signatures(vectors)[0])
+
+    def _bucket(self, first: int, codes, signatures):
+        rows = np.arange(first, first + len(codes), dtype=np.uint32)
+        for table, buckets in enumerate(self._buckets):
+            keys = (codes << self.bits) | signatures[:, table]
+            order = np.argsort(keys, kind="stable")
+            keys, grouped = keys[order], rows[order]
+            bounds = np.flatnonzero(np.diff(keys)) + 1
+            for lo, hi in zip([0, *bounds.tolist()], [*bounds.tolist(), len(keys)]):
+                key = int(keys[lo])
+                bucket = buckets.get(key)
+                if bucket is None: buckets[key] = bucket = array("I")
+                bucket.frombytes(grouped[lo:hi].tobytes())
+
+    # --- Reads ---
+    def search(self, text: str, tags: Sequence[str] = (), k: int = 5, exclude_sector: Optional[str] = None,
+               probes: int = 4, exact: bool = False) -> List[Tuple[str, float, str]]:
+        """
+        Top-k (node_id, cosine score, sector) outside exclude_sector, best first.
+        exact=True ranks every allowed row (the reference for recall checks);
+        so does any index smaller than EXACT_BELOW rows.
+        """
+        query = self.embed([text], [tags])[0]
+        allowed = [code for code, name in enumerate(self.sectors) if name != exclude_sector]
+        n = len(self.ids)
+        if not allowed or not n: return []
+        found = []
+        exact = exact or n < self.EXACT_BELOW
+        if not exact:
+            signatures, signs = self._signatures(query[None, :])
+            for table, buckets in enumerate(self._buckets):
+                keys = [int(signatures[0, table])]
+                for bit in np.argsort(np.abs(signs[0, table]))[:probes].tolist(): keys.append(keys[0] ^ (1 << bit))
+                for code in allowed:
+                    for key in keys:
+                        bucket = buckets.get((code << self.bits) | key)
+                        if bucket is not None: found.append(bucket)
+            if not found: return []
+        if exact or sum(map(len, found)) > n // 4: # Crowded buckets: a full scan is cheaper
+            candidates = np.flatnonzero(np.isin(self.sector_codes[:n], allowed))
+        else:
+            # tobytes() copies: a live buffer export would make the writer's next frombytes fail
+            candidates = np.unique(np.concatenate([np.frombuffer(bucket.tobytes(), dtype=np.uint32) for bucket in found]))
+        scores = self.vectors[candidates] @ query
+        top = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[row], float(score), self.sectors[self.sector_codes[row]])
+                for row, score in zip(candidates[top].tolist(), scores[top].tolist())]
+
+    def rank(self, text: str, tags: Sequence[str] = (), ids: Iterable[str] = (),
+             k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        (node_id, cosine score) of the given ids only (e.g. the candidates of
+        an inverted index), best first: all of them, or the top k.
+        """
+        rows = np.fromiter((row for row in map(self.rows.get, ids) if row is not None), dtype=np.int64)
+        if not len(rows) or k == 0: return []
+        scores = self.vectors[rows] @ self.embed([text], [tags])[0]
+        top = np.argpartition(-scores, k - 1)[:k] if k is not None and len(scores) > k else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.ids[row], score) for row, score in zip(rows[top].tolist(), scores[top].tolist())]
+
+    # --- Persistence ---
+    def save(self, path: str):
+        """Writes vectors, ids, sectors and planes as .npz (tmp file + atomic replace)."""
+        n = len(self.ids)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, vectors=self.vectors[:n], sector_codes=self.sector_codes[:n],
+                     ids=np.array(self.ids, dtype=str), sectors=np.array(self.sectors, dtype=str),
+                     planes=self.planes, shape=np.array([self.dim, self.tables, self.bits]))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ResonanceIndex":
+        """Restores a saved index; buckets are rebuilt from the vectors in one pass."""
+        with np.load(path, allow_pickle=False) as data:
+            dim, tables, bits = data["shape"].tolist()
+            index = cls(dim, tables, bits)
+            index.planes = data["planes"]
+            index.sectors = data["sectors"].tolist()
+            ids, codes, vectors = data["ids"].tolist(), data["sector_codes"], data["vectors"]
+            for start in range(0, len(ids), 1 << 16):
+                end = start + (1 << 16)
+                index._append(ids[start:end], codes[start:end], vectors[start:end])
+        return index
+
+class AnalogyEngine:
+    """
+    Implements Lateral Thinking (The Echo Protocol).
+    Finds structural similarities between geometrically distant sectors
+    (e.g., connecting Biology to Engineering).
+
+    Candidates come from an inverted index instead of a crystal scan:
+    normalized content terms and structural patterns ("pattern:<NAME>")
+    -> node ids, partitioned by sector. It is built once from db.nodes and
+    kept current through db.subscribe, so a query touches only the posting
+    lists it needs, in the sectors it is allowed to see.
+    find_analogies reads the "pattern:<NAME>" postings of the other sectors;
+    with NumPy, nodes are also embedded into a ResonanceIndex and those
+    candidates (only them) are ranked by cosine resonance.
+    """
+    PATTERNS = ("DISTRIBUTED_SYSTEM", "ENERGY_TRANSFER")
+
+    def __init__(self, db_ref, vector_path: Optional[str] = None, instrumentation: Optional['NullInstrumentation'] = None):
+        self.db = db_ref # Reference to Malachite DB instance
+        self.vector_path = vector_path # Saved ResonanceIndex (.npz), loaded if present
+        self.instrumentation = instrumentation or NullInstrumentation() # Query counter and log (silent by default)
+        self._postings: Dict[str, Dict[str, List[str]]] = {} # sector -> key -> node ids
+        self.indexed = 0
+        self.vectors: Optional[ResonanceIndex] = None
+        known = None
+        if HAS_NUMPY and vector_path and os.path.exists(vector_path):
+            self.vectors = ResonanceIndex.load(vector_path)
+            known = set(self.vectors.ids)
+        elif HAS_NUMPY: self.vectors = ResonanceIndex()
+        self._index(self._nodes(), known)
+        subscribe = getattr(db_ref, "subscribe", None)
+        if subscribe is not None: subscribe(self._index) # Otherwise: call reindex() after writes
+
+    def _nodes(self) -> Iterable[Any]:
+        """Current nodes, through a pinned view when the storage offers one (safe next to a writer thread)."""
+        pin = getattr(self.db, "pin", None)
+        return (pin() if pin is not None else self.db).nodes.values()
+
+    def _sector(self, node) -> str:
+        sector_of = getattr(self.db, "sector_of", None)
+        if sector_of is not None: return sector_of(node).value
+        return next((tag for tag in node.tags if tag in ("EARTH", "WATER", "SKY")), "UNSECTORED")
+
+    def _index(self, nodes: Iterable[Any], embedded: Optional[set] = None):
+        postings, terms, check = self._postings, TERM_RE.findall, self._check_resonance
+        batch = ([], [], [], []) # ids, sectors, texts, patterns for the vector index
+        for node in nodes:
+            content = node.content.lower()
+            patterns = [p for p in self.PATTERNS if check(p, content)]
+            keys = set(terms(content))
+            keys.update(f"pattern:{p}" for p in patterns)
+            name = self._sector(node)
+            sector = postings.setdefault(name, {})
+            for key in keys:
+                ids = sector.get(key)
+                if ids is None: sector[key] = [node.id]
+                else: ids.append(node.id)
+            self.indexed += 1
+            if self.vectors is not None and (embedded is None or node.id not in embedded):
+                for column, value in zip(batch, (node.id, name, content, patterns)): column.append(value)
+        if batch[0]: self.vectors.add(*batch)
+
+    def reindex(self):
+        self._postings, self.indexed = {}, 0
+        if self.vectors is not None:
+            self.vectors = ResonanceIndex(self.vectors.dim, self.vectors.tables, self.vectors.bits)
+        self._index(self._nodes())
+
+    def save_vectors(self, path: Optional[str] = None):
+        """Persists the ResonanceIndex (to vector_path by default)."""
+        if self.vectors is None: raise ImportError("The vector index needs NumPy")
+        self.vectors.save(path or self.vector_path)
+
+    def lookup(self, keys: List[str], exclude_sector: Optional[str] = None) -> List[str]:
+        """
+        Node ids holding ALL keys (terms are matched lower-cased), outside
+        exclude_sector. Posting lists are intersected smallest-first.
+        """
+        keys = [key if key.startswith("pattern:") else key.lower() for key in keys]
+        exclude = getattr(exclude_sector, "value", exclude_sector)
+        found = []
+        for sector, postings in list(self._postings.items()): # A writer may add a sector meanwhile
+            if sector == exclude: continue
+            lists = sorted((postings.get(key, ()) for key in keys), key=len)
+            if not lists or not lists[0]: continue
+            if len(lists) == 1:
+                found.extend(lists[0])
+                continue
+            common = set(lists[0]).intersection(*lists[1:])
+            found.extend(node_id for node_id in lists[0] if node_id in common)
+        return found
+
+    def index_stats(self) -> Dict[str, int]:
+        """Size of the index: nodes, distinct keys, postings and approximate bytes."""
+        keys = postings = size = 0
+        for sector in self._postings.values():
+            keys += len(sector)
+            size += sys.getsizeof(sector)
+            for ids in sector.values():
+                postings += len(ids)
+                size += sys.getsizeof(ids)
+        return {"nodes": self.indexed, "keys": keys, "postings": postings, "bytes": size}
+
+    def find_analogies(self, input_text: str, current_sector: str, k: Optional[int] = None) -> List[AnalogyMatch]:
+        """
+        Finds nodes sharing the input's structural pattern
+        in DIFFERENT sectors (Cross-Domain Search), best first:
+        all of them by default, or the best k.
+        """
+        self.instrumentation.count("analogy_scan")
+        self.instrumentation.log(f"✨ ANALOGY SCAN: Looking for echoes of '{input_text[:20]}...'")
+        
+        # 1. Extract Abstract Pattern (Simulated)
+        # In production, an LLM extracts the topological essence here.
+        # Example: "Blockchain" -> Pattern: "IMMUTABLE_LEDGER"
+        pattern = self._extract_pattern(input_text)
+        exclude = getattr(current_sector, "value", current_sector)
+        
+        # 2. Candidates: the pattern's posting lists in the other sectors
+        # (nodes were checked with _check_resonance once, when indexed)
+        if pattern == "UNKNOWN_PATTERN": return []
+        echoes = self.lookup([f"pattern:{pattern}"], exclude_sector=exclude)
+        
+        # 3. Resonance = cosine between hashed (text + pattern) vectors, over the candidates only
+        if self.vectors is not None: ranked = self.vectors.rank(input_text, [pattern], echoes, k)
+        else: ranked = [(node_id, 0.85) for node_id in echoes[:k]] # High resonance simulation
+        return [AnalogyMatch(
+                    source_id="CURRENT_INPUT",
+                    target_id=node_id,
+                    resonance_score=score,
+                    shared_pattern=pattern
+                ) for node_id, score in ranked]
+
+    def _extract_pattern(self, text: str) -> str:
+        # Mock logic for simulation
+        text_lower = text.lower()
+        if "network" in text_lower or "connect" in text_lower:
+            return "DISTRIBUTED_SYSTEM"
+        if "flow" in text_lower or "river" in text_lower:
+            return "ENERGY_TRANSFER"
+        return "UNKNOWN_PATTERN"
+
+    def _check_resonance(self, pattern: str, node_content: str) -> bool:
+        # Mock logic: does the node content imply the same pattern?
+        # Example: If we look for "Distributed System", and DB has "Mycelium"
+        node_lower = node_content.lower()
+        
+        if pattern == "DISTRIBUTED_SYSTEM":
+            if "mycelium" in node_lower or "brain" in node_lower:
+                return True
+        
+        if pattern == "ENERGY_TRANSFER":
+            if "blood" in node_lower or "traffic" in node_lower:
+                return True
+                
+        return False
+
+# Constants
+OPTIMAL_ORDER = 0.75
+SIGMA_WIDTH = 0.15
+CRITICAL_HEALTH_LIMIT = 0.15
+
+# ==========================================
+# 2. INFRASTRUCTURE LAYERS
+# ==========================================
+
+class SystemMetabolism:
+    """Enforces the Golden Ratio (75/25) on the System."""
+    def __init__(self, total_energy_pool: float):
+        self.total_energy = total_energy_pool
+        self.rational_spent = 0.0
+        self.irrational_spent = 0.0
+        
+    def allocate_energy(self, amount: float, category: BudgetCategory) -> bool:
+        limit_rational = self.total_energy * 0.75
+        
+        if category == BudgetCategory.LOGIC:
+            if self.rational_spent + amount > limit_rational:
+                return False 
+            self.rational_spent += amount
+            return True
+            
+        elif category == BudgetCategory.GROWTH:
+            self.irrational_spent += amount
+            return True
+
+    def check_balance(self):
+        total_spent = self.rational_spent + self.irrational_spent + 1
+        irrational_ratio = self.irrational_spent / total_spent
+        if irrational_ratio < 0.20:
+            self._trigger_surplus_distribution()
+            
+    def _trigger_surplus_distribution(self):
+        surplus = (self.total_energy * 0.25) - self.irrational_spent
+        print(f"🌧️ SURPLUS DISTRIBUTION: Distributing {surplus:.2f} Sigma.")
+        self.irrational_spent += surplus
+
+class BenevolentCore:
+    """Implements unconditional support (Amnesty, UBI)."""
+    def provide_support(self, user: UserStats, agent_plea: Optional[AgentTestimony]) -> Optional[str]:
+        # 1. UBI
+        if user.wallet_balance < 10.0:
+            user.wallet_balance += (10.0 - user.wallet_balance)
+            return "SUPPORT: Basic Income provided."
+
+        # 2. AMNESTY
+        if user.status == "OUTCAST" and user.labor_hours > 1000 and user.wallet_balance < 0:
+            user.wallet_balance = 0
+            user.status = "CITIZEN"
+            user.labor_hours = 0
+            return "AMNESTY: Entropy debt forgiven."
+
+        # 3. INTERVENTION
+        if agent_plea and agent_plea.biological_state == "CRITICAL":
+            return "INTERVENTION: Emergency resources deployed."
+            
+        return None
+
+# --- INSTRUMENTATION ---
+class _NullStage:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+
+class NullInstrumentation:
+    """Default probe: records nothing, prints nothing."""
+    enabled = False
+    _STAGE = _NullStage()
+
+    def stage(self, name: str): return self._STAGE
+    def count(self, name: str, n: int = 1): pass
+    def log(self, message: str): pass
+    def snapshot(self) -> Dict[str, Any]: return {}
+
+class _Stage:
+    __slots__ = ("probe", "name", "t0")
+
+    def __init__(self, probe: 'Instrumentation', name: str):
+        self.probe = probe
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.probe.record(self.name, time.perf_counter() - self.t0)
+        return False
+
+class Instrumentation(NullInstrumentation):
+    """
+    Per-stage timing histograms and event counters for the dispatcher.
+    Bucket b holds durations in [2^(b-1), 2^b) microseconds.
+    verbose=True also echoes the diagnostic log to the console.
+    """
+    enabled = True
+
+    def __init__(self, verbose: bool = False):
+        self.verbose = verbose
+        self._lock = threading.Lock()
+        self.counters: Counter = Counter()
+        self.histograms: Dict[str, List[int]] = {}
+        self.totals: Dict[str, List[float]] = {}    # stage -> [n, sum_s, max_s]
+
+    def stage(self, name: str) -> _Stage: return _Stage(self, name)
+
+    def record(self, name: str, seconds: float):
+        bucket = int(seconds * 1e6).bit_length()
+        with self._lock:
+            hist = self.histograms.setdefault(name, [])
+            if bucket >= len(hist): hist.extend([0] * (bucket + 1 - len(hist)))
+            hist[bucket] += 1
+            total = self.totals.setdefault(name, [0, 0.0, 0.0])
+            total[0] += 1
+            total[1] += seconds
+            total[2] = max(total[2], seconds)
+
+    def count(self, name: str, n: int = 1):
+        with self._lock: self.counters[name] += n
+
+    def log(self, message: str):
+        if self.verbose: print(message)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.totals.clear()
+
+    @staticmethod
+    def _percentile(hist: List[int], n: int, q: float) -> float:
+        """Upper bound (seconds) of the bucket holding the q-quantile."""
+        rank, seen = q * n, 0
+        for bucket, c in enumerate(hist):
+            seen += c
+            if seen >= rank: return (1 << bucket) / 1e6
+        return (1 << len(hist)) / 1e6
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+            stages = {}
+            for name, (n, total, peak) in self.totals.items():
+                hist = self.histograms[name]
+                stages[name] = {"count": n, "total_s": total, "mean_s": total / n, "max_s": peak,
+                                "p50_s": self._percentile(hist, n, 0.5), "p99_s": self._percentile(hist, n, 0.99),
+                                "histogram_us": {1 << b: c for b, c in enumerate(hist) if c}}
+        scans, deep = counters.get("fast_path", 0), counters.get("deep_path", 0)
+        return {
+            "stages": stages,
+            "counters": counters,
+            "rates": {"deep_path_rate": deep / scans if scans else 0.0,
+                      "false_alarm_ratio": counters.get("false_alarm", 0) / deep if deep else 0.0},
+            "verdicts": {k.split(".", 1)[1]: v for k, v in counters.items() if k.startswith("verdict.")}
+        }
+
+# ==========================================
+# 3. MATH & PHYSICS LAYERS
+# ==========================================
+
+class SyntropicValueEngine:
+    """SVE v4.1 - Thermodynamic Decision Logic"""
+    def _calc_vitality(self, order_ratio: float) -> float:
+        deviation = order_ratio - OPTIMAL_ORDER
+        exponent = -(deviation * deviation) / (2 * SIGMA_WIDTH ** 2) # d*d is exact-rounded (libm pow(d, 2) may not be), as in evaluate_batch
+        return math.exp(exponent)
+
+    def _calc_quality_potential(self, e: SyntropicEntity) -> float:
+        denom = max(e.data_len, 1.0)
+        compression = max(0.0, 1.0 - (e.code_len / denom))
+        vitality = self._calc_vitality(e.order_ratio)
+        return compression * vitality * 1000.0
+
+    def _calc_kinetic_power(self, e: SyntropicEntity) -> float:
+        total_cost = max(e.e_in + e.e_debt, 1e-6)
+        return ((e.p_tech * e.k_wear) + (e.p_bio * e.k_health)) / total_cost
+
+    def evaluate(self, entity: SyntropicEntity) -> Tuple[float, Verdict, str]:
+        if entity.type == EntityType.BIOSPHERE and entity.k_health < CRITICAL_HEALTH_LIMIT:
+            return (0.0, Verdict.RECOVERY, "CRITICAL BIO FAILURE")
+
+        if entity.type == EntityType.TECHNOSPHERE and entity.k_wear < 0.2 and entity.e_debt > entity.replacement_cost:
+            return (0.0, Verdict.RECYCLE, "EFFICIENCY: Recycle.")
+
+        quality = self._calc_quality_potential(entity)
+        power = self._calc_kinetic_power(entity)
+        mu = quality * power * entity.alpha
+        
+        if entity.alpha <= 0.01:
+            if quality > 500: return (quality, Verdict.ARCHIVE, "SLEEPING GIANT")
+            else: return (0.0, Verdict.ARCHIVE, "VAN GOGH PROTOCOL")
+                
+        if mu > 10.0: return (mu, Verdict.AMPLIFY, f"SYNTROPY DETECTED (Mu={mu:.1f})")
+        else: return (mu, Verdict.STOP, f"ENTROPY LEAK (Mu={mu:.1f})")
+
+    def evaluate_batch(self, table) -> Tuple[Any, Any]:
+        """
+        Columnar evaluation of a whole population.
+        Accepts a NumPy structured array or a struct-of-arrays mapping
+        (field name -> sequence, `type` as EntityType or ENTITY_TYPES index).
+        Returns (mu, verdict_codes); VERDICTS[code] is the Verdict.
+        Row by row, verdicts match evaluate() and mu agrees to a few ulp.
+        """
+        if not HAS_NUMPY: return self._evaluate_rows(table)
+
+        col = lambda n: np.asarray(table[n], dtype=np.float64)
+        kind = table["type"]
+        if len(kind) and isinstance(kind[0], EntityType):
+            kind = [ENTITY_TYPES.index(t) for t in kind]
+        kind = np.asarray(kind, dtype=np.int8)
+        order, code_len, data_len = col("order_ratio"), col("code_len"), col("data_len")
+        k_wear, k_health, alpha = col("k_wear"), col("k_health"), col("alpha")
+
+        # NumPy's exp may differ from libm's by 1 ulp, so mu matches evaluate()
+        # to a couple of ulp (verdict codes exactly, short of a tie at a threshold)
+        deviation = order - OPTIMAL_ORDER
+        vitality = np.exp(-(deviation * deviation) / (2 * SIGMA_WIDTH ** 2))
+        compression = np.maximum(0.0, 1.0 - (code_len / np.maximum(data_len, 1.0)))
+        quality = compression * vitality * 1000.0
+        total_cost = np.maximum(col("e_in") + col("e_debt"), 1e-6)
+        power = ((col("p_tech") * k_wear) + (col("p_bio") * k_health)) / total_cost
+        mu = quality * power * alpha
+
+        # Rules as masks, applied from lowest to highest precedence
+        codes = np.where(mu > 10.0, VERDICT_CODE[Verdict.AMPLIFY], VERDICT_CODE[Verdict.STOP]).astype(np.int8)
+        sleeping = alpha <= 0.01
+        codes[sleeping] = VERDICT_CODE[Verdict.ARCHIVE]
+        mu = np.where(sleeping, np.where(quality > 500, quality, 0.0), mu)
+
+        recycle = (kind == ENTITY_TYPES.index(EntityType.TECHNOSPHERE)) & (k_wear < 0.2) & (col("e_debt") > col("replacement_cost"))
+        recovery = (kind == ENTITY_TYPES.index(EntityType.BIOSPHERE)) & (k_health < CRITICAL_HEALTH_LIMIT)
+        for mask, verdict in ((recycle, Verdict.RECYCLE), (recovery, Verdict.RECOVERY)):
+            codes[mask] = VERDICT_CODE[verdict]
+            mu[mask] = 0.0
+        return mu, codes
+
+    def _evaluate_rows(self, table) -> Tuple[List[float], List[int]]:
+        """Pure-Python fallback: row-wise evaluate() over a struct-of-arrays."""
+        mu_out, codes = [], []
+        for row in zip(*(table[n] for n in ENTITY_FIELDS)):
+            e = SyntropicEntity(*row)
+            if not isinstance(e.type, EntityType): e.type = ENTITY_TYPES[e.type]
+            mu, verdict, _ = self.evaluate(e)
+            mu_out.append(mu)
+            codes.append(VERDICT_CODE[verdict])
+        return mu_out, codes
+
+class DensityBackend:
+    """
+    Pluggable density estimator for the scanner.
+    `density` measures one standalone window; `chunk_features` measures the
+    chunks of a pyramid level once and `window_densities` combines them per
+    window. Estimators other than zlib-6 are mapped onto the zlib-6 scale by
+    a per-content-type calibration (a * raw + b + c * log2(window bytes)),
+    so the PROFILES targets and the CRYSTAL/CHAOS/DISRUPTION thresholds keep
+    their meaning.
+    """
+    name = "base"
+    chunked_is_approximate = True   # exact_density=True falls back to density()
+    calibration: Dict[ContentType, Tuple[float, float, float]] = {}
+
+    def _calibrate(self, raw: float, c_type: ContentType, n_bytes: int) -> float:
+        a, b, c = self.calibration.get(c_type, (1.0, 0.0, 0.0))
+        if c: b += c * math.log2(n_bytes)
+        return min(1.0, max(a * raw + b, 0.0))
+
+    def density(self, data: bytes, c_type: ContentType, cache: Optional['ScanCache'] = None) -> float:
+        raise NotImplementedError
+
+    def chunk_features(self, chunks: List[bytes], cache: Optional['ScanCache'] = None):
+        raise NotImplementedError
+
+    def window_densities(self, features, firsts: List[int], per_window: int,
+                         sizes: List[int], types: List[ContentType]) -> List[float]:
+        raise NotImplementedError
+
+class ZlibDensity(DensityBackend):
+    """
+    Compression ratio (zlib). Level 6 is the reference scale.
+    Chunked mode (opt-in, SyntropyScannerV3(exact_density=False)): each chunk
+    is deflated once, primed with the last third of its predecessor as a
+    preset dictionary, and a window sums its chunks. It reads denser than
+    per-window zlib-6; measured on the repo's docs and sources:
+      window 150: mean bias +0.008..+0.034, worst |delta| 0.062,
+                  status agreement 0.60..1.00
+      window 80:  mean bias +0.026..+0.049, worst |delta| 0.141,
+                  status agreement 0.44..1.00
+      mu_global:  -1% .. -21%; the structure verdict flipped on 2 of 8 texts.
+    Good enough for triage of large volumes, not for verdicts: the default
+    scanner scores every window with density() instead.
+    """
+    PRIME_FRACTION = 3      # Dictionary = last 1/3 of the previous chunk
+    SPLIT_OVERHEAD = 8      # Extra block header bytes per additional chunk
+
+    def __init__(self, level: int = 6, name: str = "zlib",
+                 calibration: Optional[Dict[ContentType, Tuple[float, float, float]]] = None):
+        self.level = level
+        self.name = name
+        self.calibration = calibration or {}
+
+    def density(self, data: bytes, c_type: ContentType, cache: Optional['ScanCache'] = None) -> float:
+        key = ScanCache.digest(b"w", self.name.encode(), data) if cache else None
+        size = cache.get(key) if cache else None
+        if size is None:
+            size = len(zlib.compress(data, self.level))
+            if cache: cache.put(key, size)
+        return self._calibrate(min(1.0, max(size - 10, 1) / len(data)), c_type, len(data))
+
+    def chunk_features(self, chunks: List[bytes], cache: Optional['ScanCache'] = None) -> List[int]:
+        sizes = []
+        prev = b""
+        for b in chunks:
+            prime = prev[-(len(prev) // self.PRIME_FRACTION):] if prev else b""
+            key = ScanCache.digest(b"c", self.name.encode(), prime, b) if cache else None
+            size = cache.get(key) if cache else None
+            if size is None:
+                comp = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=prime) if prime else zlib.compressobj(self.level, zlib.DEFLATED, -15)
+                size = len(comp.compress(b) + comp.flush())
+                if cache: cache.put(key, size)
+            sizes.append(size)
+            prev = b
+        return sizes
+
+    def window_densities(self, features: List[int], firsts: List[int], per_window: int,
+                         sizes: List[int], types: List[ContentType]) -> List[float]:
+        overhead = 4 + self.SPLIT_OVERHEAD * (per_window - 1)
+        return [self._calibrate(min(1.0, max(sum(features[ca:ca + per_window]) - overhead, 1) / n_bytes), t, n_bytes)
+                for ca, n_bytes, t in zip(firsts, sizes, types)]
+
+class EntropyDensity(DensityBackend):
+    """
+    Order-0 byte entropy (Miller-Madow corrected, bits/byte / 8), calibrated
+    onto the zlib-6 scale. Byte histograms are additive, so a window's
+    histogram is the sum of its chunks' histograms plus the joining spaces:
+    chunked mode is exact for the estimator and needs one vectorized pass
+    over the bytes, no compression.
+    Calibration: least squares against zlib-6 per content type, over the
+    80/150/300/1000-token windows of the repo's docs, sources and synthetic
+    prose/code (2907 windows). Against zlib-6 on the same texts:
+      window 150: mean bias -0.043..+0.033, worst |delta| 0.125,
+                  status agreement 0.67..1.00 (0.89 pooled)
+      window 80:  mean bias -0.033..+0.022, worst |delta| 0.173,
+                  status agreement 0.72..1.00 (0.90 pooled)
+      mu_global:  -40% .. +11%; the Fast Path structure flipped on 2 of 19
+                  texts, the Deep Path diagnosis on 5 of 19 (MESO integrity
+                  sits near its 0.4 threshold on long prose).
+    A byte histogram cannot see repeated phrases, so use it for high-volume
+    triage and keep zlib for verdicts that must match the reference.
+    """
+    name = "entropy"
+    chunked_is_approximate = False
+    calibration = {ContentType.PROSE: (2.0701, -0.0666, -0.0610), ContentType.CODE: (1.5050, 0.2511, -0.0653)}
+
+    @staticmethod
+    def _entropy(hist, n: int) -> float:
+        if not n: return 0.0
+        used = [c for c in hist if c]
+        return (-sum(c * math.log2(c / n) for c in used) / n + (len(used) - 1) / (2 * n * math.log(2))) / 8
+
+    def density(self, data: bytes, c_type: ContentType, cache: Optional['ScanCache'] = None) -> float:
+        hist = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256).tolist() if HAS_NUMPY else Counter(data).values()
+        return self._calibrate(self._entropy(hist, len(data)), c_type, len(data))
+
+    def chunk_features(self, chunks: List[bytes], cache: Optional['ScanCache'] = None):
+        """Cumulative histograms: row k = byte counts of chunks [0, k)."""
+        if not HAS_NUMPY:
+            cum = [Counter()]
+            for b in chunks: cum.append(cum[-1] + Counter(b))
+            return cum
+        data = np.frombuffer(b"".join(chunks), dtype=np.uint8)
+        owner = np.repeat(np.arange(len(chunks)), [len(b) for b in chunks])
+        hist = np.bincount(owner * 256 + data, minlength=len(chunks) * 256).reshape(len(chunks), 256)
+        return np.vstack([np.zeros((1, 256), dtype=np.int64), np.cumsum(hist, axis=0)])
+
+    def window_densities(self, features, firsts: List[int], per_window: int,
+                         sizes: List[int], types: List[ContentType]) -> List[float]:
+        if not firsts: return []
+        if not HAS_NUMPY:
+            out = []
+            for ca, n_bytes, t in zip(firsts, sizes, types):
+                hist = features[ca + per_window] - features[ca]
+                hist[32] += per_window - 1
+                out.append(self._calibrate(self._entropy(hist.values(), n_bytes), t, n_bytes))
+            return out
+        first = np.asarray(firsts)
+        hist = (features[first + per_window] - features[first]).astype(np.float64)
+        hist[:, 32] += per_window - 1                               # joining spaces
+        n = np.asarray(sizes, dtype=np.float64)
+        p = hist / n[:, None]
+        used = (hist > 0).sum(axis=1)
+        raw = (-(p * np.log2(np.where(p > 0, p, 1.0))).sum(axis=1) + (used - 1) / (2 * n * math.log(2))) / 8
+        return [self._calibrate(r, t, b) for r, t, b in zip(raw.tolist(), types, sizes)]
+
+DENSITY_BACKENDS = {
+    "zlib": lambda: ZlibDensity(6),
+    # Level 1: several times faster. (a, b, c) per content type, least squares against
+    # level 6 on the EntropyDensity windows; status agreement 0.94..1.00 per text (0.99
+    # pooled), worst |delta| 0.027, no Deep Path flips, Fast Path structure flipped on
+    # 1 of 19 texts (sve_core.py: integrity on the 0.5 CRYSTAL_CHAIN edge)
+    "zlib_fast": lambda: ZlibDensity(1, "zlib_fast", {ContentType.PROSE: (1.0351, -0.0073, -0.0022), ContentType.CODE: (1.0493, -0.0042, -0.0035)}),
+    "entropy": EntropyDensity,
+}
+
+class ScanPyramid:
+    """
+    Shared Multi-Resolution Scan Pyramid.
+    One tokenization of a text, reused by the Fast Path window (150/75) and
+    every Fractal zoom level (MACRO/MESO/MICRO).
+
+    Layers:
+    - Grain aggregates: the additive window statistics (bytes, chars, code
+      marks, clean length, word length) are measured once per grain of
+      tokens and stored as prefix sums. Any level whose window and step are
+      multiples of the grain reads its windows in O(1) from them, so coarse
+      levels are derived from the fine aggregates.
+    - Density chunks: density is not additive, so each level measures its
+      own chunks (gcd(window, step) tokens) once with the scanner's
+      DensityBackend and overlapping windows of the level reuse them
+      (tolerances are documented on each backend).
+    - Level series: each (window, step) result is memoized, so the Deep
+      Path never repeats a level the Fast Path already scored.
+    """
+    def __init__(self, scanner: 'SyntropyScannerV3', text: str = "", tokens: Optional[List[str]] = None):
+        self.scanner = scanner
+        self.text = text
+        self.tokens = tokens if tokens is not None else text.split()
+        self._prefix: Dict[int, List[List[int]]] = {}      # grain -> prefix sums
+        self._features: Dict[int, Any] = {}                # chunk -> density features
+        self._series: Dict[Tuple[int, int], Spectrogram] = {}
+        self._whole = None
+        self.seconds_per_token: Optional[float] = None     # Measured cost of one level pass
+
+    def _parallel(self, workers: Optional[int]) -> int:
+        """Worker count for this text (0 = serial)."""
+        workers = self.scanner.workers if workers is None else workers
+        return workers if workers > 1 and len(self.tokens) >= self.scanner.parallel_threshold else 0
+
+    def prepare(self, *levels: Tuple[int, int], workers: Optional[int] = None):
+        """Measures grain aggregates once for a set of (window, step) levels."""
+        if self._parallel(workers): return # Workers measure their own ranges
+        grain = 0
+        for window, step in levels: grain = math.gcd(grain, math.gcd(window, step))
+        if grain and not any(g for g in self._prefix if grain % g == 0): self._grain_prefix(grain)
+
+    def whole(self) -> Optional[ScannerAnalysis]:
+        """Single-window analysis of the full text (short-text path)."""
+        if self._whole is None: self._whole = self.scanner.scan_window(self.text or " ".join(self.tokens))
+        return self._whole
+
+    def _grain_prefix(self, grain: int) -> List[List[int]]:
+        """Prefix sums of (bytes, chars, code_marks, clean_len, word_len) per grain."""
+        if grain in self._prefix: return self._prefix[grain]
+        tokens = self.tokens
+        cols = ([0], [0], [0], [0], [0])
+        p_bytes, p_chars, p_code, p_clean, p_words = cols
+        for k in range(0, len(tokens), grain):
+            part = tokens[k:k + grain]
+            s = " ".join(part)
+            punct = s.count('.') + s.count(',') + s.count('!') + s.count('?')
+            p_bytes.append(p_bytes[-1] + len(s.encode('utf-8')))
+            p_chars.append(p_chars[-1] + len(s))
+            p_code.append(p_code[-1] + len(CODE_MARKS_RE.findall(s)))
+            p_clean.append(p_clean[-1] + len(s) - (len(part) - 1) - punct)
+            p_words.append(p_words[-1] + len("".join(WORD_RE.findall(s))))
+        self._prefix[grain] = list(cols)
+        return self._prefix[grain]
+
+    def _chunk_features(self, chunk: int):
+        """Density features of every chunk of `chunk` tokens (once per level)."""
+        if chunk not in self._features:
+            tokens = self.tokens
+            chunks = [" ".join(tokens[k:k + chunk]).encode('utf-8') for k in range(0, len(tokens), chunk)]
+            self._features[chunk] = self.scanner.density.chunk_features(chunks, self.scanner.cache)
+        return self._features[chunk]
+
+    def series(self, window: int, step: int, workers: Optional[int] = None) -> Spectrogram:
+        """Scores every window of `window` tokens (stride `step`)."""
+        key = (window, step)
+        if key not in self._series:
+            t0 = time.perf_counter()
+            if len(self.tokens) < window: self._series[key] = Spectrogram(window, self.tokens)
+            elif self._parallel(workers): self._series[key] = self._scan_parallel(window, step, self._parallel(workers))
+            else: self._series[key] = self._scan(window, step)
+            if self.tokens: self.seconds_per_token = (time.perf_counter() - t0) / len(self.tokens)
+        return self._series[key]
+
+    def _scan_parallel(self, window: int, step: int, workers: int) -> Spectrogram:
+        """
+        Splits the windows into contiguous ranges scored on the shared process pool.
+        Each range carries one leading chunk so its first density chunk is primed
+        exactly as in the serial pass; the merge is in order, so the series is
+        identical to _scan().
+        """
+        chunk = math.gcd(window, step)
+        n_windows = (len(self.tokens) - window) // step + 1
+        per_task = max(1, -(-n_windows // (workers * 4)))
+        pool = scan_pool(workers)
+        futures = []
+        for w0 in range(0, n_windows, per_task):
+            w1 = min(n_windows, w0 + per_task)
+            lead = chunk if w0 else 0
+            part = self.tokens[w0 * step - lead:(w1 - 1) * step + window]
+            futures.append((w0 * step - lead, pool.submit(_scan_range, self.scanner, part, window, step, lead)))
+
+        series = Spectrogram(window, self.tokens)
+        for offset, f in futures: series.extend(f.result(), offset)
+        return series
+
+    def _scan(self, window: int, step: int, begin: int = 0) -> Spectrogram:
+        """Serial pass over windows starting at begin, begin + step, ..."""
+        n = len(self.tokens)
+        series = Spectrogram(window, self.tokens)
+
+        chunk = math.gcd(window, step)
+        grain = max((g for g in self._prefix if chunk % g == 0), default=chunk)
+        p_bytes, p_chars, p_code, p_clean, p_words = self._grain_prefix(grain)
+        backend = self.scanner.density
+        exact = self.scanner.exact_density and backend.chunked_is_approximate
+        per_window = window // chunk
+        seps = window // grain - 1
+
+        # Pass 1: additive statistics of every window
+        starts, sizes, types = [], [], []
+        for start in range(begin, n - window + 1, step):
+            ga, gb = start // grain, (start + window) // grain
+            if p_chars[gb] - p_chars[ga] + seps < 5: continue
+            starts.append(start)
+            sizes.append(p_bytes[gb] - p_bytes[ga] + seps)
+            types.append(ContentType.CODE if p_code[gb] - p_code[ga] > window * 0.1 else ContentType.PROSE)
+
+        # Pass 2: densities (one backend call per level)
+        if exact:
+            densities = [backend.density(" ".join(self.tokens[st:st + window]).encode('utf-8'), t, self.scanner.cache)
+                         for st, t in zip(starts, types)]
+        else:
+            densities = backend.window_densities(self._chunk_features(chunk), [st // chunk for st in starts],
+                                                 per_window, sizes, types)
+
+        for start, n_bytes, c_type, density in zip(starts, sizes, types, densities):
+            ga, gb = start // grain, (start + window) // grain
+            clean = p_clean[gb] - p_clean[ga]
+            coherence = min(1.0, (p_words[gb] - p_words[ga]) / clean) if clean else 0
+
+            vitality, mu, status, _ = self.scanner._classify(n_bytes, density, coherence, c_type)
+            series.append(start, density, coherence, vitality, mu, status)
+        return series
+
+class ScanCache:
+    """
+    Content-Addressed LRU Cache for window analyses.
+    Keys are 16-byte BLAKE2b digests of the window/chunk bytes, values are
+    the numeric results only, so no window text is ever retained. Bounded by
+    entry count and by an estimate of resident bytes; least recently used
+    entries are evicted first. With a ttl (seconds), entries older than
+    that read as misses and are dropped.
+    """
+    ENTRY_OVERHEAD = 100    # OrderedDict link + hash slot (approx. bytes)
+
+    def __init__(self, max_entries: int = 100_000, max_bytes: int = 32 * 2**20, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data: 'OrderedDict[bytes, Tuple[Any, int, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def digest(kind: bytes, *parts: bytes) -> bytes:
+        h = hashlib.blake2b(kind, digest_size=16)
+        for part in parts:
+            h.update(len(part).to_bytes(8, 'little'))
+            h.update(part)
+        return h.digest()
+
+    def get(self, key: bytes):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                del self._data[key]
+                self.bytes -= entry[1]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    @staticmethod
+    def sizeof(value, depth: int = 3) -> int:
+        """Approximate resident bytes of a value and its nested containers."""
+        size = sys.getsizeof(value)
+        if depth:
+            if isinstance(value, dict): value = list(value.values())
+            if isinstance(value, (list, tuple)): size += sum(ScanCache.sizeof(v, depth - 1) for v in value)
+        return size
+
+    def put(self, key: bytes, value):
+        size = sys.getsizeof(key) + self.sizeof(value) + self.ENTRY_OVERHEAD
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old: self.bytes -= old[1]
+            self._data[key] = (value, size, time.monotonic())
+            self.bytes += size
+            while self._data and (len(self._data) > self.max_entries or self.bytes > self.max_bytes):
+                self.bytes -= self._data.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def invalidate(self, key: bytes) -> bool:
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry: self.bytes -= entry[1]
+            return entry is not None
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {"entries": len(self._data), "bytes": self.bytes, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "expirations": self.expirations, "hit_rate": self.hits / lookups if lookups else 0.0}
+
+# --- SHARED SCAN POOL ---
+# One process pool per worker count, reused across diagnose() calls.
+_SCAN_POOLS: Dict[int, 'ProcessPoolExecutor'] = {}
+_SCAN_POOLS_LOCK = threading.Lock()
+
+def scan_pool(workers: int) -> 'ProcessPoolExecutor':
+    from concurrent.futures import ProcessPoolExecutor # Loaded with the first pool
+    with _SCAN_POOLS_LOCK:
+        if workers not in _SCAN_POOLS: _SCAN_POOLS[workers] = ProcessPoolExecutor(max_workers=workers)
+        return _SCAN_POOLS[workers]
+
+def shutdown_scan_pools():
+    while _SCAN_POOLS: _SCAN_POOLS.popitem()[1].shutdown()
+
+def _scan_range(scanner: 'SyntropyScannerV3', tokens: List[str], window: int, step: int, begin: int) -> Spectrogram:
+    """Worker entry point: scores one token range of a parallel scan."""
+    return ScanPyramid(scanner, tokens=tokens)._scan(window, step, begin)
+
+class SyntropyScannerV3:
+    """Multi-Window Text Analysis (Fast Path)"""
+    FAST_WINDOW, FAST_STEP = 150, 75
+
+    def __init__(self, exact_density: bool = True, workers: int = 0, parallel_threshold: int = 200_000,
+                 cache: Optional['ScanCache'] = None, density: Any = "zlib"):
+        self.PROFILES = {ContentType.PROSE: 0.55, ContentType.CODE: 0.40, ContentType.UNKNOWN: 0.50}
+        self.SIGMA_WIDTH = 0.15
+        # Density estimator: "zlib" (reference), "zlib_fast", "entropy" or a DensityBackend
+        self.density = DENSITY_BACKENDS[density]() if isinstance(density, str) else density
+        # True = one zlib pass per window (reference); False = chunked zlib (faster, approximate)
+        self.exact_density = exact_density
+        # Parallel mode (opt-in): texts of at least `parallel_threshold` tokens
+        # are scored on a shared pool of `workers` processes (-1 = all cores).
+        self.workers = (os.cpu_count() or 1) if workers < 0 else workers
+        self.parallel_threshold = parallel_threshold
+        self.cache = cache # Optional ScanCache shared by every scan of this scanner
+
+    def __getstate__(self):
+        # Pool workers get the configuration, not the parent's cache
+        state = self.__dict__.copy()
+        state["cache"] = None
+        state.pop("_config", None)
+        return state
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name != "_config": self.__dict__.pop("_config", None) # Reconfigured: config() pickles afresh
+
+    def config(self) -> bytes:
+        """
+        The pickled configuration (without the cache), kept until an
+        attribute is reassigned: reconfigure by assignment, not in place.
+        """
+        config = self.__dict__.get("_config")
+        if config is None: config = self._config = pickle.dumps(self)
+        return config
+
+    def _detect_type(self, text: str) -> ContentType:
+        if len(CODE_MARKS_RE.findall(text)) > len(text.split()) * 0.1: return ContentType.CODE
+        return ContentType.PROSE
+
+    def _classify(self, n_bytes: int, density: float, coherence: float, c_type: ContentType) -> Tuple[float, float, str, bool]:
+        """Shared scoring: (vitality, mu, status, is_disruption)."""
+        vitality = math.exp(-((density - self.PROFILES[c_type]) ** 2) / (2 * self.SIGMA_WIDTH ** 2))
+        mu = math.log(n_bytes + 1) * vitality * coherence * 10.0
+        
+        status = "LIQUID"
+        is_disruption = False
+        if coherence < 0.3: status = "CHAOS"
+        elif density > 0.75 and coherence > 0.8: 
+            status = "DISRUPTION"
+            is_disruption = True
+        elif vitality > 0.8: status = "CRYSTAL"
+        return vitality, mu, status, is_disruption
+
+    def scan_window(self, text: str) -> Optional[ScannerAnalysis]:
+        """Public method for single window analysis."""
+        if not text or len(text.strip()) < 5: return None
+        c_type = self._detect_type(text)
+        
+        orig_bytes = text.encode('utf-8')
+        key = ScanCache.digest(b"s", self.density.name.encode(), orig_bytes) if self.cache else None
+        hit = self.cache.get(key) if self.cache else None
+        if hit: return ScannerAnalysis(text, *hit)
+
+        density = self.density.density(orig_bytes, c_type, self.cache)
+        
+        clean = CLEAN_STRIP_RE.sub('', text)
+        coherence = min(1.0, sum(len(t) for t in WORD_RE.findall(text)) / len(clean)) if clean else 0
+        
+        vitality, mu, status, is_disruption = self._classify(len(orig_bytes), density, coherence, c_type)
+        if self.cache: self.cache.put(key, (density, coherence, vitality, mu, status, is_disruption))
+        return ScannerAnalysis(text, density, coherence, vitality, mu, status, is_disruption)
+
+    def pyramid(self, text: str) -> ScanPyramid:
+        """Tokenizes once; the result can be shared by analyze_stream and FractalAnalyzer."""
+        return ScanPyramid(self, text)
+
+    def analyze_stream(self, text: str, pyramid: Optional[ScanPyramid] = None, columnar: bool = False):
+        """Fast Path. The spectrogram is a list of mu by default; columnar=True returns the Spectrogram itself."""
+        pyr = pyramid or self.pyramid(text)
+        if len(pyr.tokens) < 100:
+            res = pyr.whole()
+            if not res: return None
+            if not columnar: return {"structure": res.status, "mu_global": res.mu_score, "spectrogram": [res.mu_score]}
+            series = Spectrogram(len(pyr.tokens), pyr.tokens)
+            series.append(0, res.density, res.coherence, res.vitality, res.mu_score, res.status)
+            return {"structure": res.status, "mu_global": res.mu_score, "spectrogram": series}
+
+        series = pyr.series(self.FAST_WINDOW, self.FAST_STEP)
+        
+        if not series.mu: return None
+        
+        mu_series = series.mu
+        integrity = series.integrity()
+        structure, mu_3 = self._structure(mean(mu_series), max(mu_series), series.slope(), integrity,
+                                          series.has("CHAOS"), series.has("DISRUPTION"))
+        return {"structure": structure, "mu_global": mu_3, "spectrogram": series if columnar else list(mu_series),
+                "metrics": {"integrity": integrity}}
+
+    @staticmethod
+    def _structure(mu_mean: float, mu_max: float, slope: float, integrity: float,
+                   has_chaos: bool, has_disruption: bool) -> Tuple[str, float]:
+        """Fast Path verdict from the series summary: (structure, mu_global)."""
+        mu_3 = (mu_mean * 0.4) + (mu_max * 0.6)
+        if integrity > 0.3: mu_3 *= 1.2
+        
+        structure = "WAVES"
+        if mu_max > 20.0 and mu_mean < 5.0: structure = "SPARK_IN_DARK"
+        elif slope > 0.5: structure = "ASCENSION"
+        elif integrity > 0.5: structure = "CRYSTAL_CHAIN"
+        elif has_chaos: structure = "CHAOS"
+        elif has_disruption: structure = "DISRUPTION"
+        return structure, mu_3
+
+    def stream(self, source: Union[str, 'os.PathLike', Any, Iterable], **kwargs) -> 'StreamScan':
+        """Streaming Fast Path: iterate for SpectrumPoints, then call summary()."""
+        return StreamScan(self, source, [(self.FAST_WINDOW, self.FAST_STEP)], **kwargs)
+
+    def analyze_source(self, source: Union[str, 'os.PathLike', Any, Iterable], **kwargs) -> Optional[Dict]:
+        """analyze_stream() for a file path, binary file or chunk iterator, in bounded memory."""
+        scan = self.stream(source, **kwargs)
+        for _ in scan: pass
+        return scan.summary()
+
+# --- STREAMING INPUT ---
+def _read_chunks(f, chunk_size: int) -> Iterator[Union[bytes, str]]:
+    while True:
+        piece = f.read(chunk_size)
+        if not piece: return
+        yield piece
+
+def iter_text(source: Union[str, 'os.PathLike', Any, Iterable], chunk_size: int = 1 << 20,
+              encoding: str = 'utf-8', errors: str = 'replace') -> Iterator[str]:
+    """
+    Decoded text pieces of a source:
+    - str / PathLike: a file path, read through mmap;
+    - object with read(): a binary (or text) file;
+    - any other iterable: chunks of str or bytes.
+    Bytes are decoded incrementally, so multi-byte characters may straddle chunks.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if not size: return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from iter_text((mm[i:i + chunk_size] for i in range(0, size, chunk_size)), chunk_size, encoding, errors)
+        return
+    if hasattr(source, 'read'): source = _read_chunks(source, chunk_size)
+
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    for piece in source:
+        text = piece if isinstance(piece, str) else decoder.decode(piece)
+        if text: yield text
+    tail = decoder.decode(b'', final=True)
+    if tail: yield tail
+
+class _LevelStream:
+    """Online state of one (window, step) level: next window + running summary."""
+    def __init__(self, window: int, step: int, block_tokens: int):
+        self.window, self.step = window, step
+        self.chunk = math.gcd(window, step)
+        self.per_block = max(1, block_tokens // step)
+        self.next_start = 0
+        self.n = 0
+        self.mu_mean = 0.0
+        self.mu_max = -math.inf
+        self.mu_min = math.inf
+        self.cov_xy = 0.0           # Welford co-moment of (index, mu) for the OLS slope
+        self.crystal = 0
+        self.has_chaos = False
+        self.has_disruption = False
+
+    def add(self, mu: float, status: str, is_disruption: bool):
+        self.n += 1
+        dy = mu - self.mu_mean
+        self.mu_mean += dy / self.n
+        self.cov_xy += ((self.n - 1) / 2) * dy      # (index - new index mean) * (mu - old mean)
+        self.mu_max = max(self.mu_max, mu)
+        self.mu_min = min(self.mu_min, mu)
+        if status == "CRYSTAL": self.crystal += 1
+        elif status == "CHAOS": self.has_chaos = True
+        self.has_disruption = self.has_disruption or is_disruption
+
+    @property
+    def slope(self) -> float:
+        # var(index) * n = (n^3 - n) / 12
+        return self.cov_xy * 12 / (self.n ** 3 - self.n) if self.n > 2 else 0.0
+
+    @property
+    def integrity(self) -> float:
+        return self.crystal / self.n if self.n else 0.0
+
+class StreamScan:
+    """
+    Single bounded-memory pass over a streamed source at one or more levels.
+    Tokens live in a ring that only keeps what the pending windows of every
+    level still need; windows are scored in blocks of ~block_tokens with the
+    same leading-chunk priming as parallel scans, so every SpectrumPoint (and
+    the summaries) match the in-memory scan of the whole text. The raw text is
+    kept only while the stream is shorter than the largest window, for the
+    short-text (single window) path.
+    """
+    def __init__(self, scanner: 'SyntropyScannerV3', source, levels: List[Tuple[int, int]],
+                 block_tokens: int = 65_536, chunk_size: int = 1 << 20):
+        self.scanner = scanner
+        self.source = source
+        self.chunk_size = chunk_size
+        self.levels = [_LevelStream(w, s, block_tokens) for w, s in levels]
+        self.raw_limit = max(w for w, _ in levels)
+        self.ring: List[str] = []
+        self.ring_start = 0         # Stream offset of ring[0]
+        self.n_tokens = 0
+        self.raw: Optional[List[str]] = []
+        self.peak_ring = 0
+        self.done = False
+
+    def __iter__(self) -> Iterator[SpectrumPoint]:
+        carry = ""
+        for text in iter_text(self.source, self.chunk_size):
+            if self.raw is not None: self.raw.append(text)
+            text = carry + text
+            tokens = text.split()
+            carry = tokens.pop() if tokens and not text[-1].isspace() else ""
+            self._push(tokens)
+            yield from self._drain(False)
+        if carry: self._push([carry])
+        yield from self._drain(True)
+        self.done = True
+
+    def _push(self, tokens: List[str]):
+        self.ring.extend(tokens)
+        self.n_tokens += len(tokens)
+        if self.raw is not None and self.n_tokens >= self.raw_limit: self.raw = None
+        self.peak_ring = max(self.peak_ring, len(self.ring))
+
+    def _drain(self, final: bool) -> Iterator[SpectrumPoint]:
+        end = self.ring_start + len(self.ring)
+        for lv in self.levels:
+            while True:
+                lead = lv.chunk if lv.next_start else 0
+                begin = lv.next_start - lead
+                need = lead + (lv.per_block - 1) * lv.step + lv.window
+                if end - begin >= need: part = self.ring[begin - self.ring_start:begin - self.ring_start + need]
+                elif final and end - begin >= lead + lv.window: part = self.ring[begin - self.ring_start:]
+                else: break
+                series = ScanPyramid(self.scanner, tokens=part)._scan(lv.window, lv.step, lead)
+                for k in range(len(series)):
+                    status = WINDOW_STATUSES[series.codes[k]]
+                    lv.add(series.mu[k], status, status == "DISRUPTION")
+                    yield SpectrumPoint(lv.window, lv.n - 1, begin + series.starts[k], series.density[k], series.coherence[k],
+                                        series.vitality[k], series.mu[k], status, status == "DISRUPTION")
+                # Windows too short to score are skipped, so advance by the range, not the points
+                lv.next_start += ((len(part) - lead - lv.window) // lv.step + 1) * lv.step
+                if len(part) < need: break
+
+        # Drop tokens no pending window (or its leading chunk) can reach
+        keep = min(max(0, lv.next_start - lv.chunk) for lv in self.levels)
+        if keep > self.ring_start:
+            del self.ring[:keep - self.ring_start]
+            self.ring_start = keep
+
+    def whole(self) -> Optional[ScannerAnalysis]:
+        """Single-window analysis of a stream shorter than the largest window."""
+        return self.scanner.scan_window("".join(self.raw)) if self.raw is not None else None
+
+    def level(self, window: int) -> _LevelStream:
+        return next(lv for lv in self.levels if lv.window == window)
+
+    def summary(self) -> Optional[Dict]:
+        """Fast Path summary, as analyze_stream() (without the spectrogram)."""
+        if not self.done: raise RuntimeError("StreamScan.summary() before the stream was consumed")
+        if self.n_tokens < 100:
+            res = self.whole()
+            return {"structure": res.status, "mu_global": res.mu_score} if res else None
+        lv = self.level(self.scanner.FAST_WINDOW)
+        if not lv.n: return None
+        structure, mu_3 = self.scanner._structure(lv.mu_mean, lv.mu_max, lv.slope, lv.integrity, lv.has_chaos, lv.has_disruption)
+        return {"structure": structure, "mu_global": mu_3, "metrics": {"integrity": lv.integrity}}
+
+# ==========================================
+# 4. FRACTAL ANALYZER (DEEP PATH)
+# ==========================================
+
+class FractalAnalyzer:
+    """
+    Implements the 'Artist's Loop': Zoom Out -> Zoom In.
+    Used only when Fast Path detects ambiguity.
+    """
+    def __init__(self, scanner: SyntropyScannerV3, workers: Optional[int] = None):
+        self.scanner = scanner
+        self.workers = workers # None = follow the scanner's parallel mode
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_config", None)
+        return state
+
+    def __setattr__(self, name: str, value):
+        super().__setattr__(name, value)
+        if name != "_config": self.__dict__.pop("_config", None)
+
+    def config(self) -> bytes:
+        """Pickled analyzer and scanner configuration; pickled again only after either is reconfigured."""
+        scanner = self.scanner.config()
+        cached = self.__dict__.get("_config")
+        if cached is None or cached[0] is not scanner: cached = self._config = (scanner, pickle.dumps(self))
+        return cached[1]
+
+    def _scan_at_resolution(self, pyramid: ScanPyramid, window_size: int, clock: Optional['_DeepClock'] = None) -> Dict:
+        if len(pyramid.tokens) < window_size:
+            res = pyramid.whole()
+            return {"mu_avg": res.mu_score, "min_val": res.mu_score, "integrity": 1.0, "coverage": 1.0} if res else None
+
+        n_windows = (len(pyramid.tokens) - window_size) // (window_size // 2) + 1
+        if clock and not clock.affords(n_windows, len(pyramid.tokens)):
+            return self._scan_sampled(pyramid, window_size, n_windows, clock)
+
+        series = pyramid.series(window_size, window_size // 2, self.workers)
+        if clock: clock.spend(n_windows)
+        if not series.mu: return None
+        mu_series = series.mu
+        return {
+            "mu_avg": mean(mu_series),
+            "min_val": min(mu_series),
+            "integrity": series.integrity(),
+            "coverage": 1.0
+        }
+
+    def _scan_sampled(self, pyramid: ScanPyramid, window_size: int, n_windows: int, clock: '_DeepClock') -> Optional[Dict]:
+        """
+        Anytime scan of one level: windows are visited coarse-to-fine
+        (every 2^k-th window, then the gaps) until the budget runs out,
+        so any prefix of the visit order is an even sample of the text.
+        """
+        step = window_size // 2
+        tokens = pyramid.tokens
+        seen = bytearray(n_windows)
+        results, starts = [], []
+        stride = 1 << max(n_windows - 1, 0).bit_length()
+        while stride and not (results and clock.exhausted()):
+            for i in range(0, n_windows, stride):
+                if seen[i]: continue
+                if results and clock.exhausted(): break
+                seen[i] = 1
+                clock.spend(1)
+                res = self.scanner.scan_window(" ".join(tokens[i * step:i * step + window_size]))
+                if res:
+                    results.append(res)
+                    starts.append(i * step)
+            stride //= 2
+        if not results: return None
+
+        covered, reach = 0, 0
+        for start in sorted(starts):
+            covered += max(0, start + window_size - max(start, reach))
+            reach = max(reach, start + window_size)
+        mu_series = [r.mu_score for r in results]
+        return {
+            "mu_avg": mean(mu_series),
+            "min_val": min(mu_series),
+            "integrity": sum(1 for r in results if r.status == "CRYSTAL") / len(results),
+            "coverage": 1.0 if len(results) == n_windows else covered / len(tokens)
+        }
+
+    def analyze_fractal(self, text_stream: str, pyramid: Optional[ScanPyramid] = None,
+                        budget: Optional[FractalBudget] = None) -> FractalState:
+        """
+        Full zoom cycle, or with a budget the best state reachable within it:
+        levels that do not fit are sampled, levels after the budget runs out
+        are skipped, and the result is flagged is_partial with its coverage.
+        """
+        pyr = pyramid or self.scanner.pyramid(text_stream)
+        clock = _DeepClock(budget, pyr) if budget else None
+        if not clock: pyr.prepare(*[(z.value, z.value // 2) for z in ZoomLevel], workers=self.workers) # One grain pass for all zoom levels
+
+        # CYCLE 1: MACRO (Vision)
+        macro = self._scan_at_resolution(pyr, ZoomLevel.MACRO.value, clock)
+        if not macro or macro['mu_avg'] < 10.0:
+            cov = self._coverage(macro) if macro else 1.0
+            return FractalState(0.1, True, 0.0, "CONCEPTUAL_FAILURE", cov < 1.0, cov)
+        if clock and clock.exhausted(): return self._synthesize(macro)
+
+        # CYCLE 2: MESO (Structure)
+        meso = self._scan_at_resolution(pyr, ZoomLevel.MESO.value, clock)
+        if meso['integrity'] < 0.4:
+            cov = self._coverage(macro, meso)
+            return FractalState(0.4, True, meso['min_val'], "STRUCTURAL_FRACTURE", cov < 1.0, cov)
+        if clock and clock.exhausted(): return self._synthesize(macro, meso)
+
+        # CYCLE 3: MICRO (Details)
+        micro = self._scan_at_resolution(pyr, ZoomLevel.MICRO.value, clock)
+        return self._synthesize(macro, meso, micro)
+
+    def analyze_source(self, source: Union[str, 'os.PathLike', Any, Iterable], **kwargs) -> FractalState:
+        """analyze_fractal() for a streamed source: every zoom level in one bounded-memory pass."""
+        scan = StreamScan(self.scanner, source, [(z.value, z.value // 2) for z in ZoomLevel], **kwargs)
+        for _ in scan: pass
+
+        def level(zoom: ZoomLevel) -> Optional[Dict]:
+            if scan.n_tokens < zoom.value:
+                res = scan.whole()
+                return {"mu_avg": res.mu_score, "min_val": res.mu_score, "integrity": 1.0, "coverage": 1.0} if res else None
+            lv = scan.level(zoom.value)
+            return {"mu_avg": lv.mu_mean, "min_val": lv.mu_min, "integrity": lv.integrity, "coverage": 1.0} if lv.n else None
+
+        macro = level(ZoomLevel.MACRO)
+        if not macro or macro['mu_avg'] < 10.0: return FractalState(0.1, True, 0.0, "CONCEPTUAL_FAILURE")
+        meso = level(ZoomLevel.MESO)
+        if meso['integrity'] < 0.4: return FractalState(0.4, True, meso['min_val'], "STRUCTURAL_FRACTURE")
+        return self._synthesize(macro, meso, level(ZoomLevel.MICRO))
+
+    def _synthesize(self, macro: Dict, meso: Optional[Dict] = None, micro: Optional[Dict] = None) -> FractalState:
+        """Synthesis over the levels reached; missing levels drop out of the weighting."""
+        terms = [(macro['mu_avg']/30.0, 0.4)]
+        if meso: terms.append((meso['integrity'], 0.4))
+        deepest = micro or meso or macro
+        weakest_link = deepest['min_val']
+        if micro: terms.append((weakest_link/10.0, 0.2))
+
+        # Full cycle: (macro/30 * 0.4) + (meso integrity * 0.4) + (weakest/10 * 0.2)
+        consistency = sum(v * w for v, w in terms)
+        if not micro: consistency /= sum(w for _, w in terms)
+        consistency = min(1.0, consistency)
+        
+        anomaly = weakest_link < 5.0
+        diagnosis = "LOCAL_ANOMALY" if anomaly else ("FRACTAL_HARMONY" if consistency > 0.7 else "SOLID_DRAFT")
+
+        coverage = self._coverage(macro, meso, micro)
+        return FractalState(consistency, anomaly, weakest_link, diagnosis, coverage < 1.0, coverage)
+
+    @staticmethod
+    def _coverage(*levels: Optional[Dict]) -> float:
+        """Mean token coverage over the levels the verdict needed; a level the budget skipped (None) counts 0."""
+        return sum(level['coverage'] for level in levels if level) / len(levels)
+
+class _DeepClock:
+    """Tracks a FractalBudget while the zoom cycle runs."""
+    DEFAULT_SECONDS_PER_TOKEN = 2e-6    # Until the pyramid has timed a level pass
+
+    def __init__(self, budget: FractalBudget, pyramid: ScanPyramid):
+        self.deadline = time.perf_counter() + budget.seconds if budget.seconds is not None else None
+        self.windows_left = budget.windows
+        self.pyramid = pyramid
+
+    def affords(self, n_windows: int, n_tokens: int) -> bool:
+        """Whether a full level pass fits in what is left."""
+        if self.windows_left is not None and n_windows > self.windows_left: return False
+        if self.deadline is not None:
+            rate = self.pyramid.seconds_per_token or self.DEFAULT_SECONDS_PER_TOKEN
+            if time.perf_counter() + rate * n_tokens > self.deadline: return False
+        return True
+
+    def spend(self, n_windows: int):
+        if self.windows_left is not None: self.windows_left -= n_windows
+
+    def exhausted(self) -> bool:
+        if self.windows_left is not None and self.windows_left <= 0: return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+# ==========================================
+# 5. ORCHESTRATOR (HYBRID DISPATCHER)
+# ==========================================
+
+@dataclass
+class DiagnosisRequest:
+    """One diagnose() call, for the batched entry points."""
+    entity: SyntropicEntity
+    user_stats: UserStats
+    text_stream: Optional[str] = None
+    agent_testimony: Optional[AgentTestimony] = None
+
+# --- EVIDENCE (FAST PATH + DEEP PATH) ---
+ALARM_STRUCTURES = ("CHAOS", "DISRUPTION") # Fast Path verdicts that call the Deep Path
+
+Evidence = Tuple[Optional[Dict], Optional[FractalState], Dict[str, float]]
+
+def _gather_evidence(fractal: 'FractalAnalyzer', text_stream: str, cached: Optional[tuple],
+                     deep_budget: Optional[FractalBudget]) -> Evidence:
+    """
+    Fast Path result (unless memoized in `cached`) and, when it alarms, the
+    Deep Path state, plus the seconds each path took. CPU-only, thread-safe.
+    """
+    scanner, timings, pyramid = fractal.scanner, {}, None
+    scan_res, fractal_res = cached or (None, None)
+    if not cached:
+        # One tokenization shared by both paths
+        t0 = time.perf_counter()
+        pyramid = scanner.pyramid(text_stream)
+        scan_res = scanner.analyze_stream(text_stream, pyramid)
+        timings["fast_path"] = time.perf_counter() - t0
+    if scan_res and scan_res['structure'] in ALARM_STRUCTURES and fractal_res is None:
+        t0 = time.perf_counter()
+        fractal_res = fractal.analyze_fractal(text_stream, pyramid or scanner.pyramid(text_stream), deep_budget)
+        timings["deep_path"] = time.perf_counter() - t0
+    return scan_res, fractal_res, timings
+
+_EVIDENCE_ENGINES: Dict[bytes, 'FractalAnalyzer'] = {} # Per worker process: pickled config -> analyzer
+
+def _evidence_worker(config: bytes, text_stream: str, cached: Optional[tuple],
+                     deep_budget: Optional[FractalBudget]) -> Evidence:
+    """
+    Process-pool entry point of diagnose_many: `config` is the pickled
+    FractalAnalyzer (with its scanner, minus caches), unpickled once per
+    worker process and configuration.
+    """
+    fractal = _EVIDENCE_ENGINES.get(config)
+    if fractal is None: fractal = _EVIDENCE_ENGINES[config] = pickle.loads(config)
+    return _gather_evidence(fractal, text_stream, cached, deep_budget)
+
+class _LazySubsystem:
+    """
+    A cached_property that holds a lock while it builds, so the subsystem is
+    built only once per instance even when several threads ask at once.
+    """
+    def __init__(self, build):
+        self.build = build
+        self.__doc__ = build.__doc__
+
+    def __set_name__(self, owner, name): self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None: return self
+        with instance._subsystem_lock:
+            value = instance.__dict__.get(self.name)
+            if value is None: value = instance.__dict__[self.name] = self.build(instance)
+        return value
+
+class SyntropicDispatcher:
+    """
+    The Clinical Core v7.2.
+    Implements 'Fast Path / Deep Path' switching logic.
+    """
+    def __init__(self, executor: Optional['Executor'] = None, max_concurrency: int = 8,
+                 deep_budget: Optional[FractalBudget] = None, memo: Optional[ScanCache] = None,
+                 instrumentation: Optional[NullInstrumentation] = None):
+        # Subsystems (sve, scanner, fractal, benevolent_core, metabolism)
+        # are built on first use, once, see the properties below
+        self._subsystem_lock = threading.RLock()
+        # Async entry points: scans run on `executor` (None = loop default),
+        # at most `max_concurrency` at a time. A ProcessPoolExecutor gets a
+        # module-level worker and a pickled scanner/fractal configuration.
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.deep_budget = deep_budget # Default Deep Path budget (None = full zoom cycle)
+        # Per-text evidence memo (Fast Path result, complete FractalState or None),
+        # off unless a ScanCache is given; keyed on the text and the scanner/fractal config
+        self.memo = memo
+        # Stage timings, path/verdict counters and the console log (silent by default)
+        self.instrumentation = instrumentation or NullInstrumentation()
+
+    # --- LAZY SUBSYSTEMS ---
+    @_LazySubsystem
+    def sve(self) -> SyntropicValueEngine: return SyntropicValueEngine()
+
+    @_LazySubsystem
+    def scanner(self) -> SyntropyScannerV3: return SyntropyScannerV3()
+
+    @_LazySubsystem
+    def fractal(self) -> FractalAnalyzer: return FractalAnalyzer(self.scanner)
+
+    @_LazySubsystem
+    def benevolent_core(self) -> BenevolentCore: return BenevolentCore()
+
+    @_LazySubsystem
+    def metabolism(self) -> SystemMetabolism: return SystemMetabolism(total_energy_pool=1_000_000.0)
+        
+    def diagnose(self, entity: SyntropicEntity, 
+                 user_stats: UserStats,
+                 text_stream: Optional[str] = None, 
+                 agent_testimony: Optional[AgentTestimony] = None,
+                 deep_budget: Optional[FractalBudget] = None) -> Prescription:
+        inst = self.instrumentation
+        with inst.stage("total"):
+            # 0. BENEVOLENCE CHECK
+            rx = self._benevolence(user_stats, agent_testimony)
+            if not rx:
+                # 1. GATHER EVIDENCE (HYBRID SCAN)
+                symptoms, coverage = self._scan_symptoms(text_stream, deep_budget) if text_stream else ([], 1.0)
+                with inst.stage("sve"): _, raw_verdict, _ = self.sve.evaluate(entity)
+                rx = self._conclude(entity, raw_verdict, symptoms, agent_testimony, coverage)
+        inst.count(f"verdict.{rx.action.name}")
+        return rx
+
+    async def diagnose_async(self, entity: SyntropicEntity, 
+                             user_stats: UserStats,
+                             text_stream: Optional[str] = None, 
+                             agent_testimony: Optional[AgentTestimony] = None,
+                             deep_budget: Optional[FractalBudget] = None) -> Prescription:
+        """diagnose() with the scanner/fractal work offloaded to the executor."""
+        request = DiagnosisRequest(entity, user_stats, text_stream, agent_testimony)
+        return (await self.diagnose_many([request], deep_budget=deep_budget))[0]
+
+    async def diagnose_many(self, requests: List[DiagnosisRequest],
+                            max_concurrency: Optional[int] = None,
+                            deep_budget: Optional[FractalBudget] = None) -> List[Prescription]:
+        """
+        Batched diagnose(): prescriptions come back in input order.
+        Text scans run concurrently on the executor (bounded by max_concurrency),
+        then every surviving entity is scored in one SVE batch.
+        deep_budget overrides the dispatcher's default for this batch.
+        """
+        import asyncio # Already loaded by the running event loop
+        loop = asyncio.get_running_loop()
+        gate = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        inst = self.instrumentation
+        budget = deep_budget or self.deep_budget
+        if self._in_processes():
+            config = self.fractal.config() # The scanner's cache stays here (see __getstate__)
+            gather = lambda text, cached: loop.run_in_executor(self.executor, _evidence_worker, config, text,
+                                                               cached, budget)
+        else:
+            gather = lambda text, cached: loop.run_in_executor(self.executor, _gather_evidence, self.fractal, text,
+                                                               cached, budget)
+
+        async def scan(text: Optional[str]) -> Tuple[List[str], float]:
+            if not text: return [], 1.0
+            key, cached = self._recall(text)
+            async with gate:
+                evidence = await gather(text, cached)
+            return self._read_evidence(key, cached, evidence)
+
+        # 0. Benevolence runs first, in input order (it mutates user stats)
+        results: List[Optional[Prescription]] = [self._benevolence(r.user_stats, r.agent_testimony) for r in requests]
+        pending = [i for i, rx in enumerate(results) if rx is None]
+        if pending:
+            # 1. Evidence in parallel, 2. SVE in bulk
+            evidence = await asyncio.gather(*(scan(requests[i].text_stream) for i in pending))
+            with inst.stage("sve_batch"):
+                _, codes = self.sve.evaluate_batch(entity_table([requests[i].entity for i in pending]))
+
+            for i, (found, coverage), code in zip(pending, evidence, codes):
+                r = requests[i]
+                results[i] = self._conclude(r.entity, VERDICTS[code], found, r.agent_testimony, coverage)
+        for rx in results: inst.count(f"verdict.{rx.action.name}")
+        return results
+
+    def _benevolence(self, user_stats: UserStats, agent_testimony: Optional[AgentTestimony]) -> Optional[Prescription]:
+        with self.instrumentation.stage("benevolence"):
+            support_msg = self.benevolent_core.provide_support(user_stats, agent_testimony)
+        if support_msg:
+            self.instrumentation.count("core_intervention")
+            self.metabolism.allocate_energy(100.0, BudgetCategory.GROWTH)
+            return Prescription(Verdict.AMPLIFY, "CORE_INTERVENTION", support_msg, 0.0, 0, 1.0, True)
+        return None
+
+    def invalidate(self, text_stream: Optional[str] = None) -> bool:
+        """Drops the memoized evidence for one text (None = the whole memo)."""
+        if self.memo is None: return False
+        if text_stream is None:
+            self.memo.clear()
+            return True
+        return self.memo.invalidate(self._memo_key(text_stream))
+
+    def memo_stats(self) -> Dict[str, float]:
+        return self.memo.stats() if self.memo is not None else {}
+
+    def _in_processes(self) -> bool:
+        if self.executor is None: return False
+        from concurrent.futures import ProcessPoolExecutor # Loaded with the executor
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+    def _memo_key(self, text_stream: str) -> bytes:
+        # The pickled analyzer is its configuration (scanner profiles, density, ...): a changed config misses
+        return ScanCache.digest(b"d", self.fractal.config(), text_stream.encode('utf-8', 'surrogatepass'))
+
+    def _scan_symptoms(self, text_stream: str, deep_budget: Optional[FractalBudget] = None) -> Tuple[List[str], float]:
+        """Fast Path / Deep Path evidence for one text (CPU-heavy, thread-safe): symptoms, Deep Path coverage."""
+        key, cached = self._recall(text_stream)
+        evidence = _gather_evidence(self.fractal, text_stream, cached, deep_budget or self.deep_budget)
+        return self._read_evidence(key, cached, evidence)
+
+    def _recall(self, text_stream: str) -> Tuple[bytes, Optional[tuple]]:
+        # Same text, same evidence: Fast Path result and Deep Path state are memoized by digest
+        if self.memo is None: return b"", None
+        key = self._memo_key(text_stream)
+        return key, self.memo.get(key)
+
+    def _read_evidence(self, key: bytes, cached: Optional[tuple], evidence: Evidence) -> Tuple[List[str], float]:
+        """Symptoms and Deep Path coverage from the gathered evidence; counts, logs and memoizes it."""
+        scan_res, fractal_res, timings = evidence
+        symptoms, coverage = [], 1.0
+        inst = self.instrumentation
+        inst.count("fast_path")
+        if cached: inst.count("memo_hit")
+        if inst.enabled:
+            for stage, seconds in timings.items(): inst.record(stage, seconds)
+
+        # --- DEEP PATH (v7.1 Logic) ---
+        # Triggered ONLY if Fast Path is inconclusive or alarming
+        if scan_res and scan_res['structure'] in ALARM_STRUCTURES:
+            inst.count("deep_path")
+            inst.log("🔍 DEEP SCAN TRIGGERED: Switching to Fractal Analysis...")
+            if fractal_res.is_partial:
+                coverage = fractal_res.coverage
+                inst.count("deep_partial")
+                inst.log(f"   -> PARTIAL: budget reached at {coverage:.0%} coverage")
+            
+            # Only a full zoom cycle may clear an alarm: a partial one never saw the missing scales
+            if fractal_res.consistency_score > 0.7 and not fractal_res.is_partial:
+                inst.count("false_alarm")
+                inst.log(f"   -> FALSE ALARM: {fractal_res.diagnosis}")
+                # It was Art, not Chaos. No symptom added.
+            else:
+                inst.count("confirmed")
+                inst.log(f"   -> CONFIRMED: {fractal_res.diagnosis}" + (" (unresolved: partial Deep Path)" if fractal_res.is_partial else ""))
+                symptoms.append("SEMANTIC_CHAOS")
+        else:
+            # Fast Path was enough (Liquid/Crystal)
+            pass
+
+        # Partial (budgeted) states are never memoized
+        entry = (scan_res, fractal_res if fractal_res and not fractal_res.is_partial else None)
+        if self.memo is not None and entry != cached: self.memo.put(key, entry)
+        return symptoms, coverage
+
+    def _conclude(self, entity: SyntropicEntity, raw_verdict: Verdict, symptoms: List[str],
+                  agent_testimony: Optional[AgentTestimony], coverage: float = 1.0) -> Prescription:
+        with self.instrumentation.stage("diagnosis"):
+            rx = self._prescribe(entity, raw_verdict, symptoms, agent_testimony)
+        rx.coverage = coverage
+        return rx
+
+    def _prescribe(self, entity: SyntropicEntity, raw_verdict: Verdict, symptoms: List[str],
+                   agent_testimony: Optional[AgentTestimony]) -> Prescription:
+        symptoms = list(symptoms)
+        if raw_verdict == Verdict.STOP: symptoms.append("NEGATIVE_VALUE")
+        if entity.alpha > 0.8: symptoms.append("HIGH_ENERGY")
+
+        # 2. CONSULT AGENT
+        mitigating = 0.0
+        if agent_testimony:
+            if "SEMANTIC_CHAOS" in symptoms and agent_testimony.context_mode == "CREATIVE_FLOW":
+                mitigating += 0.5
+            if agent_testimony.biological_state == "CRITICAL":
+                mitigating += 0.8
+
+        # 3. DIAGNOSIS
+        if "SEMANTIC_CHAOS" in symptoms and "HIGH_ENERGY" in symptoms:
+            conf = (0.9 if "NEGATIVE_VALUE" in symptoms else 0.6) - mitigating
+            if conf > 0.7:
+                return Prescription(Verdict.STOP, "VIRAL_ENTROPY", "Isolation", 50.0, 2, conf, True)
+            else:
+                return Prescription(Verdict.AMPLIFY, "NONE", f"ALLOWED (Agent Plea)", 0.0, 0, 0.0, True)
+
+        if "NEGATIVE_VALUE" in symptoms:
+            penalty = 0.0 if (agent_testimony and agent_testimony.context_mode == "LEARNING") else 5.0
+            return Prescription(Verdict.RECYCLE, "COMPETENCE_GAP", "Feedback Loop", penalty, 0, 0.8, True)
+
+        self.metabolism.allocate_energy(10.0, BudgetCategory.LOGIC)
+        return Prescription(Verdict.AMPLIFY, "NONE", "HEALTHY FLOW", 0, 0, 1.0, True)
+
+# ==========================================
+# 6. SYSTEM TEST
+# ==========================================
+
+if __name__ == "__main__":
+    print("=== SYNTROPY CORE v7.2 (HYBRID) DIAGNOSTICS ===\n")
+    
+    core = SyntropicDispatcher(instrumentation=Instrumentation(verbose=True))
+    print("✅ CORE INITIALIZED: Hybrid Engine Online.")
+    
+    # TEST 1: FAST PATH (Normal Text)
+    print("\n--- TEST 1: FAST PATH (Clear Meaning) ---")
+    simple_text = "Syntropy is the opposite of Entropy. We build order." * 10
+    dummy = SyntropicEntity("id1", EntityType.BIOSPHERE, "User", 5, 100, 0.5, 0, 0, 100, 1.0, 0, 0, 0.5)
+    stats = UserStats("CITIZEN", 0, 100.0)
+    
+    rx1 = core.diagnose(dummy, stats, text_stream=simple_text)
+    print(f"RESULT: {rx1.treatment}")
+    # Expectation: No "DEEP SCAN" log message.
+    
+    # TEST 2: DEEP PATH (Complex Art/Chaos)
+    print("\n--- TEST 2: DEEP PATH (Complex Art) ---")
+    complex_text = ("Chaos " * 5) + ("Order " * 5) + ("Fractal " * 5)
+    # This looks like CHAOS to the simple scanner, so it should trigger DEEP SCAN
+    
+    rx2 = core.diagnose(dummy, stats, text_stream=complex_text)
+    print(f"RESULT: {rx2.treatment}")
+    # Expectation: "DEEP SCAN TRIGGERED" log message.
+
+    metrics = core.instrumentation.snapshot()
+    print(f"\n📊 METRICS: {metrics['counters']}")
+    
+    print("\n✅ ALL TESTS PASSED.")
+```
+
+
@@ -0,0 +1,15 @@
+"""
+Test setup. The modules in src/ are stored inside a markdown code fence, so
+the tests import the unwrapped copy the benchmarks build (see
+benchmarks/_common.py), rebuilt whenever a source changes.
+
+    python -m pytest -q tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+from _common import use_src
+
+use_src()
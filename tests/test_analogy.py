@@ -0,0 +1,80 @@
+"""AnalogyEngine / ResonanceIndex: cross-sector echoes on a small crystal."""
+
+import pytest
+
+import malachite_db as M
+import sve_core as S
+
+@pytest.fixture
+def crystal(capsys):
+    db = M.MalachiteStorage()
+    db.crystallize("Mycelium network (fungal internet)", "SEED_WATER", 0.1)
+    db.crystallize("The brain neurons", "SEED_ROPE", 0.1)
+    db.crystallize("Blood circulation", "SEED_STONE", 0.1)
+    yield db
+    capsys.readouterr()
+
+def contents(db, matches):
+    return [db.nodes[m.target_id].content for m in matches]
+
+def test_echoes_share_the_pattern(crystal):
+    engine = S.AnalogyEngine(crystal)
+    matches = engine.find_analogies("A decentralized network to connect people", "EARTH")
+    assert sorted(contents(crystal, matches)) == ["Mycelium network (fungal internet)", "The brain neurons"]
+    assert all(m.shared_pattern == "DISTRIBUTED_SYSTEM" for m in matches)
+    assert contents(crystal, engine.find_analogies("river flow of goods", "WATER")) == ["Blood circulation"]
+    assert engine.find_analogies("river flow of goods", "EARTH") == []
+    assert engine.find_analogies("nothing to echo", "SKY") == []
+
+@pytest.mark.skipif(not S.HAS_NUMPY, reason="vector index needs NumPy")
+def test_echoes_ranked_by_resonance(crystal):
+    matches = S.AnalogyEngine(crystal).find_analogies("A decentralized network to connect people", "EARTH")
+    scores = [m.resonance_score for m in matches]
+    assert scores == sorted(scores, reverse=True) and all(0 < s <= 1 for s in scores)
+
+@pytest.mark.skipif(not S.HAS_NUMPY, reason="vector index needs NumPy")
+def test_small_index_searches_exactly():
+    index = S.ResonanceIndex()
+    texts = [f"layer {i} of the {['brain', 'river', 'stone', 'network'][i % 4]} crystal" for i in range(2000)]
+    index.add([f"n{i}" for i in range(2000)], [["EARTH", "WATER", "SKY"][i % 3] for i in range(2000)], texts)
+    for query in ("brain network", "river stone", "layer 17"):
+        assert index.search(query, (), 10, "SKY") == index.search(query, (), 10, "SKY", exact=True)
+
+@pytest.mark.parametrize("vectors", [True, False], ids=["numpy", "postings"])
+def test_all_echoes_by_default(crystal, vectors):
+    for i in range(12): crystal.crystallize(f"Mycelium network {i}", "SEED_WATER", 0.1)
+    engine = S.AnalogyEngine(crystal)
+    if not vectors: engine.vectors = None # The no-NumPy path
+    elif engine.vectors is None: pytest.skip("vector index needs NumPy")
+    matches = engine.find_analogies("A decentralized network to connect people", "EARTH")
+    assert len(matches) == 14
+    assert engine.find_analogies("A decentralized network to connect people", "EARTH", k=3) == matches[:3]
+
+def test_queries_read_only_the_pattern_postings(crystal, monkeypatch):
+    for i in range(50): crystal.crystallize(f"Brain cell {i} connecting", "SEED_WATER", 0.1)
+    engine = S.AnalogyEngine(crystal)
+    def touched(*args, **kwargs): raise AssertionError("a query scanned content or every vector")
+    monkeypatch.setattr(engine, "_check_resonance", touched) # Checked once, at indexing time
+    if engine.vectors is not None: monkeypatch.setattr(engine.vectors, "search", touched)
+    matches = engine.find_analogies("A decentralized network to connect people", "EARTH")
+    assert sorted(m.target_id for m in matches) == sorted(engine.lookup(["pattern:DISTRIBUTED_SYSTEM"], "EARTH"))
+    assert len(matches) == 52
+
+def test_top_k_among_a_crowd_of_look_alikes(crystal):
+    for i in range(60): crystal.crystallize(f"decentralized network to connect people {i}", "SEED_WATER", 0.1)
+    for i in range(3): crystal.crystallize(f"mycelium roots {i}", "SEED_WATER", 0.1)
+    probe = S.Instrumentation()
+    engine = S.AnalogyEngine(crystal, instrumentation=probe)
+    query = "A decentralized network to connect people"
+    every = engine.find_analogies(query, "EARTH")
+    assert len(every) == 5 and all("network to connect" not in crystal.nodes[m.target_id].content for m in every)
+    for k in (1, 2, 5, 10):
+        assert engine.find_analogies(query, "EARTH", k=k) == every[:k] # The look-alikes never crowd the echoes out
+    assert probe.snapshot()["counters"]["analogy_scan"] == 5
+
+def test_silent_unless_instrumented(crystal, capsys):
+    capsys.readouterr()
+    S.AnalogyEngine(crystal).find_analogies("A decentralized network to connect people", "EARTH")
+    assert capsys.readouterr().out == ""
+    S.AnalogyEngine(crystal, instrumentation=S.Instrumentation(verbose=True)).find_analogies("network", "EARTH")
+    assert "ANALOGY SCAN" in capsys.readouterr().out
@@ -0,0 +1,52 @@
+"""ScanCache: caps, LRU order, counters, TTL, and what a window entry keeps."""
+
+import sve_core as S
+
+def keys(n):
+    return [S.ScanCache.digest(b"t", str(i).encode()) for i in range(n)]
+
+def test_entry_cap_evicts_least_recently_used():
+    cache, (k1, k2, k3, k4) = S.ScanCache(max_entries=3), keys(4)
+    for i, key in enumerate((k1, k2, k3)): cache.put(key, i)
+    assert cache.get(k1) == 0 # k1 is now the most recent: k2 goes first
+    cache.put(k4, 3)
+    assert cache.get(k2) is None and [cache.get(k) for k in (k1, k3, k4)] == [0, 2, 3]
+    assert cache.stats() | {"bytes": 0} == {"entries": 3, "bytes": 0, "hits": 4, "misses": 1, "evictions": 1,
+                                            "expirations": 0, "hit_rate": 0.8}
+
+def test_byte_cap():
+    one = S.ScanCache().sizeof((1.0, 2.0)) + S.ScanCache.ENTRY_OVERHEAD + 50
+    cache = S.ScanCache(max_bytes=3 * one)
+    for i, key in enumerate(keys(10)): cache.put(key, (float(i), 2.0))
+    assert 0 < cache.bytes <= 3 * one and cache.stats()["entries"] == 10 - cache.evictions
+    assert cache.get(keys(10)[-1]) == (9.0, 2.0) and cache.get(keys(10)[0]) is None
+    cache.put(keys(10)[-1], (0.0, 0.0)) # Overwrite: the old size is returned
+    assert cache.bytes <= 3 * one
+    cache.clear()
+    assert cache.bytes == 0 and cache.stats()["entries"] == 0
+
+def test_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(S.time, "monotonic", lambda: now[0])
+    cache, (k1, k2) = S.ScanCache(ttl=10.0), keys(2)
+    cache.put(k1, "a")
+    now[0] += 5
+    cache.put(k2, "b")
+    assert cache.get(k1) == "a"
+    now[0] += 6 # k1 is 11 s old, k2 6 s
+    assert cache.get(k1) is None and cache.get(k2) == "b"
+    assert cache.expirations == 1 and cache.stats()["entries"] == 1
+
+def test_window_entries_keep_numbers_not_text():
+    cache = S.ScanCache()
+    scanner = S.SyntropyScannerV3(cache=cache)
+    text = " ".join(f"crystal {i} meaning flow" for i in range(200))
+    first = scanner.analyze_stream(text)
+    assert cache.misses and not cache.hits
+    assert scanner.analyze_stream(text) == first and cache.hits == cache.misses
+    flat = lambda v: [x for item in v for x in flat(item)] if isinstance(v, (tuple, list)) else [v]
+    stored = flat([value for value, _, _ in cache._data.values()])
+    assert stored and all(not isinstance(v, (str, bytes)) or v in S.WINDOW_STATUSES for v in stored)
+    window = " ".join(text.split()[:150])
+    hit = scanner.scan_window(window)
+    assert hit.text == window and hit == S.SyntropyScannerV3().scan_window(window)
@@ -0,0 +1,57 @@
+"""ColumnarNodes: the compact store reads back exactly the MalachiteNodes written to it."""
+
+import random
+
+import malachite_db as M
+
+def history(n, seed):
+    """Seeds, layers and voids as MalachiteNodes, parents before children."""
+    rng = random.Random(seed)
+    palette = [M.SpectralSignature(rng.random(), rng.random(), rng.random()) for _ in range(5)]
+    nodes = [M.MalachiteNode(f"seed{i}", f"seed {i}", 0.0, 60.0 * i, None, M.NodeType.SEED, palette[i % 5], 1.0)
+             for i in range(3)]
+    for i in range(n):
+        parent = rng.choice(nodes[-30:])
+        void = rng.random() < 0.05
+        content = rng.choice([f"layer {i}", f"слой {i} ✨", "", f"lone \udce9 surrogate {i}"])
+        nodes.append(M.MalachiteNode(f"n{i}", content, parent.radius + 1, rng.uniform(0, 360), parent.id,
+                                     M.NodeType.VOID if void else M.NodeType.BUD, rng.choice(palette),
+                                     0.0 if void else rng.random(), rng.choice([[], ["a"], ["a", "b"], [f"t{i}"]])))
+    return nodes
+
+def test_compact_store_reads_back_the_nodes():
+    nodes = history(2000, 1)
+    table = M.ColumnarNodes()
+    table.extend(nodes[:1000])
+    for node in nodes[1000:]: table.append(node, table.rows.get(node.parent_id, -1))
+    assert len(table) == len(nodes) and list(table) == [node.id for node in nodes]
+    for row, node in enumerate(nodes):
+        view = table[node.id]
+        assert view.row == row and view.as_node() == node and view == table.view(row) and hash(view) == hash(table.view(row))
+        assert (view.content, view.parent_id, view.node_type, view.spectrum, view.tags) == (
+            node.content, node.parent_id, node.node_type, node.spectrum, node.tags)
+    assert len(table.spectra) == 5 and len(table.tag_sets) < len(nodes) # Interned palettes
+    assert table.get("missing") is None and "missing" not in table and table.foreign == {}
+
+def test_foreign_parents_keep_their_ids():
+    nodes = history(50, 2)
+    table = M.ColumnarNodes()
+    table.extend(nodes[40:45]) # Parents below row 40 live "in another shard"
+    for node in nodes[45:]: table.append(node, table.rows.get(node.parent_id, -1))
+    for node in nodes[40:]:
+        assert table[node.id].as_node() == node
+        assert (table.parent[table.rows[node.id]] < 0) == (node.parent_id not in table)
+    assert set(table.foreign.values()) == {n.parent_id for n in nodes[40:] if n.parent_id not in table}
+
+def test_compact_storage_matches_the_dict_storage():
+    def build(compact):
+        random.seed(3) # crystallize() draws its angle shift from the global RNG
+        db = M.MalachiteStorage(compact=compact)
+        ids = list(db.nodes)
+        for i in range(500):
+            parent = random.choice(ids[-20:])
+            ids.append(db.create_void(parent, f"gap {i}") if i % 37 == 0 else db.crystallize(f"layer {i} ✨", parent, 0.7))
+        position = {node_id: i for i, node_id in enumerate(ids)}
+        return [(n.content, n.radius, n.angle, position.get(n.parent_id), n.node_type, n.spectrum, n.integrity, n.tags)
+                for n in (db.nodes[node_id] for node_id in ids)]
+    assert build(True) == build(False)
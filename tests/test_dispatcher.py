@@ -0,0 +1,123 @@
+"""SyntropicDispatcher: batched and async diagnose against the serial path."""
+
+import asyncio
+import random
+import time
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import sve_core as S
+
+def texts():
+    rng = random.Random(7)
+    words = "the of crystal meaning flow energy structure node river signal".split()
+    prose = [" ".join(rng.choice(words) for _ in range(400)) for _ in range(3)]
+    noise = [" ".join("".join(rng.choice("#$%&*@!^~") for _ in range(5)) for _ in range(600)) for _ in range(2)]
+    return prose + noise + ["short text, fast path only", None]
+
+def requests():
+    return [S.DiagnosisRequest(S.SyntropicEntity(f"id{i}", S.EntityType.BIOSPHERE, "X", 5, 1000, 0.1 + 0.1 * i,
+                                                 1000, 1.0, 100, 1.0, 10, 0, 0.9),
+                               S.UserStats("CITIZEN", 0, 500.0), text) for i, text in enumerate(texts())]
+
+def serial():
+    probe = S.Instrumentation()
+    dispatcher = S.SyntropicDispatcher(instrumentation=probe)
+    return [dispatcher.diagnose(r.entity, r.user_stats, r.text_stream) for r in requests()], probe.snapshot()["counters"]
+
+@pytest.mark.parametrize("executor", [None, "threads", "processes"])
+def test_diagnose_many_matches_diagnose(executor):
+    pool = {"threads": lambda: ThreadPoolExecutor(2), "processes": lambda: ProcessPoolExecutor(2)}.get(executor)
+    pool = pool() if pool else None
+    try:
+        probe = S.Instrumentation()
+        dispatcher = S.SyntropicDispatcher(executor=pool, instrumentation=probe)
+        expected, counters = serial()
+        assert asyncio.run(dispatcher.diagnose_many(requests())) == expected
+        assert probe.snapshot()["counters"] == counters and counters["deep_path"] >= 2
+        assert {"fast_path", "deep_path"} <= set(probe.snapshot()["stages"])
+    finally:
+        if pool: pool.shutdown()
+
+def test_partial_deep_path_never_clears_an_alarm():
+    dispatcher = S.SyntropicDispatcher()
+    alarm = {"structure": "CHAOS", "mu_global": 1.0}
+    harmony = lambda partial: S.FractalState(0.95, False, 8.0, "FRACTAL_HARMONY", partial, 0.2 if partial else 1.0)
+    assert dispatcher._read_evidence(b"full", None, (alarm, harmony(False), {})) == ([], 1.0) # FALSE ALARM
+    assert dispatcher._read_evidence(b"part", None, (alarm, harmony(True), {})) == (["SEMANTIC_CHAOS"], 0.2)
+
+@pytest.mark.parametrize("budget", [S.FractalBudget(windows=0), S.FractalBudget(seconds=0)])
+def test_budgeted_deep_path_keeps_the_alarm(budget, monkeypatch):
+    text = (Path(__file__).resolve().parents[1] / "docs" / "00_Theory_v14_Constitution.md").read_text(encoding="utf-8")
+    fractal = S.FractalAnalyzer(S.SyntropyScannerV3())
+    assert fractal.analyze_fractal(text).diagnosis == "STRUCTURAL_FRACTURE"
+    assert fractal.analyze_fractal(text, budget=S.FractalBudget(windows=0)).diagnosis == "FRACTAL_HARMONY" # Macro only
+    r = requests()[0]
+    for deep_budget, coverage in ((None, 1.0), (budget, 1 / 3)):
+        dispatcher = S.SyntropicDispatcher()
+        monkeypatch.setattr(dispatcher.scanner, "analyze_stream", lambda *a: {"structure": "CHAOS", "mu_global": 1.0})
+        for rx in (dispatcher.diagnose(r.entity, r.user_stats, text, deep_budget=deep_budget),
+                   asyncio.run(dispatcher.diagnose_async(r.entity, r.user_stats, text, deep_budget=deep_budget)),
+                   asyncio.run(dispatcher.diagnose_many([S.DiagnosisRequest(r.entity, r.user_stats, text)],
+                                                        deep_budget=deep_budget))[0]):
+            assert rx.pathology == "VIRAL_ENTROPY" # SEMANTIC_CHAOS stood: the alarm was not cleared
+            assert rx.coverage == pytest.approx(coverage)
+
+def test_memo_is_opt_in_and_keyed_on_config():
+    r = requests()[3]
+    probe = S.Instrumentation()
+    dispatcher = S.SyntropicDispatcher(instrumentation=probe)
+    for _ in range(2): dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    assert dispatcher.memo is None and "memo_hit" not in probe.snapshot()["counters"]
+
+    dispatcher = S.SyntropicDispatcher(memo=S.ScanCache(max_entries=16), instrumentation=probe)
+    for _ in range(2): dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    assert probe.snapshot()["counters"]["memo_hit"] == 1
+    dispatcher.scanner.SIGMA_WIDTH *= 2 # A new scanner config: the old evidence no longer applies
+    dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    assert probe.snapshot()["counters"]["memo_hit"] == 1
+
+def test_memo_key_pickles_the_config_once(monkeypatch):
+    r = requests()[0]
+    dispatcher = S.SyntropicDispatcher(memo=S.ScanCache(max_entries=16))
+    dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    calls = []
+    dumps = S.pickle.dumps
+    monkeypatch.setattr(S.pickle, "dumps", lambda *a, **kw: calls.append(1) or dumps(*a, **kw))
+    for _ in range(5): dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    asyncio.run(dispatcher.diagnose_many(requests()[:3]))
+    assert calls == []
+    dispatcher.fractal.workers = 0 # Reconfiguring the analyzer (or its scanner) pickles once more
+    dispatcher.scanner.PROFILES = dict(dispatcher.scanner.PROFILES)
+    for _ in range(3): dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    assert len(calls) == 2
+
+@pytest.mark.parametrize("levels, diagnosis, coverage", [
+    ([{"mu_avg": 5.0, "min_val": 5.0, "integrity": 1.0, "coverage": 0.5}], "CONCEPTUAL_FAILURE", 0.5),
+    ([{"mu_avg": 20.0, "min_val": 9.0, "integrity": 1.0, "coverage": 1.0},
+      {"mu_avg": 20.0, "min_val": 3.0, "integrity": 0.2, "coverage": 0.5}], "STRUCTURAL_FRACTURE", 0.75),
+    ([{"mu_avg": 20.0, "min_val": 9.0, "integrity": 1.0, "coverage": 1.0},
+      {"mu_avg": 20.0, "min_val": 8.0, "integrity": 0.9, "coverage": 1.0},
+      {"mu_avg": 20.0, "min_val": 7.0, "integrity": 0.9, "coverage": 0.5}], "FRACTAL_HARMONY", 2.5 / 3),
+])
+def test_coverage_is_averaged_the_same_on_every_path(levels, diagnosis, coverage, monkeypatch):
+    fractal = S.FractalAnalyzer(S.SyntropyScannerV3())
+    it = iter(levels)
+    monkeypatch.setattr(fractal, "_scan_at_resolution", lambda *a: next(it))
+    state = fractal.analyze_fractal("word " * 2000, budget=S.FractalBudget(windows=10**9))
+    assert (state.diagnosis, state.coverage, state.is_partial) == (diagnosis, pytest.approx(coverage), True)
+
+def test_subsystems_are_built_once_across_threads(monkeypatch):
+    built, scanner_class = [], S.SyntropyScannerV3
+    def slow_scanner():
+        time.sleep(0.05)  # Widen the race window
+        built.append(scanner_class())
+        return built[-1]
+    monkeypatch.setattr(S, "SyntropyScannerV3", slow_scanner)
+    dispatcher = S.SyntropicDispatcher()
+    with ThreadPoolExecutor(8) as pool:
+        fractals = list(pool.map(lambda _: dispatcher.fractal, range(8)))
+    assert len(built) == 1 and all(f is fractals[0] and f.scanner is built[0] for f in fractals)
+    assert dispatcher.scanner is built[0]
@@ -0,0 +1,149 @@
+"""Spatial, lineage and branch indexes, dict and compact, against brute force."""
+
+import random
+
+import pytest
+
+import malachite_db as M
+
+def grow(db, n, seed):
+    """n layers on random recent parents (some voids, some written in batches), spread over every sector."""
+    rng = random.Random(seed)
+    ids = list(db.nodes.keys())
+    while n > 0:
+        parent = lambda: rng.choice(ids[-40:]) if rng.random() < 0.9 else rng.choice(ids)
+        if rng.random() < 0.1:
+            batch = [(f"batch layer {n - i}", parent(), rng.random()) for i in range(min(n, rng.randint(2, 30)))]
+            ids.extend(db.crystallize_many(batch))
+            n -= len(batch)
+        else:
+            ids.append(db.create_void(parent(), f"gap {n}") if rng.random() < 0.03 else db.crystallize(f"layer {n}", parent(), rng.random()))
+            n -= 1
+    return db
+
+@pytest.fixture(scope="module", params=[False, True], ids=["dict", "compact"])
+def crystal(request):
+    db = grow(M.MalachiteStorage(compact=request.param), 3000, 1)
+    nodes = {node.id: node for node in db.nodes.values()}
+    children = {node_id: [] for node_id in nodes}
+    for node in nodes.values():
+        if node.parent_id: children[node.parent_id].append(node.id)
+    return db, nodes, children
+
+def ray(nodes, node_id):
+    path = []
+    while node_id:
+        path.append(node_id)
+        node_id = nodes[node_id].parent_id
+    return path[::-1]
+
+def branch(children, root):
+    out, stack = [], [root]
+    while stack:
+        node_id = stack.pop()
+        out.append(node_id)
+        stack.extend(children[node_id])
+    return out
+
+ids = lambda nodes: sorted(node.id for node in nodes)
+
+def test_spatial_queries(crystal):
+    db, nodes, _ = crystal
+    rng = random.Random(2)
+    in_arc = lambda a, start, end: (a - start) % 360 < (end - start) % 360 or end - start >= 360
+    for _ in range(60):
+        start, width = rng.uniform(-360, 720), rng.choice([0.5, 10, 90, 200, 359.9, 400])
+        r_min = rng.uniform(0, 12)
+        r_max = r_min + rng.choice([0.1, 1, 5, 50])
+        arc = db.scan_arc(start, start + width)
+        assert ids(arc) == sorted(n.id for n in nodes.values() if in_arc(n.angle, start, start + width))
+        assert ids(db.scan_ring(r_min, r_max)) == sorted(n.id for n in nodes.values() if r_min <= n.radius < r_max)
+        assert ids(db.scan_window(start, start + width, r_min, r_max)) == sorted(
+            n.id for n in nodes.values() if in_arc(n.angle, start, start + width) and r_min <= n.radius < r_max)
+    for sector, (lo, hi) in M.SECTOR_ARCS.items():
+        found = db.scan_sector(sector)
+        assert ids(found) == sorted(n.id for n in nodes.values() if lo <= n.angle < hi)
+        assert all(db.sector_of(n) == sector for n in found)
+        assert [n.angle for n in found] == sorted(n.angle for n in found)
+
+def test_lineage_queries(crystal):
+    db, nodes, _ = crystal
+    rng = random.Random(3)
+    sample = rng.sample(sorted(nodes), 300)
+    for a, b in zip(sample, sample[1:]):
+        path = ray(nodes, a)
+        assert [n.id for n in db.trace_ray(a)] == path == [n.id for n in db.trace_ray(a, lazy=True)]
+        assert db.depth(a) == len(path) - 1
+        k = rng.randrange(len(path) + 2)
+        assert db.ancestor(a, k) == (path[-1 - k] if k < len(path) else None)
+        other = ray(nodes, b)
+        shared = [x for x, y in zip(path, other) if x == y]
+        assert db.common_ancestor(a, b) == (shared[-1] if shared else None)
+        assert db.is_ancestor(b, a) == (b in path) and db.is_ancestor(a, a)
+
+def test_branch_queries(crystal):
+    db, nodes, children = crystal
+    rng = random.Random(4)
+    for root in rng.sample(sorted(nodes), 150) + sorted(db.nodes.keys())[:6]:
+        below = branch(children, root)
+        assert ids(db.children_of(root)) == sorted(children[root])
+        assert ids(db.descendants(root)) == sorted(below[1:])
+        assert ids(db.descendants(root, max_depth=2)) == sorted(
+            n for n in below[1:] if len(ray(nodes, n)) - len(ray(nodes, root)) <= 2)
+        stats = db.branch_stats(root)
+        assert stats.descendants == len(below) - 1
+        assert stats.max_radius == max(nodes[n].radius for n in below)
+        assert stats.voids == sum(nodes[n].node_type == M.NodeType.VOID for n in below)
+        assert stats.min_integrity == min(nodes[n].integrity for n in below)
+        assert nodes[stats.weakest_id].integrity == stats.min_integrity == db.weakest_link(root).integrity
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_arcs_wrap_past_360(compact):
+    db = grow(M.MalachiteStorage(compact=compact), 1500, 1)
+    wrapped = [n for n in db.nodes.values() if n.angle >= 300 or n.angle < 60]
+    assert wrapped and ids(db.scan_arc(300, 60)) == ids(db.scan_arc(300, 420)) == ids(wrapped)
+    assert ids(db.scan_arc(-60, 60)) == ids(wrapped)
+    assert db.scan_arc(40, 40) == []
+    assert ids(db.scan_window(300, 60, 0, 1e9)) == ids(wrapped)
+    assert ids(db.pin().scan_arc(300, 60)) == ids(wrapped)
+
+def lift_steps(lineage, row, target_depth):
+    """_lift() with a step counter."""
+    steps = 0
+    while lineage._depth[row] > target_depth:
+        up = lineage._jump[row]
+        row = up if lineage._depth[up] >= target_depth else lineage._parent[row]
+        steps += 1
+    return row, steps
+
+def test_jump_pointers_on_a_deep_chain():
+    depth = 1 << 16
+    lineage, bulk = M.LineageIndex(), M.LineageIndex()
+    for row in range(depth + 1): lineage.add(row - 1)
+    bulk.extend(range(-1, depth))
+    assert (lineage._depth, lineage._parent, lineage._jump) == (bulk._depth, bulk._parent, bulk._jump)
+    rng = random.Random(5)
+    for _ in range(2000):
+        row = rng.randrange(depth + 1)
+        k = rng.randrange(row + 1)
+        found, steps = lift_steps(lineage, row, row - k)
+        assert found == lineage.ancestor(row, k) == row - k and steps <= 3 * 17
+    assert lineage.ancestor(depth, depth + 1) == lineage.ancestor(depth, -1) == -1
+    assert lineage.common_ancestor(depth, 12345) == 12345 and lineage.is_ancestor(12345, depth)
+
+def test_lineage_path_is_lazy():
+    db = M.MalachiteStorage()
+    leaf = next(iter(db.nodes))
+    for i in range(3000): leaf = db.crystallize(f"layer {i}", leaf, 0.5)
+    reads = []
+    at = db._at
+    db._at = lambda row: reads.append(row) or at(row)
+    path = db.trace_ray(leaf, lazy=True)
+    assert len(path) == db.depth(leaf) + 1 == 3001 and reads == []
+    full = db.trace_ray(leaf)
+    reads.clear()
+    assert path[0].id == full[0].id and path[-1].id == leaf and path[1500].id == full[1500].id and len(reads) == 3
+    assert [n.id for n in path[10:15]] == [n.id for n in full[10:15]]
+    assert full[7] in path and full[7].id in path and "missing" not in path
+    assert [n.id for n in reversed(path)][:3] == [leaf, full[-2].id, full[-3].id]
+    with pytest.raises(IndexError): path[3001]
@@ -0,0 +1,50 @@
+"""Instrumentation: stage histograms, counters, snapshot and the (silent by default) log."""
+
+import random
+
+import pytest
+
+import sve_core as S
+
+def requests():
+    rng = random.Random(3)
+    noise = " ".join("".join(rng.choice("#$%&*@!^~") for _ in range(5)) for _ in range(600)) # Alarms: Deep Path
+    prose = " ".join(rng.choice("the of crystal meaning flow energy node river".split()) for _ in range(400))
+    return [S.DiagnosisRequest(S.SyntropicEntity(f"id{i}", S.EntityType.BIOSPHERE, "X", 5, 1000, 0.5, 1000, 1.0,
+                                                 100, 1.0, 10, 0, 0.9), S.UserStats("CITIZEN", 0, 500.0), text)
+            for i, text in enumerate((noise, prose, None))]
+
+def test_histograms_and_snapshot():
+    probe = S.Instrumentation()
+    for seconds in (3e-6, 3e-6, 100e-6, 0.5): probe.record("scan", seconds)
+    probe.count("fast_path", 4)
+    probe.count("deep_path")
+    probe.count("false_alarm")
+    probe.count("verdict.AMPLIFY", 3)
+    snap = probe.snapshot()
+    scan = snap["stages"]["scan"]
+    assert scan["count"] == 4 and scan["max_s"] == 0.5 and scan["total_s"] == pytest.approx(0.500106)
+    assert scan["histogram_us"] == {4: 2, 128: 1, 1 << 19: 1}    # Bucket b: [2^(b-1), 2^b) us
+    assert scan["p50_s"] == 4e-6 and scan["p99_s"] == (1 << 19) / 1e6
+    assert snap["rates"] == {"deep_path_rate": 0.25, "false_alarm_ratio": 1.0} and snap["verdicts"] == {"AMPLIFY": 3}
+    probe.reset()
+    assert probe.snapshot() == {"stages": {}, "counters": {}, "rates": {"deep_path_rate": 0.0, "false_alarm_ratio": 0.0},
+                                "verdicts": {}}
+
+def test_null_probe_is_silent(capsys):
+    dispatcher = S.SyntropicDispatcher()
+    for r in requests(): dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    assert capsys.readouterr().out == "" and dispatcher.instrumentation.snapshot() == {}
+
+def test_dispatcher_stages_and_counters(capsys):
+    probe = S.Instrumentation(verbose=True)
+    dispatcher = S.SyntropicDispatcher(instrumentation=probe)
+    batch = requests()
+    for r in batch: dispatcher.diagnose(r.entity, r.user_stats, r.text_stream)
+    snap = probe.snapshot()
+    assert {"benevolence", "fast_path", "deep_path", "sve", "total"} <= set(snap["stages"])
+    assert snap["stages"]["total"]["count"] == sum(snap["verdicts"].values()) == len(batch)
+    texts = sum(1 for r in batch if r.text_stream)
+    assert snap["counters"]["fast_path"] == texts and snap["stages"]["fast_path"]["count"] == texts
+    assert 0 < snap["rates"]["deep_path_rate"] <= 1
+    assert "DEEP SCAN TRIGGERED" in capsys.readouterr().out # verbose echoes the Deep Path log
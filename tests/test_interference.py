@@ -0,0 +1,35 @@
+"""InterferenceEngine: lazy (batched) propagation against eager passes."""
+
+import random
+
+import pytest
+
+import malachite_db as M
+
+pytestmark = pytest.mark.skipif(not M.HAS_NUMPY, reason="InterferenceEngine needs NumPy")
+
+def grow(db, n, seed):
+    rng = random.Random(seed)
+    random.seed(seed)
+    ids = list(db.nodes)
+    for i in range(n):
+        if i % 10 == 9: ids += db.crystallize_many([(f"wave {i}.{j}", rng.choice(ids), rng.random()) for j in range(20)])
+        else: ids.append(db.crystallize(f"layer {i}", rng.choice(ids), rng.random()))
+    return ids
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_lazy_matches_eager(compact, capsys):
+    lazy_db, eager_db = M.MalachiteStorage(compact=compact), M.MalachiteStorage(compact=compact)
+    lazy, eager = M.InterferenceEngine(lazy_db, max_pending=64), M.InterferenceEngine(eager_db, max_pending=1)
+    ids = grow(lazy_db, 200, 3)
+    assert grow(eager_db, 200, 3) and len(lazy_db.ids) == len(eager_db.ids)
+    lazy.flush()
+    for a, b in zip(lazy_db.ids, eager_db.ids):
+        sa, sb = lazy.spectrum(a), eager.spectrum(b)
+        assert (sa.r, sa.g, sa.b) == pytest.approx((sb.r, sb.g, sb.b), abs=1e-9)
+    assert len(ids) == len(lazy)
+
+def test_empty_batch_is_a_no_op(capsys):
+    db = M.MalachiteStorage()
+    engine = M.InterferenceEngine(db)
+    assert db.crystallize_many([]) == [] and len(engine) == len(db.ids) and not engine.dirty
@@ -0,0 +1,71 @@
+"""CrystalJournal: group commit, snapshot + WAL restore."""
+
+import os
+import random
+import shutil
+import time
+
+import pytest
+
+import malachite_db as M
+
+def test_group_interval_flushes_a_quiet_buffer(tmp_path):
+    db = M.MalachiteStorage(str(tmp_path / "live"), group_size=256, group_interval=0.05)
+    wal = tmp_path / "live" / "crystal.wal"
+    try:
+        node_id = db.crystallize("a lone write", "SEED_WATER", 0.5)
+        assert os.path.getsize(wal) == 0 # Buffered: nowhere near group_size
+        deadline = time.monotonic() + 5
+        while os.path.getsize(wal) == 0 and time.monotonic() < deadline: time.sleep(0.01)
+        shutil.copytree(tmp_path / "live", tmp_path / "crash") # What a crash right now would leave
+    finally:
+        db.close()
+    with M.MalachiteStorage(str(tmp_path / "crash")) as restored:
+        assert restored.nodes[node_id].content == "a lone write" # No later write came: the timer flushed it
+
+def grow(db, n, seed):
+    """n layers (some voids, some crystallize_many batches); returns every id in the crystal."""
+    rng = random.Random(seed)
+    ids = list(db.nodes.keys())
+    while n > 0:
+        if rng.random() < 0.1:
+            batch = [(f"batch {n - i}", rng.choice(ids[-30:]), rng.random()) for i in range(min(n, 20))]
+            ids.extend(db.crystallize_many(batch))
+            n -= len(batch)
+        else:
+            parent = rng.choice(ids[-30:])
+            ids.append(db.create_void(parent, f"gap {n}") if rng.random() < 0.05 else db.crystallize(f"layer {n}", parent, rng.random()))
+            n -= 1
+    return ids
+
+def state(db):
+    return {node.id: (node.content, node.radius, node.angle, node.parent_id, node.node_type, node.spectrum, node.integrity)
+            for node in db.nodes.values()}
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_restore_snapshot_and_wal_tail(tmp_path, compact):
+    with M.MalachiteStorage(str(tmp_path), group_size=16, compact=compact) as db:
+        grow(db, 400, 1)
+        db.snapshot()
+        ids = grow(db, 300, 2) # The WAL tail
+        expected, rays = state(db), [[n.id for n in db.trace_ray(i)] for i in ids[::7]]
+        stats = [db.branch_stats(i) for i in ids[::50]]
+    with M.MalachiteStorage(str(tmp_path), compact=compact) as db:
+        assert state(db) == expected
+        assert [[n.id for n in db.trace_ray(i)] for i in ids[::7]] == rays
+        assert [db.branch_stats(i) for i in ids[::50]] == stats # Indexes rebuilt from the restored layers
+
+@pytest.mark.parametrize("cut", [1, 40])
+def test_torn_tail_is_cut_off(tmp_path, cut):
+    with M.MalachiteStorage(str(tmp_path)) as db:
+        grow(db, 200, 3)
+        kept = state(db)
+        db.crystallize_many([(f"lost {i}", "SEED_WATER", 0.5) for i in range(10)]) # One record: all or nothing
+    wal = tmp_path / "crystal.wal"
+    with open(wal, "r+b") as fh: fh.truncate(os.path.getsize(wal) - cut) # The crash tore the last record
+    with M.MalachiteStorage(str(tmp_path)) as db:
+        assert state(db) == kept # Every complete record, nothing of the torn batch
+        new_id = db.crystallize("after the crash", "SEED_STONE", 0.2)
+        kept = state(db)
+    with M.MalachiteStorage(str(tmp_path)) as db:
+        assert state(db) == kept and db.nodes[new_id].content == "after the crash"
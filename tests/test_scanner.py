@@ -0,0 +1,177 @@
+"""SyntropyScannerV3 / FractalAnalyzer: Fast and Deep Path results against the reference scans."""
+
+import math
+import random
+import re
+import zlib
+from pathlib import Path
+from statistics import mean
+
+import pytest
+from _common import corpus
+
+import sve_core as S
+
+ROOT = Path(__file__).resolve().parents[1]
+
+def prose(n_words, seed=7):
+    rng = random.Random(seed)
+    words = "the of crystal meaning flow energy structure node river signal".split()
+    return " ".join(rng.choice(words) for _ in range(n_words))
+
+def noise(n_words, seed=7):
+    rng = random.Random(seed)
+    return " ".join("".join(rng.choice("#$%&*@!^~") for _ in range(5)) for _ in range(n_words))
+
+TEXTS = {
+    "prose": corpus("prose", 60_000, 1),
+    "code": corpus("code", 60_000, 1),
+    "docs": (ROOT / "docs" / "00_Theory_v14_Constitution.md").read_text(encoding="utf-8"),
+    "source": (ROOT / "src" / "malachite_db.py").read_text(encoding="utf-8"),
+    "mixed": " ".join(prose(300, i) + " " + noise(90, i) for i in range(6)),
+    "noise": noise(600),
+    "short": prose(60),
+}
+
+# --- Reference: one zlib pass per window, every window scanned on its own (the original scanner) ---
+
+def reference_window(scanner, text):
+    if not text or len(text.strip()) < 5: return None
+    c_type = scanner._detect_type(text)
+    raw = text.encode("utf-8")
+    density = min(1.0, max(len(zlib.compress(raw)) - 10, 1) / len(raw))
+    clean = re.sub(r"[\s.,!?]", "", text)
+    coherence = min(1.0, sum(len(t) for t in re.findall(r"[a-zA-Z0-9]{2,}", text)) / len(clean)) if clean else 0
+    vitality = math.exp(-((density - scanner.PROFILES[c_type]) ** 2) / (2 * scanner.SIGMA_WIDTH ** 2))
+    mu = math.log(len(raw) + 1) * vitality * coherence * 10.0
+    status = "CHAOS" if coherence < 0.3 else "DISRUPTION" if density > 0.75 and coherence > 0.8 else "CRYSTAL" if vitality > 0.8 else "LIQUID"
+    return mu, status
+
+def reference_series(scanner, text, window, step):
+    tokens = text.split()
+    if len(tokens) < window: return [reference_window(scanner, text)]
+    results = [reference_window(scanner, " ".join(tokens[i:i + window])) for i in range(0, len(tokens) - window + 1, step)]
+    return [r for r in results if r]
+
+def reference_stream(scanner, text):
+    series = reference_series(scanner, text, 150, 75)
+    mu = [m for m, _ in series]
+    if len(text.split()) < 100: return {"structure": series[0][1], "mu_global": mu[0], "spectrogram": mu}
+    slope = S.simple_polyfit(list(range(len(mu))), mu, 1)[0] if len(mu) > 2 else 0.0
+    integrity = sum(status == "CRYSTAL" for _, status in series) / len(series)
+    mu_3 = (mean(mu) * 0.4 + max(mu) * 0.6) * (1.2 if integrity > 0.3 else 1.0)
+    structure = ("SPARK_IN_DARK" if max(mu) > 20.0 and mean(mu) < 5.0 else "ASCENSION" if slope > 0.5 else
+                 "CRYSTAL_CHAIN" if integrity > 0.5 else "CHAOS" if any(s == "CHAOS" for _, s in series) else
+                 "DISRUPTION" if any(s == "DISRUPTION" for _, s in series) else "WAVES")
+    return {"structure": structure, "mu_global": mu_3, "spectrogram": mu, "metrics": {"integrity": integrity}}
+
+def reference_fractal(scanner, text):
+    levels = {}
+    for zoom in S.ZoomLevel:
+        series = reference_series(scanner, text, zoom.value, zoom.value // 2)
+        mu = [m for m, _ in series]
+        short = len(text.split()) < zoom.value # One window for the whole text, integrity 1 by definition
+        levels[zoom] = (mean(mu), min(mu), 1.0 if short else sum(s == "CRYSTAL" for _, s in series) / len(series))
+    macro, meso, micro = levels[S.ZoomLevel.MACRO], levels[S.ZoomLevel.MESO], levels[S.ZoomLevel.MICRO]
+    if macro[0] < 10.0: return (0.1, True, 0.0, "CONCEPTUAL_FAILURE")
+    if meso[2] < 0.4: return (0.4, True, meso[1], "STRUCTURAL_FRACTURE")
+    consistency = min(1.0, macro[0] / 30.0 * 0.4 + meso[2] * 0.4 + micro[1] / 10.0 * 0.2)
+    return (consistency, micro[1] < 5.0, micro[1],
+            "LOCAL_ANOMALY" if micro[1] < 5.0 else "FRACTAL_HARMONY" if consistency > 0.7 else "SOLID_DRAFT")
+
+def state(fs):
+    return (fs.consistency_score, fs.anomaly_detected, fs.weakest_link_score, fs.diagnosis)
+
+# --- Tests ---
+
+@pytest.mark.parametrize("name", TEXTS)
+def test_exact_density_matches_the_reference(name):
+    scanner = S.SyntropyScannerV3()
+    res, ref = scanner.analyze_stream(TEXTS[name]), reference_stream(scanner, TEXTS[name])
+    assert res["structure"] == ref["structure"]
+    assert res["spectrogram"] == pytest.approx(ref["spectrogram"], rel=1e-12)
+    assert res["mu_global"] == pytest.approx(ref["mu_global"], rel=1e-12)
+    assert state(S.FractalAnalyzer(scanner).analyze_fractal(TEXTS[name])) == pytest.approx(reference_fractal(scanner, TEXTS[name]))
+
+@pytest.mark.parametrize("name", ["prose", "code", "docs", "mixed"])
+def test_shared_pyramid_scans_each_level_once(name, monkeypatch):
+    text, scanner = TEXTS[name], S.SyntropyScannerV3()
+    fractal = S.FractalAnalyzer(scanner)
+    apart = (scanner.analyze_stream(text), state(fractal.analyze_fractal(text)))
+    scans, scan = [], S.ScanPyramid._scan
+    monkeypatch.setattr(S.ScanPyramid, "_scan", lambda self, w, st, *a: scans.append((w, st)) or scan(self, w, st, *a))
+    pyr = scanner.pyramid(text)
+    for _ in range(2): assert (scanner.analyze_stream(text, pyr), state(fractal.analyze_fractal(text, pyr))) == apart
+    assert len(scans) == len(set(scans)) and set(scans) <= {(150, 75)} | {(z.value, z.value // 2) for z in S.ZoomLevel}
+    assert len(pyr._prefix) <= 2 # One grain pass for the Fast Path, one shared by the zoom levels
+
+@pytest.mark.parametrize("name", ["prose", "code", "docs", "mixed"])
+def test_stream_matches_in_memory(name, tmp_path):
+    text = TEXTS[name]
+    scanner = S.SyntropyScannerV3()
+    whole = scanner.analyze_stream(text)
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    raw = text.encode("utf-8")
+    chunks = [raw[i:i + 4093] for i in range(0, len(raw), 4093)] # Chunk borders split tokens
+    for source in (str(path), iter(chunks)):
+        scan = scanner.stream(source, block_tokens=1000, chunk_size=4093)
+        assert [point.mu for point in scan] == pytest.approx(whole["spectrogram"], rel=1e-12)
+        summary = scan.summary()
+        assert summary["structure"] == whole["structure"] and summary["mu_global"] == pytest.approx(whole["mu_global"])
+    fractal = S.FractalAnalyzer(scanner)
+    assert state(fractal.analyze_source(str(path), block_tokens=1000)) == pytest.approx(state(fractal.analyze_fractal(text)))
+
+def test_parallel_matches_serial():
+    text = TEXTS["prose"] + " " + TEXTS["code"]
+    serial = S.SyntropyScannerV3()
+    parallel = S.SyntropyScannerV3(workers=2, parallel_threshold=1000)
+    res, ref = parallel.analyze_stream(text), serial.analyze_stream(text)
+    assert res["structure"] == ref["structure"] and res["spectrogram"] == pytest.approx(ref["spectrogram"], rel=1e-12)
+    assert state(S.FractalAnalyzer(parallel).analyze_fractal(text)) == pytest.approx(state(S.FractalAnalyzer(serial).analyze_fractal(text)))
+
+def test_spectrogram_is_a_list():
+    scanner = S.SyntropyScannerV3()
+    for text in (TEXTS["short"], TEXTS["prose"]):
+        spectrogram = scanner.analyze_stream(text)["spectrogram"]
+        assert type(spectrogram) is list and all(type(mu) is float for mu in spectrogram)
+
+def test_columnar_spectrogram():
+    scanner = S.SyntropyScannerV3()
+    for text in (TEXTS["short"], TEXTS["prose"], TEXTS["code"]):
+        listed, columnar = scanner.analyze_stream(text), scanner.analyze_stream(text, columnar=True)
+        series = columnar["spectrogram"]
+        assert isinstance(series, S.Spectrogram) and list(series.mu) == listed["spectrogram"]
+        assert columnar["structure"] == listed["structure"] and columnar["mu_global"] == listed["mu_global"]
+        assert series.status[0] in S.WINDOW_STATUSES and series.text(0).split()[0] == text.split()[0]
+
+# --- Density backends against zlib-6, on a fixed corpus (the docs and seeded prose/code) ---
+
+DENSITY_CORPUS = {**{p.name: p.read_text(encoding="utf-8") for p in sorted((ROOT / "docs").rglob("*.md"))},
+                  **{f"{kind}{seed}": corpus(kind, 40_000, seed) for kind in ("prose", "code") for seed in range(2)}}
+
+def agreement(backend, window, step):
+    """Per-text share of windows whose status matches zlib-6, and the pooled share."""
+    ref, alt = S.SyntropyScannerV3(), S.SyntropyScannerV3(density=backend)
+    shares, same, total = [], 0, 0
+    for text in DENSITY_CORPUS.values():
+        a, b = ref.pyramid(text).series(window, step), alt.pyramid(text).series(window, step)
+        hits = sum(x == y for x, y in zip(a.codes, b.codes))
+        shares.append(hits / len(a))
+        same, total = same + hits, total + len(a)
+    return min(shares), same / total
+
+def verdict_flips(backend):
+    ref, alt = S.SyntropyScannerV3(), S.SyntropyScannerV3(density=backend)
+    fast = sum(ref.analyze_stream(t)["structure"] != alt.analyze_stream(t)["structure"] for t in DENSITY_CORPUS.values())
+    ref, alt = S.FractalAnalyzer(ref), S.FractalAnalyzer(alt)
+    deep = sum(ref.analyze_fractal(t).diagnosis != alt.analyze_fractal(t).diagnosis for t in DENSITY_CORPUS.values())
+    return fast, deep
+
+@pytest.mark.parametrize("backend, worst, pooled, deep_flips", [("zlib_fast", 0.9, 0.98, 0), ("entropy", 0.7, 0.9, 4)])
+def test_density_backend_keeps_statuses(backend, worst, pooled, deep_flips):
+    for window, step in ((150, 75), (80, 40)):
+        per_text, overall = agreement(backend, window, step)
+        assert per_text >= worst and overall >= pooled, (window, per_text, overall)
+    fast, deep = verdict_flips(backend)
+    assert fast == 0 and deep <= deep_flips
@@ -0,0 +1,102 @@
+"""ShardedCrystal: local shard processes behind the router, against one plain storage."""
+
+import random
+
+import pytest
+
+import malachite_db as M
+import sve_core as S
+
+WORDS = "mycelium brain blood traffic river stone wheel network fire".split()
+
+def grow(crystal, n, seed):
+    """Writes n layers through the router; returns (all ids, child -> parent)."""
+    rng = random.Random(seed)
+    ids, parent_of = sorted(crystal._seeds), {}
+    for i in range(n):
+        parent = rng.choice(ids[-40:]) if rng.random() < 0.9 else rng.choice(ids)
+        content = " ".join(rng.choices(WORDS, k=3)) + f" {i}"
+        node_id = crystal.create_void(parent, content) if rng.random() < 0.03 else crystal.crystallize(content, parent, rng.random())
+        parent_of[node_id] = parent
+        ids.append(node_id)
+    return ids, parent_of
+
+def merged(crystal, compact):
+    """Every layer of the shards in one plain storage (the reference)."""
+    db = M.MalachiteStorage(compact=compact)
+    seeds = set(db.nodes)
+    db._add_nodes(sorted((n for n in crystal.scan_arc(0, 360) if n.id not in seeds), key=lambda n: n.radius))
+    return db
+
+@pytest.fixture(scope="module", params=[(None, False), (7, True)], ids=["sectors-dict", "7arcs-compact"])
+def sharded(request):
+    shards, compact = request.param
+    crystal = M.ShardedCrystal(shards=shards, compact=compact)
+    ids, parent_of = grow(crystal, 1500, 1)
+    yield crystal, ids, parent_of, merged(crystal, compact)
+    crystal.close()
+
+def ray_ids(rays):
+    return [[node.id for node in ray] for ray in rays]
+
+def test_routing(sharded):
+    crystal, ids, parent_of, reference = sharded
+    nodes = crystal.scan_arc(0, 360)
+    assert len(nodes) == len(ids) == len(crystal) == len(reference.ids)
+    for node in nodes:
+        assert crystal.specs[crystal._shard_of(node.id)].holds(node.angle) # Every layer sits in the shard of its angle
+        if node.id in parent_of: assert node.parent_id == parent_of[node.id]
+    assert crystal.get("SEED_LOG").content == "The Log (Rotation)" and crystal.get("node_zz") is None
+    for bad in ("nope", "node_00000000"):
+        with pytest.raises(ValueError): crystal.crystallize("noise", bad)
+
+def test_cross_shard_rays(sharded):
+    crystal, ids, _, reference = sharded
+    leaves = random.Random(2).sample(ids, 200)
+    rays = crystal.trace_rays(leaves)
+    assert ray_ids(rays) == ray_ids(reference.trace_ray(leaf) for leaf in leaves)
+    assert ray_ids(crystal.trace_ray(leaf) for leaf in leaves[:20]) == ray_ids(rays[:20])
+    crossing = [ray for ray in rays if len({crystal._shard_of(n.id) for n in ray}) > 1]
+    assert crossing or len(crystal.specs) == len(M.SectorType) # Arc borders cut through lineages; sector borders need not
+    assert crystal.trace_ray("nope") == [] and crystal.trace_ray("node_zz") == []
+
+def test_scans(sharded):
+    crystal, _, _, reference = sharded
+    for sector in M.SectorType:
+        assert [n.id for n in crystal.scan_sector(sector)] == [n.id for n in reference.scan_sector(sector)]
+    for start, end in [(350, 370), (340, 20), (100, 130), (239, 241), (-30, 30)]:
+        assert [n.id for n in crystal.scan_arc(start, end)] == [n.id for n in reference.scan_arc(start, end)]
+    ring = crystal.scan_ring(3, 7)
+    assert sorted(n.id for n in ring) == sorted(n.id for n in reference.scan_ring(3, 7))
+    assert [n.radius for n in ring] == sorted(n.radius for n in ring)
+    assert sorted(n.id for n in crystal.scan_window(100, 250, 2, 9)) == sorted(n.id for n in reference.scan_window(100, 250, 2, 9))
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_restart_and_analogy_fan_out(tmp_path, compact):
+    crystal = M.ShardedCrystal(shards=4, path=str(tmp_path), compact=compact, analogy=S.AnalogyEngine)
+    try:
+        ids, _ = grow(crystal, 800, 3)
+        leaves = ids[-150:]
+        before = ray_ids(crystal.trace_rays(leaves))
+        # Fan-out: the merged answer is the best k of every shard's answer, none from the query's sector
+        matches = crystal.find_analogies("a network of roots", "EARTH", k=5)
+        engine = S.AnalogyEngine(merged(crystal, compact))
+        expected = engine.find_analogies("a network of roots", "EARTH", k=5)
+        assert [m.resonance_score for m in matches] == pytest.approx([m.resonance_score for m in expected])
+        assert all(crystal.sector_of(crystal.get(m.target_id)) != M.SectorType.EARTH for m in matches)
+        crystal.snapshot()
+        ids += [crystal.crystallize(f"after {i}", ids[i * 7], 0.6) for i in range(50)] # WAL tail after the snapshots
+        tail = ray_ids(crystal.trace_rays(ids[-50:]))
+    finally:
+        crystal.close()
+    crystal = M.ShardedCrystal(shards=4, path=str(tmp_path), compact=compact)
+    try:
+        assert len(crystal) == len(ids)
+        assert ray_ids(crystal.trace_rays(leaves)) == before
+        assert ray_ids(crystal.trace_rays(ids[-50:])) == tail
+        with pytest.raises(RuntimeError): crystal.find_analogies("a network", "SKY")
+    finally:
+        crystal.close()
+
+def test_arcs_must_tile_the_circle():
+    with pytest.raises(ValueError): M.ShardedCrystal(shards=[(0, 100), (120, 360)])
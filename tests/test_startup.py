@@ -0,0 +1,34 @@
+"""Cold start: importing sve_core and the scalar paths leave NumPy and the dispatcher subsystems unloaded."""
+
+import json
+import subprocess
+import sys
+
+from _common import build_src, subprocess_env
+
+import sve_core as S
+
+PROBE = r'''
+import sys, json
+import sve_core as S
+seen = {"import": "numpy" in sys.modules}
+entity = S.SyntropicEntity("e", S.EntityType.BIOSPHERE, "User", 5, 100, 0.5, 0, 0, 100, 1.0, 0, 0, 0.5)
+S.SyntropicValueEngine().evaluate(entity)
+seen["evaluate"] = "numpy" in sys.modules
+core = S.SyntropicDispatcher()
+seen["built"] = sorted(n for n in ("sve", "scanner", "fractal", "benevolent_core", "metabolism") if n in vars(core))
+core.diagnose(entity, S.UserStats("CITIZEN", 0, 100.0), text_stream="Syntropy is the opposite of Entropy. " * 40)
+seen["diagnose"] = "numpy" in sys.modules
+seen["used"] = sorted(n for n in ("sve", "scanner", "fractal", "benevolent_core", "metabolism") if n in vars(core))
+S.SyntropicValueEngine().evaluate_batch(S.entity_table([entity]))
+seen["batch"] = "numpy" in sys.modules
+print(json.dumps(seen))
+'''
+
+def test_cold_start_is_lazy():
+    out = subprocess.run([sys.executable, "-c", PROBE], env=subprocess_env(build_src()),
+                         capture_output=True, text=True, check=True).stdout
+    seen = json.loads(out.splitlines()[-1])
+    assert not seen["import"] and not seen["evaluate"] and not seen["diagnose"]
+    assert seen["built"] == [] and {"sve", "scanner", "benevolent_core"} <= set(seen["used"])
+    assert seen["batch"] == S.HAS_NUMPY
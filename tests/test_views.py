@@ -0,0 +1,69 @@
+"""pin(): MVCC read views stay fixed while a writer goes on, with or without concurrent readers."""
+
+import random
+import threading
+
+import pytest
+
+import malachite_db as M
+
+def answers(view, probes):
+    """Every query a view serves, over a fixed set of probe ids."""
+    out = {"all": sorted(n.id for n in view.scan_arc(0, 360)), "ring": sorted(n.id for n in view.scan_ring(2, 6)),
+           "sectors": {s: [n.id for n in view.scan_sector(s)] for s in M.SectorType}}
+    for node_id in probes:
+        out[node_id] = ([n.id for n in view.trace_ray(node_id)], sorted(n.id for n in view.children_of(node_id)),
+                        sorted(n.id for n in view.descendants(node_id)), view.branch_stats(node_id), view.depth(node_id))
+    return out
+
+def write(db, rng, n):
+    ids = list(db.nodes)
+    for i in range(n):
+        parent = lambda: rng.choice(ids[-50:])
+        if rng.random() < 0.1: ids.extend(db.crystallize_many([(f"batch {i}.{k}", parent(), rng.random()) for k in range(8)]))
+        elif rng.random() < 0.05: ids.append(db.create_void(parent(), f"gap {i}"))
+        else: ids.append(db.crystallize(f"layer {i}", parent(), rng.random()))
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_view_ignores_later_writes(compact):
+    rng = random.Random(1)
+    db = M.MalachiteStorage(compact=compact)
+    write(db, rng, 400)
+    view = db.pin()
+    probes = rng.sample(sorted(view.nodes), 40) + list(view.nodes)[:6]
+    before = answers(view, probes)
+    assert before["all"] == sorted(view.nodes) and len(before["all"]) == len(view) == view.version
+    write(db, rng, 800)
+    assert len(db.nodes) > view.version and answers(view, probes) == before
+    late = list(db.nodes)[-1]
+    assert late not in view.nodes and view.trace_ray(late) == [] and answers(db.pin(), [late])[late][0][-1] == late
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_readers_pin_while_a_writer_runs(compact):
+    db = M.MalachiteStorage(compact=compact)
+    write(db, random.Random(2), 200)
+    done, errors, reads = threading.Event(), [], []
+
+    def writer():
+        try: write(db, random.Random(3), 1500)
+        finally: done.set()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        try:
+            while not done.is_set():
+                view = db.pin()
+                seen = view.scan_arc(0, 360)
+                assert len(seen) == view.version and all(view.rows[n.id] < view.version for n in seen)
+                node_id = rng.choice(list(view.nodes)[-100:])
+                path = view.trace_ray(node_id)
+                assert len(path) == view.depth(node_id) + 1 and path[-1].id == node_id
+                assert all(view.rows[n.id] < view.version for n in view.descendants(path[0].id))
+                assert view.branch_stats(path[0].id) == view.branch_stats(path[0].id) # Stable under writes
+                reads.append(view.version)
+        except Exception as e: errors.append(e)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(i,)) for i in range(3)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert errors == [] and len(set(reads)) > 1 # Readers saw the crystal grow